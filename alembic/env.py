@@ -18,7 +18,9 @@ from app.database import Base
 from app.domains.user.model import User  # noqa
 from app.domains.wardrobe.model import ClosetItem  # noqa
 from app.domains.recommendation.model import TodaysPick  # noqa
-from app.domains.weather.model import DailyWeather  # noqa
+from app.domains.weather.model import DailyWeather, DailyWeatherHourly, WeatherGridDemand  # noqa
+from app.batch.model import BatchRun  # noqa
+from app.domains.extraction.model import ExtractionCacheEntry  # noqa
 from app.domains.chat.models import ChatSession, ChatMessage  # noqa
 from app.domains.outfit.model import OutfitLog  # noqa
 
@@ -0,0 +1,30 @@
+"""add_closet_items_user_id_id_index
+
+Revision ID: 0c8e3f6a2d57
+Revises: f2c7d85a4e19
+Create Date: 2026-02-06 14:21:09.551842
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0c8e3f6a2d57'
+down_revision: Union[str, Sequence[str], None] = 'f2c7d85a4e19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_closet_items_user_id_id', 'closet_items', ['user_id', 'id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_closet_items_user_id_id', table_name='closet_items')
@@ -0,0 +1,43 @@
+"""create_extraction_cache
+
+Revision ID: 3f9a6d2b8c14
+Revises: 8b1e4f0c7a92
+Create Date: 2026-02-11 16:37:20.904215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a6d2b8c14'
+down_revision: Union[str, Sequence[str], None] = '8b1e4f0c7a92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'extraction_cache',
+        sa.Column('image_sha256', sa.String(length=64), nullable=False),
+        sa.Column('version', sa.String(length=32), nullable=False),
+        sa.Column('attributes', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('hit_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=True,
+        ),
+        sa.Column('last_hit_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('image_sha256', 'version'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('extraction_cache')
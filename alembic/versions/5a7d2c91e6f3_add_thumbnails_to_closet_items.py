@@ -0,0 +1,32 @@
+"""add_thumbnails_to_closet_items
+
+Revision ID: 5a7d2c91e6f3
+Revises: 0c8e3f6a2d57
+Create Date: 2026-02-09 09:48:27.160354
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a7d2c91e6f3'
+down_revision: Union[str, Sequence[str], None] = '0c8e3f6a2d57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'closet_items',
+        sa.Column('thumbnails', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('closet_items', 'thumbnails')
@@ -0,0 +1,55 @@
+"""add_daily_weather_hourly_table
+
+Revision ID: 7d2e4b9a1c30
+Revises: 155a20682a64
+Create Date: 2026-02-02 10:12:41.205118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2e4b9a1c30'
+down_revision: Union[str, Sequence[str], None] = '155a20682a64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 격자/하루당 1행, 카테고리별 24칸 배열 (인덱스 = 시각)
+    op.create_table(
+        'daily_weather_hourly',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('base_date', sa.String(length=8), nullable=False),
+        sa.Column('base_time', sa.String(length=4), nullable=False),
+        sa.Column('nx', sa.Integer(), nullable=False),
+        sa.Column('ny', sa.Integer(), nullable=False),
+        sa.Column('tmp', postgresql.ARRAY(sa.REAL()), nullable=True),
+        sa.Column('pop', postgresql.ARRAY(sa.SmallInteger()), nullable=True),
+        sa.Column('pty', postgresql.ARRAY(sa.SmallInteger()), nullable=True),
+        sa.Column('sky', postgresql.ARRAY(sa.SmallInteger()), nullable=True),
+        sa.Column('reh', postgresql.ARRAY(sa.SmallInteger()), nullable=True),
+        sa.Column('wsd', postgresql.ARRAY(sa.REAL()), nullable=True),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('base_date', 'nx', 'ny', name='uix_daily_weather_hourly'),
+    )
+    op.create_index(
+        op.f('ix_daily_weather_hourly_id'), 'daily_weather_hourly', ['id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_daily_weather_hourly_id'), table_name='daily_weather_hourly')
+    op.drop_table('daily_weather_hourly')
@@ -0,0 +1,37 @@
+"""add_image_sha256_to_closet_items
+
+Revision ID: 8b1e4f0c7a92
+Revises: 5a7d2c91e6f3
+Create Date: 2026-02-10 11:05:42.318604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b1e4f0c7a92'
+down_revision: Union[str, Sequence[str], None] = '5a7d2c91e6f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'closet_items', sa.Column('image_sha256', sa.String(length=64), nullable=True)
+    )
+    op.create_index(
+        'ix_closet_items_user_id_image_sha256',
+        'closet_items',
+        ['user_id', 'image_sha256'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_closet_items_user_id_image_sha256', table_name='closet_items')
+    op.drop_column('closet_items', 'image_sha256')
@@ -0,0 +1,51 @@
+"""add_batch_runs_table
+
+Revision ID: b3f81c6d9e25
+Revises: 7d2e4b9a1c30
+Create Date: 2026-02-03 15:40:12.731904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f81c6d9e25'
+down_revision: Union[str, Sequence[str], None] = '7d2e4b9a1c30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'batch_runs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('job_name', sa.String(length=50), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('host', sa.String(length=100), nullable=True),
+        sa.Column(
+            'started_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=True,
+        ),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('result', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_batch_runs_id'), 'batch_runs', ['id'], unique=False)
+    op.create_index(
+        op.f('ix_batch_runs_job_name'), 'batch_runs', ['job_name'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_batch_runs_job_name'), table_name='batch_runs')
+    op.drop_index(op.f('ix_batch_runs_id'), table_name='batch_runs')
+    op.drop_table('batch_runs')
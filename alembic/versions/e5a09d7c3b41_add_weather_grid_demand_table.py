@@ -0,0 +1,41 @@
+"""add_weather_grid_demand_table
+
+Revision ID: e5a09d7c3b41
+Revises: b3f81c6d9e25
+Create Date: 2026-02-04 11:05:37.418230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a09d7c3b41'
+down_revision: Union[str, Sequence[str], None] = 'b3f81c6d9e25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'weather_grid_demand',
+        sa.Column('nx', sa.Integer(), nullable=False),
+        sa.Column('ny', sa.Integer(), nullable=False),
+        sa.Column('region', sa.String(length=50), nullable=True),
+        sa.Column('score', sa.Float(), nullable=False),
+        sa.Column(
+            'last_requested_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('nx', 'ny'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('weather_grid_demand')
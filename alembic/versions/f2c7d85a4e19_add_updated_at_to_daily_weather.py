@@ -0,0 +1,36 @@
+"""add_updated_at_to_daily_weather
+
+Revision ID: f2c7d85a4e19
+Revises: e5a09d7c3b41
+Create Date: 2026-02-05 10:12:44.903517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c7d85a4e19'
+down_revision: Union[str, Sequence[str], None] = 'e5a09d7c3b41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'daily_weather',
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('daily_weather', 'updated_at')
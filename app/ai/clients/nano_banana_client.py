@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 import json
@@ -176,7 +177,7 @@ class NanoBananaClient:
             logger.error(f"Error during image generation: {e}")
             return None
 
-    def generate_mannequin_composite(
+    async def generate_mannequin_composite(
         self,
         top_image_url: Optional[str] = None,
         bottom_image_url: Optional[str] = None,
@@ -191,6 +192,8 @@ class NanoBananaClient:
         """
         Generate a composite mannequin image with top and bottom items.
         Returns the URL of the generated image in Azure Blob Storage.
+
+        Imagen 호출(동기 SDK)은 스레드에서, 업로드는 공유 비동기 blob 클라이언트로 실행합니다.
         """
         if not self.model:
             logger.error("Nano Banana Client is not initialized.")
@@ -223,46 +226,42 @@ class NanoBananaClient:
             logger.info(
                 f"Generating personalized composite image with prompt: {prompt}"
             )
-            image_bytes = self.generate_image(prompt, base_image_bytes=mannequin_bytes)
+            image_bytes = await asyncio.to_thread(
+                self.generate_image, prompt, base_image_bytes=mannequin_bytes
+            )
 
             if not image_bytes:
                 logger.error("Failed to generate image bytes from prompt.")
                 return None
 
-            # Upload to Azure Blob Storage using Config
-            from azure.storage.blob import BlobServiceClient
+            # Upload to Azure Blob Storage (shared async client)
             from datetime import datetime
             import uuid
 
-            account_name = Config.AZURE_STORAGE_ACCOUNT_NAME
-            account_key = Config.AZURE_STORAGE_ACCOUNT_KEY
-            container_name = Config.AZURE_STORAGE_CONTAINER_NAME
+            from app.utils.blob_storage import get_blob_storage_service
 
-            if not all([account_name, account_key, container_name]):
+            blob_storage = get_blob_storage_service()
+            if not (blob_storage.enabled and blob_storage.container_name):
                 logger.error("Azure Storage configuration is incomplete.")
                 return None
 
-            blob_service_client = BlobServiceClient(
-                account_url=f"https://{account_name}.blob.core.windows.net",
-                credential=account_key,
-            )
-            container_client = blob_service_client.get_container_client(container_name)
-
-            # Ensure container exists
-            if not container_client.exists():
-                container_client.create_container()
-
-            # Filename generation using user_id and timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_user_id = str(user_id) if user_id else f"anon-{uuid.uuid4().hex[:8]}"
-            filename = f"todays-picks/{safe_user_id}_{timestamp}.png"
-
-            blob_client = container_client.get_blob_client(filename)
-
-            logger.info(f"Uploading generated image to blob: {filename}")
-            blob_client.upload_blob(image_bytes, overwrite=True)
+            if blob_storage.content_addressed:
+                # 내용 해시 이름 (불변 URL, 같은 결과 이미지는 한 번만 업로드)
+                image_url = await blob_storage.upload_immutable(
+                    image_bytes, ".png", "image/png"
+                )
+            else:
+                # Filename generation using user_id and timestamp
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                safe_user_id = (
+                    str(user_id) if user_id else f"anon-{uuid.uuid4().hex[:8]}"
+                )
+                filename = f"todays-picks/{safe_user_id}_{timestamp}.png"
 
-            image_url = f"https://{account_name}.blob.core.windows.net/{container_name}/{filename}"
+                logger.info(f"Uploading generated image to blob: {filename}")
+                image_url = await blob_storage.upload_bytes(
+                    filename, image_bytes, "image/png"
+                )
             logger.info(f"✅ Generated composite image: {image_url}")
             return image_url
 
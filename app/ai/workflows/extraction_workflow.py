@@ -14,6 +14,9 @@ from app.utils.helpers import normalize
 
 logger = logging.getLogger(__name__)
 
+# 추출 전체 실패 시 기본값 객체의 meta.notes (결과 캐시에 저장하지 않음)
+EXTRACTION_FAILED_NOTE = "Extraction failed - default returned"
+
 
 async def extract_attributes(
     image_bytes: bytes, retry_on_schema_fail: bool = True
@@ -83,5 +86,5 @@ async def extract_attributes(
     # 최종 폴백: 기본값 반환
     logger.error("Returning default object due to total failure")
     out = copy.deepcopy(DEFAULT_OBJ)
-    out["meta"]["notes"] = "Extraction failed - default returned"
+    out["meta"]["notes"] = EXTRACTION_FAILED_NOTE
     return out
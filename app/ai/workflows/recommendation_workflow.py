@@ -57,7 +57,7 @@ def get_recommendation_workflow() -> StateGraph:
     return _recommendation_workflow
 
 
-def recommend_outfits(
+async def recommend_outfits(
     tops: List[Dict[str, Any]],
     bottoms: List[Dict[str, Any]],
     count: int = 1,
@@ -106,7 +106,7 @@ def recommend_outfits(
 
     # 워크플로우 실행
     workflow = get_recommendation_workflow()
-    final_state = workflow.invoke(initial_state)
+    final_state = await workflow.ainvoke(initial_state)
 
     # 최종 결과 반환
     return final_state.get("final_outfits", [])
@@ -3,6 +3,11 @@
 각 도메인의 배치 작업을 오케스트레이션
 """
 
-from .weather import run_daily_weather_batch
+from .weather import run_daily_weather_batch, run_intraday_weather_refresh
+from .wardrobe import run_features_backfill
 
-__all__ = ["run_daily_weather_batch"]
+__all__ = [
+    "run_daily_weather_batch",
+    "run_intraday_weather_refresh",
+    "run_features_backfill",
+]
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class BatchRun(Base):
+    """배치 실행 이력 (어느 인스턴스가 언제 실행했고 결과가 어땠는지)"""
+
+    __tablename__ = "batch_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_name = Column(String(50), nullable=False, index=True)  # 예: "daily_weather"
+    status = Column(
+        String(20), nullable=False
+    )  # running / success / partial_success / failed
+    host = Column(String(100), nullable=True)  # 실행 인스턴스 (WEBSITE_INSTANCE_ID 등)
+
+    started_at = Column(DateTime(timezone=True), server_default=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    result = Column(JSONB, nullable=True)  # 배치 반환값 (성공/실패 개수 등)
+    error = Column(Text, nullable=True)
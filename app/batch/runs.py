@@ -0,0 +1,92 @@
+"""배치 실행 이력 기록"""
+
+import logging
+import os
+import socket
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from .model import BatchRun
+
+logger = logging.getLogger(__name__)
+
+
+def _host_name() -> str:
+    # Azure Functions 인스턴스 식별자 (로컬은 호스트명)
+    return (os.getenv("WEBSITE_INSTANCE_ID") or socket.gethostname())[:100]
+
+
+def start_batch_run(db: Session, job_name: str) -> Optional[BatchRun]:
+    """running 상태의 실행 이력을 생성합니다. (기록 실패는 배치를 막지 않음)"""
+    try:
+        run = BatchRun(job_name=job_name, status="running", host=_host_name())
+        db.add(run)
+        db.commit()
+        return run
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to record batch start ({job_name}): {e}")
+        return None
+
+
+def finish_batch_run(
+    db: Session,
+    run: Optional[BatchRun],
+    status: str,
+    result: Optional[Dict[str, Any]] = None,
+    error: Optional[str] = None,
+) -> None:
+    """실행 이력에 종료 상태와 결과를 기록합니다."""
+    if run is None:
+        return
+    try:
+        run.status = status
+        run.result = result
+        run.error = error
+        run.finished_at = func.now()
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to record batch finish ({run.job_name}): {e}")
+
+
+def checkpoint_batch_run(
+    db: Session, run: Optional[BatchRun], result: Dict[str, Any]
+) -> None:
+    """진행 상황을 result에 기록하고 commit합니다.
+
+    같은 세션의 대기 중인 변경(배치 처리 결과)과 한 트랜잭션으로 커밋되므로,
+    체크포인트는 항상 실제로 반영된 지점까지만 전진합니다.
+    """
+    if run is not None:
+        run.result = dict(result)
+    db.commit()
+
+
+def last_batch_checkpoint(
+    db: Session, job_name: str, key: str = "last_id"
+) -> Optional[Dict[str, Any]]:
+    """result에 `key`가 기록된 가장 최근 실행의 result (이어서 실행할 체크포인트)"""
+    run = (
+        db.query(BatchRun)
+        .filter(BatchRun.job_name == job_name, BatchRun.result.has_key(key))
+        .order_by(BatchRun.id.desc())
+        .first()
+    )
+    return run.result if run else None
+
+
+def has_successful_run(db: Session, job_name: str, base_date: str) -> bool:
+    """result.base_date가 base_date인 성공(success) 실행 이력이 있는지"""
+    run = (
+        db.query(BatchRun.id)
+        .filter(
+            BatchRun.job_name == job_name,
+            BatchRun.status == "success",
+            BatchRun.result["base_date"].astext == base_date,
+        )
+        .first()
+    )
+    return run is not None
@@ -0,0 +1,153 @@
+"""옷장 배치 작업
+
+레거시 JSON 사이드카(`{이미지}.json`) 속성을 closet_items.features로 옮기는 일회성 백필.
+상세 조회는 features만 읽으므로, 사이드카만 가진 예전 아이템은 이 백필 이후에 전체 속성이 보입니다.
+
+    python -m app.batch.wardrobe [--batch-size 200] [--max-batches N]
+"""
+
+import argparse
+import logging
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import Config
+from app.database import SessionLocal, engine
+from app.domains.wardrobe.service import wardrobe_manager
+from app.utils.advisory_lock import advisory_lock
+from .runs import (
+    checkpoint_batch_run,
+    finish_batch_run,
+    last_batch_checkpoint,
+    start_batch_run,
+)
+
+FEATURES_BACKFILL_JOB = "wardrobe_features_backfill"
+
+# 결과에 남길 실패 아이템 ID 최대 개수
+MAX_FAILED_IDS = 100
+
+
+def run_features_backfill(
+    db: Session,
+    batch_size: int = Config.WARDROBE_BACKFILL_BATCH_SIZE,
+    max_batches: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    사이드카 JSON을 features에 병합 (사이드카 값 우선, 기존 상세 조회와 동일)
+
+    id 순으로 batch_size개씩 처리하고, 배치마다 변경 사항과 체크포인트(last_id)를
+    한 트랜잭션으로 커밋합니다. 중단되면 다음 실행이 마지막 체크포인트부터 이어갑니다.
+
+    Args:
+        db: 데이터베이스 세션
+        batch_size: 배치당 아이템 수
+        max_batches: 이번 실행에서 처리할 최대 배치 수 (None이면 끝까지)
+
+    Returns:
+        dict: 진행 결과 (last_id, scanned/updated/missing/failed 개수 등).
+            다른 인스턴스가 실행 중이면 status="skipped"
+    """
+    # 모델 매퍼 순환 의존을 피하기 위해 함수 안에서 import (wardrobe service와 동일)
+    from app.domains.wardrobe.model import ClosetItem
+
+    with advisory_lock(engine, f"batch:{FEATURES_BACKFILL_JOB}") as acquired:
+        if not acquired:
+            logging.info("Features backfill skipped: another instance holds the lock")
+            return {
+                "status": "skipped",
+                "message": "Another instance is running the features backfill",
+            }
+
+        checkpoint = last_batch_checkpoint(db, FEATURES_BACKFILL_JOB) or {}
+        progress: Dict[str, Any] = {
+            "last_id": checkpoint.get("last_id", 0),
+            "scanned": 0,
+            "updated": 0,
+            "missing": 0,  # 사이드카 없음 (save_item으로 저장된 아이템 등)
+            "failed": 0,
+            "failed_ids": [],
+            "done": False,
+        }
+
+        run = start_batch_run(db, FEATURES_BACKFILL_JOB)
+        committed = dict(progress)
+        try:
+            batches = 0
+            while max_batches is None or batches < max_batches:
+                items = (
+                    db.query(ClosetItem)
+                    .filter(ClosetItem.id > progress["last_id"])
+                    .order_by(ClosetItem.id)
+                    .limit(batch_size)
+                    .all()
+                )
+                if not items:
+                    progress["done"] = True
+                    break
+
+                for item in items:
+                    _backfill_item(item, progress)
+                progress["last_id"] = items[-1].id
+                progress["scanned"] += len(items)
+                checkpoint_batch_run(db, run, progress)
+                committed = dict(progress, failed_ids=list(progress["failed_ids"]))
+                batches += 1
+
+            status = "partial_success" if progress["failed"] else "success"
+            finish_batch_run(db, run, status, result=progress)
+            return dict(progress, status=status)
+
+        except Exception as e:
+            logging.error(f"Features backfill error: {str(e)}")
+            db.rollback()
+            # 마지막으로 커밋된 체크포인트를 남겨야 다음 실행이 그 지점부터 이어감
+            finish_batch_run(db, run, "failed", result=committed, error=str(e))
+            raise
+
+
+def _backfill_item(item, progress: Dict[str, Any]) -> None:
+    try:
+        sidecar = wardrobe_manager.load_sidecar_attributes(item.image_path)
+    except Exception as e:
+        logging.warning(f"Could not load sidecar JSON for item {item.id}: {e}")
+        progress["failed"] += 1
+        if len(progress["failed_ids"]) < MAX_FAILED_IDS:
+            progress["failed_ids"].append(item.id)
+        return
+
+    if sidecar is None:
+        progress["missing"] += 1
+        return
+
+    merged = {**(item.features or {}), **sidecar}
+    if merged != item.features:
+        item.features = merged
+        progress["updated"] += 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--batch-size", type=int, default=Config.WARDROBE_BACKFILL_BATCH_SIZE
+    )
+    parser.add_argument("--max-batches", type=int, default=None)
+    args = parser.parse_args()
+
+    # ClosetItem 관계(User, OutfitItem 등) 매핑에 필요한 모델만 등록 (alembic/env.py와 동일)
+    from app.domains.user.model import User  # noqa: F401
+    from app.domains.wardrobe.model import ClosetItem  # noqa: F401
+    from app.domains.outfit.model import OutfitItem, OutfitLog  # noqa: F401
+    from app.domains.chat.models import ChatSession, ChatMessage  # noqa: F401
+
+    db = SessionLocal()
+    try:
+        result = run_features_backfill(db, args.batch_size, args.max_batches)
+        print(result)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,23 +2,87 @@
 
 import logging
 from sqlalchemy.orm import Session
-from app.domains.weather.service import weather_service
+from app.database import engine
+from app.domains.weather.service import kst_today, weather_service
+from app.utils.advisory_lock import advisory_lock
+from .runs import finish_batch_run, has_successful_run, start_batch_run
 
+DAILY_WEATHER_JOB = "daily_weather"
+INTRADAY_WEATHER_JOB = "intraday_weather"
 
-async def run_daily_weather_batch(db: Session) -> dict:
+
+async def run_daily_weather_batch(db: Session, force: bool = False) -> dict:
     """
     전국 날씨 데이터 배치 수집
 
+    스케일 아웃된 모든 인스턴스에서 타이머가 실행되므로,
+    PostgreSQL advisory lock을 얻은 인스턴스 하나만 실제로 수집합니다.
+    락은 실행이 끝나면 풀리므로, 늦게 발화한 타이머/재시도가 다시 수집하지 않도록
+    오늘(KST) base_date로 이미 성공한 실행이 있으면 건너뜁니다. (partial_success는 재실행)
+
     Args:
         db: 데이터베이스 세션 (주입)
+        force: 오늘 성공 이력이 있어도 다시 수집 (수동 재실행용)
 
     Returns:
-        dict: 실행 결과 (성공/실패 개수 등)
+        dict: 실행 결과 (성공/실패 개수 등).
+            다른 인스턴스가 실행 중이거나 오늘 이미 성공했으면 status="skipped"
     """
-    try:
-        result = await weather_service.fetchAndLoadWeather(db)
-        return result
+    with advisory_lock(engine, f"batch:{DAILY_WEATHER_JOB}") as acquired:
+        if not acquired:
+            logging.info("Weather batch skipped: another instance holds the lock")
+            return {
+                "status": "skipped",
+                "message": "Another instance is running the weather batch",
+            }
+
+        base_date = kst_today()
+        if not force and has_successful_run(db, DAILY_WEATHER_JOB, base_date):
+            logging.info(f"Weather batch skipped: already succeeded for {base_date}")
+            return {
+                "status": "skipped",
+                "base_date": base_date,
+                "message": f"Weather batch already succeeded for {base_date}",
+            }
+
+        run = start_batch_run(db, DAILY_WEATHER_JOB)
+        try:
+            result = await weather_service.fetchAndLoadWeather(db)
+            finish_batch_run(db, run, result["status"], result=result)
+            return result
+
+        except Exception as e:
+            logging.error(f"Weather batch error: {str(e)}")
+            db.rollback()
+            finish_batch_run(db, run, "failed", error=str(e))
+            raise
+
+
+async def run_intraday_weather_refresh(db: Session) -> dict:
+    """
+    당일 후속 발표분(0500~2000)으로 오늘 수집된 격자 갱신
+
+    일 배치와 같은 방식으로 advisory lock을 얻은 인스턴스 하나만 실행합니다.
+
+    Returns:
+        dict: 실행 결과 (발표 시각, 변경/미변경 격자 수 등)
+    """
+    with advisory_lock(engine, f"batch:{INTRADAY_WEATHER_JOB}") as acquired:
+        if not acquired:
+            logging.info("Intraday weather refresh skipped: another instance holds the lock")
+            return {
+                "status": "skipped",
+                "message": "Another instance is running the intraday refresh",
+            }
+
+        run = start_batch_run(db, INTRADAY_WEATHER_JOB)
+        try:
+            result = await weather_service.refresh_intraday(db)
+            finish_batch_run(db, run, result["status"], result=result)
+            return result
 
-    except Exception as e:
-        logging.error(f"Weather batch error: {str(e)}")
-        raise
+        except Exception as e:
+            logging.error(f"Intraday weather refresh error: {str(e)}")
+            db.rollback()
+            finish_batch_run(db, run, "failed", error=str(e))
+            raise
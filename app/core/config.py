@@ -54,6 +54,24 @@ class Config:
     AZURE_STORAGE_ACCOUNT_NAME = os.getenv("AZURE_STORAGE_ACCOUNT_NAME", "")
     AZURE_STORAGE_ACCOUNT_KEY = os.getenv("AZURE_STORAGE_ACCOUNT_KEY", "")
     AZURE_STORAGE_CONTAINER_NAME = os.getenv("AZURE_STORAGE_CONTAINER_NAME", "images")
+    # SAS 유효 시간 (분). 단건 URL / 목록용 컨테이너 SAS / 만료 전 재발급 여유
+    AZURE_SAS_TTL_MIN = float(os.getenv("AZURE_SAS_TTL_MIN", "60"))
+    # 반환된 SAS는 항상 여유(REFRESH_MARGIN) 이상 남아 있으므로, 여유는 클라이언트가
+    # 목록 페이지/이미지 캐시를 들고 있는 시간보다 길게 둠
+    AZURE_SAS_FEED_TTL_MIN = float(os.getenv("AZURE_SAS_FEED_TTL_MIN", "60"))
+    AZURE_SAS_REFRESH_MARGIN_MIN = float(
+        os.getenv("AZURE_SAS_REFRESH_MARGIN_MIN", "15")
+    )
+    # 비동기 blob 업로드: 블록 병렬 업로드 수, 블록 크기, 단일 PUT 최대 크기 (MB)
+    AZURE_BLOB_UPLOAD_CONCURRENCY = int(os.getenv("AZURE_BLOB_UPLOAD_CONCURRENCY", "4"))
+    AZURE_BLOB_BLOCK_SIZE_MB = float(os.getenv("AZURE_BLOB_BLOCK_SIZE_MB", "4"))
+    AZURE_BLOB_SINGLE_PUT_MB = float(os.getenv("AZURE_BLOB_SINGLE_PUT_MB", "8"))
+    # blob 이름 규칙: dated(users/{사용자}/{날짜}/{uuid}) | content(objects/{sha256}, 불변)
+    AZURE_BLOB_LAYOUT = os.getenv("AZURE_BLOB_LAYOUT", "dated").lower()
+    # content 레이아웃 blob의 Cache-Control max-age (초)
+    AZURE_BLOB_IMMUTABLE_MAX_AGE_SEC = int(
+        os.getenv("AZURE_BLOB_IMMUTABLE_MAX_AGE_SEC", "31536000")
+    )
 
     # Azure Cosmos DB Configuration
     AZURE_COSMOS_ENDPOINT = os.getenv("AZURE_COSMOS_ENDPOINT", "")
@@ -65,6 +83,80 @@ class Config:
     # NOTE: 프로젝트 내 설정 파일(.env / local.settings.json)에서 키 이름이
     # `KMA_SERVICE_KEY`로 쓰이는 경우가 있어 하위 호환을 지원합니다.
     KMA_API_KEY = os.getenv("KMA_API_KEY") or os.getenv("KMA_SERVICE_KEY", "")
+    # 단기예보 조회 엔드포인트 (부하 테스트 시 로컬 가짜 서버로 교체: tests/load)
+    KMA_BASE_URL = os.getenv(
+        "KMA_BASE_URL",
+        "http://apis.data.go.kr/1360000/VilageFcstInfoService_2.0/getVilageFcst",
+    )
+
+    # KMA HTTP 연결 풀 (공유 aiohttp 세션)
+    KMA_HTTP_POOL_SIZE = int(os.getenv("KMA_HTTP_POOL_SIZE", "32"))
+    KMA_HTTP_POOL_SIZE_PER_HOST = int(os.getenv("KMA_HTTP_POOL_SIZE_PER_HOST", "16"))
+    KMA_HTTP_DNS_TTL = int(os.getenv("KMA_HTTP_DNS_TTL", "300"))  # 초
+    KMA_HTTP_KEEPALIVE = float(os.getenv("KMA_HTTP_KEEPALIVE", "30"))  # 초
+    KMA_HTTP_TIMEOUT = float(os.getenv("KMA_HTTP_TIMEOUT", "10"))  # 초
+
+    # KMA 호출 속도 제한 (토큰 버킷 + 동시 실행 상한)
+    KMA_RATE_LIMIT_PER_SEC = float(os.getenv("KMA_RATE_LIMIT_PER_SEC", "10"))
+    KMA_RATE_LIMIT_BURST = float(os.getenv("KMA_RATE_LIMIT_BURST", "10"))
+    KMA_MAX_CONCURRENCY = int(os.getenv("KMA_MAX_CONCURRENCY", "8"))
+
+    # 격자 수요 기반 사전 수집 (weather_grid_demand)
+    WEATHER_DEMAND_HALF_LIFE_HOURS = float(
+        os.getenv("WEATHER_DEMAND_HALF_LIFE_HOURS", "72")
+    )
+    WEATHER_DEMAND_FLUSH_SEC = float(os.getenv("WEATHER_DEMAND_FLUSH_SEC", "60"))
+    WEATHER_PREFETCH_MIN_SCORE = float(os.getenv("WEATHER_PREFETCH_MIN_SCORE", "0.5"))
+    # KMA_RATE_LIMIT_PER_SEC=10 기준 1000격자 ≈ 100초 (Functions 기본 타임아웃 5분 이내)
+    WEATHER_PREFETCH_MAX_CELLS = int(os.getenv("WEATHER_PREFETCH_MAX_CELLS", "1000"))
+
+    # 요청 좌표 -> 조회 격자 정규화 정책 (region | coarse | exact)
+    WEATHER_GRID_POLICY = os.getenv("WEATHER_GRID_POLICY", "region").lower()
+    WEATHER_GRID_COARSE_FACTOR = int(os.getenv("WEATHER_GRID_COARSE_FACTOR", "3"))
+
+    # Stale-while-revalidate: 오늘 예보가 없으면 최근 이전 예보를 즉시 제공하고 백그라운드 갱신
+    WEATHER_SERVE_STALE = os.getenv("WEATHER_SERVE_STALE", "true").lower() == "true"
+    WEATHER_STALE_MAX_AGE_DAYS = int(os.getenv("WEATHER_STALE_MAX_AGE_DAYS", "2"))
+    WEATHER_STALE_CACHE_TTL = float(os.getenv("WEATHER_STALE_CACHE_TTL", "300"))  # 초
+    # 0200 발표분 갱신 시각 (02:10 발표 + 02:16 배치 이후, 분 단위 오프셋)
+    WEATHER_REFRESH_OFFSET_MIN = int(os.getenv("WEATHER_REFRESH_OFFSET_MIN", "20"))
+
+    # 당일 후속 발표분(0500~2000) 재수집. 타이머는 각 발표 HH:15 KST에 실행
+    WEATHER_INTRADAY_REFRESH = (
+        os.getenv("WEATHER_INTRADAY_REFRESH", "true").lower() == "true"
+    )
+    # 재수집 완료 여유를 두고 메모리 캐시를 만료시키는 시각 (발표 HH:MM, 분)
+    WEATHER_INTRADAY_CACHE_EXPIRY_MIN = int(
+        os.getenv("WEATHER_INTRADAY_CACHE_EXPIRY_MIN", "20")
+    )
+
+    # Wardrobe
+    # 사용자별 아이템 수(total_count) 캐시 TTL. 같은 인스턴스의 쓰기는 즉시 무효화
+    WARDROBE_COUNT_CACHE_TTL = float(os.getenv("WARDROBE_COUNT_CACHE_TTL", "300"))  # 초
+    # 레거시 JSON 사이드카 -> closet_items.features 백필 배치 크기 (배치마다 체크포인트)
+    WARDROBE_BACKFILL_BATCH_SIZE = int(os.getenv("WARDROBE_BACKFILL_BATCH_SIZE", "200"))
+    # 업로드 시 생성하는 WebP 썸네일 가로 폭(px), 품질, 생성 프로세스 수
+    WARDROBE_THUMBNAIL_WIDTHS = [
+        int(w)
+        for w in os.getenv("WARDROBE_THUMBNAIL_WIDTHS", "160,480,960").split(",")
+        if w.strip()
+    ]
+    WARDROBE_THUMBNAIL_QUALITY = int(os.getenv("WARDROBE_THUMBNAIL_QUALITY", "80"))
+    WARDROBE_THUMBNAIL_WORKERS = int(os.getenv("WARDROBE_THUMBNAIL_WORKERS", "2"))
+    # 목록(피드) 응답의 기본 썸네일 폭 (이 폭 이상 중 가장 작은 썸네일 제공)
+    WARDROBE_FEED_THUMBNAIL_WIDTH = int(os.getenv("WARDROBE_FEED_THUMBNAIL_WIDTH", "480"))
+    # 일괄 업로드(/extract/bulk): 요청당 최대 파일 수/총 용량(MB), 동시 추출(LLM 호출) 수, SSE keep-alive 간격(초)
+    EXTRACT_BULK_MAX_FILES = int(os.getenv("EXTRACT_BULK_MAX_FILES", "100"))
+    EXTRACT_BULK_MAX_TOTAL_MB = int(os.getenv("EXTRACT_BULK_MAX_TOTAL_MB", "200"))
+    EXTRACT_BULK_CONCURRENCY = int(os.getenv("EXTRACT_BULK_CONCURRENCY", "4"))
+    EXTRACT_BULK_KEEPALIVE_SEC = float(os.getenv("EXTRACT_BULK_KEEPALIVE_SEC", "15"))
+    # 이미지 내용(SHA-256)별 추출 결과 공유 캐시 (extraction_cache 테이블 + 메모리 LRU)
+    EXTRACTION_CACHE_ENABLED = (
+        os.getenv("EXTRACTION_CACHE_ENABLED", "true").lower() == "true"
+    )
+    EXTRACTION_CACHE_MAX_ENTRIES = int(os.getenv("EXTRACTION_CACHE_MAX_ENTRIES", "2048"))
+    # 프롬프트/스키마 외 변경(normalize 로직 등)으로 기존 결과를 무효화할 때 값 변경
+    EXTRACTION_CACHE_VERSION = os.getenv("EXTRACTION_CACHE_VERSION", "1")
 
     # LangSmith Configuration
     LANGCHAIN_API_KEY = os.getenv("LANGCHAIN_API_KEY", "")
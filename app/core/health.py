@@ -1,9 +1,22 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from fastapi.responses import JSONResponse
 
+from app.domains.user.model import User
+from app.domains.user.router import get_current_user
+from app.utils.blob_storage import BlobStorageService, get_storage
+
 health_router = APIRouter()
 
 
 @health_router.get("/health")
 def health():
     return JSONResponse(content={"status": "server is running"})
+
+
+@health_router.get("/storage/metrics")
+def storage_metrics(
+    current_user: User = Depends(get_current_user),
+    storage: BlobStorageService = Depends(get_storage),
+):
+    """Blob Storage 작업별 호출 수/실패 수/소요 시간, SAS 캐시 지표 (로그인 필요)"""
+    return storage.stats()
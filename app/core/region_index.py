@@ -0,0 +1,149 @@
+"""
+시/군/구 단위 최근접 행정구역 검색 인덱스
+
+`data/admin_regions.csv`(약 250개 시/군/구 대표 좌표 + 기상청 격자)를 로드하여
+등장방형(equirectangular) 보정 좌표계 위에 2차원 KD-트리를 구성합니다.
+조회는 평균 O(log n)이며, 위도에 따른 경도 간격 축소(cos φ)를 보정하므로
+도 경계 부근에서도 실제 거리 기준으로 가장 가까운 지역을 반환합니다.
+"""
+
+import csv
+import math
+import os
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), "data", "admin_regions.csv")
+
+EARTH_RADIUS_KM = 6371.0088
+# 대한민국 중앙 위도 (등장방형 투영 기준)
+REFERENCE_LAT = 36.0
+
+
+@dataclass(frozen=True)
+class AdminRegion:
+    sido: str  # 시/도 (KOREA_REGIONS 키와 동일한 표기)
+    sigungu: str  # 시/군/구
+    lat: float
+    lon: float
+    nx: int
+    ny: int
+
+    @property
+    def name(self) -> str:
+        """표시/저장용 이름 (예: "Seoul Gangnam-gu")"""
+        if self.sido == "Sejong":
+            return self.sido
+        return f"{self.sido} {self.sigungu}"
+
+    def to_dict(self) -> dict:
+        return {
+            "lat": self.lat,
+            "lon": self.lon,
+            "nx": self.nx,
+            "ny": self.ny,
+            "sido": self.sido,
+            "sigungu": self.sigungu,
+        }
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """두 위경도 사이의 대권 거리 (km)"""
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp = p2 - p1
+    dl = math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+class _Node:
+    __slots__ = ("index", "axis", "left", "right")
+
+    def __init__(self, index: int, axis: int, left, right):
+        self.index = index
+        self.axis = axis
+        self.left = left
+        self.right = right
+
+
+class RegionIndex:
+    """2차원 KD-트리 기반 최근접 지역 검색"""
+
+    def __init__(self, regions: List[AdminRegion]):
+        if not regions:
+            raise ValueError("지역 데이터가 비어 있습니다.")
+        self.regions = regions
+        self._kx = math.cos(math.radians(REFERENCE_LAT))
+        self._points = [self._project(r.lat, r.lon) for r in regions]
+        self._root = self._build(list(range(len(regions))), depth=0)
+
+    @classmethod
+    def from_csv(cls, path: str = DATA_FILE) -> "RegionIndex":
+        with open(path, encoding="utf-8", newline="") as f:
+            regions = [
+                AdminRegion(
+                    sido=row["sido"],
+                    sigungu=row["sigungu"],
+                    lat=float(row["lat"]),
+                    lon=float(row["lon"]),
+                    nx=int(row["nx"]),
+                    ny=int(row["ny"]),
+                )
+                for row in csv.DictReader(f)
+            ]
+        return cls(regions)
+
+    def _project(self, lat: float, lon: float) -> Tuple[float, float]:
+        # 등장방형 근사: 경도 차이에 cos(기준위도)를 곱해 위도와 같은 척도로 맞춤
+        return lon * self._kx, lat
+
+    def _build(self, indices: List[int], depth: int) -> Optional[_Node]:
+        if not indices:
+            return None
+        axis = depth % 2
+        indices.sort(key=lambda i: self._points[i][axis])
+        mid = len(indices) // 2
+        return _Node(
+            indices[mid],
+            axis,
+            self._build(indices[:mid], depth + 1),
+            self._build(indices[mid + 1 :], depth + 1),
+        )
+
+    def nearest(self, lat: float, lon: float) -> Tuple[AdminRegion, float]:
+        """가장 가까운 지역과 거리(km, haversine)를 반환"""
+        target = self._project(lat, lon)
+        best_index = self._root.index
+        best_dist = math.inf
+
+        # (노드, 해당 서브트리까지의 최소 거리 제곱 하한)
+        stack = [(self._root, 0.0)]
+        while stack:
+            node, bound = stack.pop()
+            if node is None or bound >= best_dist:
+                continue
+            px, py = self._points[node.index]
+            dist = (px - target[0]) ** 2 + (py - target[1]) ** 2
+            if dist < best_dist:
+                best_dist = dist
+                best_index = node.index
+
+            diff = target[node.axis] - self._points[node.index][node.axis]
+            near, far = (node.left, node.right) if diff < 0 else (node.right, node.left)
+            # 분할 평면 반대편은 평면까지의 거리가 최단 거리보다 가까울 때만 탐색
+            stack.append((far, diff * diff))
+            stack.append((near, 0.0))
+
+        region = self.regions[best_index]
+        return region, haversine_km(lat, lon, region.lat, region.lon)
+
+
+_region_index: Optional[RegionIndex] = None
+
+
+def get_region_index() -> RegionIndex:
+    """지역 인덱스 싱글톤 (최초 호출 시 데이터 파일 로드)"""
+    global _region_index
+    if _region_index is None:
+        _region_index = RegionIndex.from_csv()
+    return _region_index
@@ -1,4 +1,3 @@
-import math
 from typing import Tuple, Dict
 
 # 대한민국 주요 도시 및 지역의 대표 좌표와 기상청 격자 정보 (NX, NY)
@@ -67,24 +66,18 @@ KOREA_REGIONS = {
 
 def get_nearest_region(lat: float, lon: float) -> Tuple[str, Dict]:
     """
-    주어진 위도/경도와 가장 가까운 '대표 지역'을 찾습니다.
-    간단한 유클리드 거리를 사용합니다 (대한민국 범위 내에서는 충분히 근사함).
-    """
-    nearest_region = None
-    min_distance = float("inf")
-
-    for name, data in KOREA_REGIONS.items():
-        # 유클리드 거리 제곱 (루트 생략 가능)
-        # 위도 차이 보정을 위해 lat에 대략적인 상수를 곱할 수도 있지만,
-        # 도시 간 간격이 넓으므로 단순 계산으로도 충분히 구분 가능합니다.
-        dist = (data["lat"] - lat) ** 2 + (data["lon"] - lon) ** 2
+    주어진 위도/경도와 가장 가까운 시/군/구를 찾습니다.
+    약 250개 행정구역에 대한 KD-트리(등장방형 보정 거리)로 O(log n) 검색합니다.
 
-        if dist < min_distance:
-            min_distance = dist
-            nearest_region = name
-
-    if nearest_region:
-        return nearest_region, KOREA_REGIONS[nearest_region]
+    Returns:
+        (지역명, {"lat", "lon", "nx", "ny", "sido", "sigungu"})
+        지역명 예: "Seoul Gangnam-gu"
+    """
+    from app.core.region_index import get_region_index
 
-    # Fallback (Default to Seoul)
-    return "Seoul", KOREA_REGIONS["Seoul"]
+    try:
+        region, _ = get_region_index().nearest(lat, lon)
+        return region.name, region.to_dict()
+    except Exception:
+        # Fallback (Default to Seoul)
+        return "Seoul", KOREA_REGIONS["Seoul"]
@@ -1,4 +1,5 @@
 from typing import Dict, Any, List
+import asyncio
 import logging
 from app.domains.chat.states import ChatState
 from app.ai.clients.nano_banana_client import NanoBananaClient
@@ -15,7 +16,7 @@ from typing import Optional
 logger = logging.getLogger(__name__)
 
 
-def generation_todays_pick_node(state: ChatState) -> ChatState:
+async def generation_todays_pick_node(state: ChatState) -> ChatState:
     """
     Todays Pick 이미지 생성 및 DB 저장 노드
     """
@@ -47,7 +48,7 @@ def generation_todays_pick_node(state: ChatState) -> ChatState:
 
         # Nano Banana (Imagen) 호출
         client = NanoBananaClient()
-        image_bytes = client.generate_image(prompt=prompt)
+        image_bytes = await asyncio.to_thread(client.generate_image, prompt=prompt)
 
         if not image_bytes:
             logger.error("Failed to generate image.")
@@ -55,7 +56,7 @@ def generation_todays_pick_node(state: ChatState) -> ChatState:
 
         # Blob Storage 업로드
         blob_service = get_blob_storage_service()
-        upload_result = blob_service.upload_image(
+        upload_result = await blob_service.upload_image(
             image_bytes=image_bytes,
             user_id=str(user_id),
             original_filename="todays_pick_gen.png",
@@ -116,7 +117,7 @@ def get_item_description_en(item: ClosetItem) -> str:
     return desc
 
 
-def generate_todays_pick_composite(
+async def generate_todays_pick_composite(
     top: ClosetItem, bottom: ClosetItem, user: User, db: Session
 ) -> Optional[str]:
     """
@@ -135,10 +136,10 @@ def generate_todays_pick_composite(
             raise RuntimeError("Nano Banana client not initialized")
 
         # Get mannequin bytes
-        man_bytes = mannequin_manager.get_mannequin_bytes(user.gender, user.body_shape)
+        man_bytes = await mannequin_manager.get_mannequin_bytes(user.gender, user.body_shape)
 
         # Generate and Upload (Client handles logic)
-        image_url = client.generate_mannequin_composite(
+        image_url = await client.generate_mannequin_composite(
             top_description=top_desc,
             bottom_description=bottom_desc,
             mannequin_bytes=man_bytes,
@@ -33,7 +33,7 @@ async def recommend_cody_node(state: ChatState) -> ChatState:
             weather_data = await weather_service.get_weather_info(db, lat, lon)
 
             # 2. Today's Pick 추천 엔진 호출 (문맥 포함)
-            result = recommend_todays_pick_v2(
+            result = await recommend_todays_pick_v2(
                 user_id=UUID(user_id) if isinstance(user_id, str) else user_id,
                 weather=weather_data,
                 db=db,
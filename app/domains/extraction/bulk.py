@@ -0,0 +1,208 @@
+"""
+옷 이미지 일괄 업로드 (POST /extract/bulk)
+여러 이미지의 속성 추출 + 저장을 동시 실행 수(EXTRACT_BULK_CONCURRENCY) 제한 하에 병렬로 처리하고,
+완료되는 순서대로 Server-Sent Events로 진행 상황을 전송합니다.
+
+이벤트:
+    start  {"total": n}
+    item   {"index", "filename", "success", ...결과 또는 "error"}  (완료 순서)
+    done   {"total", "succeeded", "failed"}
+"""
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from fastapi import HTTPException, UploadFile
+
+from app.core.config import Config
+from app.database import SessionLocal
+from app.domains.wardrobe.service import wardrobe_manager
+from app.utils.blob_storage import BlobStorageService
+from app.utils.image_digest import image_sha256_async
+from app.utils.thumbnails import thumbnail_pool
+from app.utils.validators import validate_uploaded_file
+from .service import extractor
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BulkFile:
+    """요청 본문에서 미리 읽어 둔 업로드 파일 (응답 스트리밍 중 UploadFile이 닫히므로)"""
+
+    index: int
+    filename: str
+    content_type: str
+    contents: bytes
+    size: Optional[int] = None  # 읽지 않고 건너뛴 파일의 원래 크기 (None이면 len(contents))
+
+    @property
+    def file_size(self) -> int:
+        return len(self.contents) if self.size is None else self.size
+
+
+async def read_bulk_files(
+    images: Sequence[UploadFile],
+    max_total_bytes: Optional[int] = None,
+    max_file_bytes: int = Config.MAX_FILE_SIZE,
+) -> List[BulkFile]:
+    """업로드 파일을 BulkFile로 읽어 둠 (요청 전체 메모리 사용량 상한 적용)
+
+    읽기 전에 UploadFile.size 합계가 max_total_bytes를 넘으면 413으로 거절하고,
+    파일 하나가 max_file_bytes를 넘으면 어차피 검증에서 실패하므로 본문을 읽지 않습니다.
+    """
+    if max_total_bytes is None:
+        max_total_bytes = Config.EXTRACT_BULK_MAX_TOTAL_MB * 1024 * 1024
+    total = sum(image.size or 0 for image in images)
+    if total > max_total_bytes:
+        raise _total_size_exceeded(max_total_bytes)
+
+    files = []
+    read_bytes = 0
+    for index, image in enumerate(images):
+        if image.size is not None and image.size > max_file_bytes:
+            contents, size = b"", image.size
+        else:
+            contents, size = await image.read(), None
+            # size를 알 수 없는 파일도 실제로 읽은 양으로 상한 적용
+            read_bytes += len(contents)
+            if read_bytes > max_total_bytes:
+                raise _total_size_exceeded(max_total_bytes)
+        files.append(
+            BulkFile(
+                index=index,
+                filename=image.filename or "",
+                content_type=image.content_type or "",
+                contents=contents,
+                size=size,
+            )
+        )
+    return files
+
+
+def _total_size_exceeded(max_total_bytes: int) -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"Total upload size exceeds {max_total_bytes // (1024 * 1024)}MB "
+        "per request.",
+    )
+
+
+def sse_event(event: str, data: Dict[str, Any]) -> str:
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+async def process_bulk_file(
+    file: BulkFile, user_id: UUID, storage: Optional[BlobStorageService] = None
+) -> Dict[str, Any]:
+    """파일 하나 검증 -> 추출 -> 저장 (실패는 예외 대신 success=False 결과로 반환)"""
+    result: Dict[str, Any] = {"index": file.index, "filename": file.filename}
+    try:
+        validate_uploaded_file(
+            filename=file.filename,
+            content_type=file.content_type,
+            file_size=file.file_size,
+        )
+        image_sha256 = await image_sha256_async(file.contents)
+
+        # 동시 실행되는 아이템끼리 세션을 공유하지 않도록 아이템마다 세션 생성
+        db = SessionLocal()
+        try:
+            # 이미 옷장에 있는 이미지는 추출/저장 없이 기존 아이템으로 응답
+            save_result = wardrobe_manager.find_duplicate(db, user_id, image_sha256)
+            if save_result:
+                attributes = save_result["attributes"]
+            else:
+                thumbs_task = asyncio.create_task(
+                    thumbnail_pool.render(file.contents)
+                )
+                try:
+                    attributes = await extractor.extract(
+                        file.contents, image_sha256=image_sha256
+                    )
+                except BaseException:
+                    thumbs_task.cancel()
+                    raise
+
+                save_result = await wardrobe_manager.save_item(
+                    db=db,
+                    image_bytes=file.contents,
+                    original_filename=file.filename,
+                    attributes=attributes,
+                    user_id=user_id,
+                    thumbnails=await thumbs_task,
+                    image_sha256=image_sha256,
+                    storage=storage,
+                )
+        finally:
+            db.close()
+    except HTTPException as e:
+        return dict(result, success=False, error=str(e.detail))
+    except Exception as e:
+        logger.error(f"Bulk extraction failed for {file.filename}: {e}", exc_info=True)
+        return dict(result, success=False, error=str(e))
+
+    return dict(
+        result,
+        success=True,
+        item_id=str(save_result["item_id"]),
+        image_url=save_result["image_url"],
+        blob_name=save_result.get("blob_name"),
+        duplicate=save_result.get("duplicate", False),
+        attributes=attributes,
+    )
+
+
+async def stream_bulk_extraction(
+    files: List[BulkFile],
+    user_id: UUID,
+    storage: Optional[BlobStorageService] = None,
+    concurrency: int = Config.EXTRACT_BULK_CONCURRENCY,
+    keepalive_sec: float = Config.EXTRACT_BULK_KEEPALIVE_SEC,
+) -> AsyncIterator[str]:
+    """
+    일괄 추출 SSE 스트림
+
+    결과가 없는 동안에는 keepalive_sec마다 주석 줄을 보내 프록시 유휴 타임아웃을 피합니다.
+    클라이언트 연결이 끊겨 스트림이 닫히면 남은 작업을 취소합니다.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(file: BulkFile) -> Dict[str, Any]:
+        async with semaphore:
+            return await process_bulk_file(file, user_id, storage)
+
+    tasks = [asyncio.create_task(run(file)) for file in files]
+    succeeded = 0
+    try:
+        yield sse_event("start", {"total": len(tasks)})
+
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, timeout=keepalive_sec, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                yield ": keep-alive\n\n"
+                continue
+            for task in done:
+                result = task.result()
+                succeeded += result["success"]
+                yield sse_event("item", result)
+
+        yield sse_event(
+            "done",
+            {
+                "total": len(tasks),
+                "succeeded": succeeded,
+                "failed": len(tasks) - succeeded,
+            },
+        )
+    finally:
+        for task in tasks:
+            task.cancel()
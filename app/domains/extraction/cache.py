@@ -0,0 +1,184 @@
+"""
+이미지 속성 추출 결과 캐시
+같은 이미지(SHA-256)의 추출 결과를 사용자 간에 공유하여 LLM 호출을 줄입니다.
+
+- 1차: 프로세스 로컬 LRU (EXTRACTION_CACHE_MAX_ENTRIES)
+- 2차: extraction_cache 테이블 (인스턴스 간 공유)
+
+키에는 프롬프트/스키마 버전이 포함되어, 프롬프트나 enum이 바뀌면 이전 결과는 조회되지 않습니다.
+추출 전체 실패로 반환된 기본값 객체는 저장하지 않습니다.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from app.ai.prompts.extraction_prompts import (
+    ALIASES,
+    DEFAULT_OBJ,
+    ENUMS,
+    REQUIRED_TOP_KEYS,
+    SYSTEM_PROMPT,
+    USER_PROMPT,
+    build_retry_prompt,
+)
+from app.ai.workflows.extraction_workflow import EXTRACTION_FAILED_NOTE
+from app.core.config import Config
+from app.database import SessionLocal
+from .model import ExtractionCacheEntry
+
+logger = logging.getLogger(__name__)
+
+
+def extraction_version(salt: str = Config.EXTRACTION_CACHE_VERSION) -> str:
+    """프롬프트/스키마/모델 배포 이름으로 만든 캐시 버전 (16자)"""
+    payload = json.dumps(
+        {
+            "system_prompt": SYSTEM_PROMPT,
+            "user_prompt": USER_PROMPT,
+            "retry_prompt": build_retry_prompt([]),
+            "enums": ENUMS,
+            "aliases": ALIASES,
+            "required_keys": sorted(REQUIRED_TOP_KEYS),
+            "default": DEFAULT_OBJ,
+            "deployment": Config.AZURE_OPENAI_DEPLOYMENT_NAME,
+            "salt": salt,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def is_failed_extraction(attributes: Dict[str, Any]) -> bool:
+    return (attributes.get("meta") or {}).get("notes") == EXTRACTION_FAILED_NOTE
+
+
+class ExtractionResultCache:
+    """(이미지 SHA-256, 버전) -> 정규화된 추출 결과"""
+
+    def __init__(
+        self,
+        max_entries: int = Config.EXTRACTION_CACHE_MAX_ENTRIES,
+        version: Optional[str] = None,
+        enabled: bool = Config.EXTRACTION_CACHE_ENABLED,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ):
+        self.max_entries = max_entries
+        self.version = version or extraction_version()
+        self.enabled = enabled
+        self._session_factory = session_factory
+        # 버전은 프로세스 내에서 고정이므로 메모리 키는 SHA-256만 사용
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.errors = 0
+
+    async def get(self, image_sha256: str) -> Optional[Dict[str, Any]]:
+        """캐시된 추출 결과 사본 (없으면 None, DB 오류는 미스로 처리)"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            attributes = self._entries.get(image_sha256)
+            if attributes is not None:
+                self._entries.move_to_end(image_sha256)
+                self.memory_hits += 1
+                return copy.deepcopy(attributes)
+
+        try:
+            attributes = await asyncio.to_thread(self._load, image_sha256)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Extraction cache lookup failed: {e}")
+            attributes = None
+
+        if attributes is None:
+            self.misses += 1
+            return None
+        self.db_hits += 1
+        self._remember(image_sha256, attributes)
+        return copy.deepcopy(attributes)
+
+    async def put(self, image_sha256: str, attributes: Dict[str, Any]) -> None:
+        """추출 결과 저장 (실패 기본값은 저장하지 않음, DB 오류는 로그만)"""
+        if not self.enabled or is_failed_extraction(attributes):
+            return
+        attributes = copy.deepcopy(attributes)
+        self._remember(image_sha256, attributes)
+        try:
+            await asyncio.to_thread(self._store, image_sha256, attributes)
+            self.stores += 1
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Extraction cache store failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        hits = self.memory_hits + self.db_hits
+        total = hits + self.misses
+        return {
+            "version": self.version,
+            "entries": len(self._entries),
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "errors": self.errors,
+            "hit_ratio": round(hits / total, 3) if total else 0.0,
+        }
+
+    def _remember(self, image_sha256: str, attributes: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[image_sha256] = attributes
+            self._entries.move_to_end(image_sha256)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _load(self, image_sha256: str) -> Optional[Dict[str, Any]]:
+        db = self._session_factory()
+        try:
+            entry = (
+                db.query(ExtractionCacheEntry)
+                .filter(
+                    ExtractionCacheEntry.image_sha256 == image_sha256,
+                    ExtractionCacheEntry.version == self.version,
+                )
+                .first()
+            )
+            if entry is None:
+                return None
+            attributes = entry.attributes
+            entry.hit_count = ExtractionCacheEntry.hit_count + 1
+            entry.last_hit_at = func.now()
+            db.commit()
+            return attributes
+        finally:
+            db.close()
+
+    def _store(self, image_sha256: str, attributes: Dict[str, Any]) -> None:
+        db = self._session_factory()
+        try:
+            db.execute(
+                pg_insert(ExtractionCacheEntry)
+                .values(
+                    image_sha256=image_sha256,
+                    version=self.version,
+                    attributes=attributes,
+                )
+                .on_conflict_do_nothing(index_elements=["image_sha256", "version"])
+            )
+            db.commit()
+        finally:
+            db.close()
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class ExtractionCacheEntry(Base):
+    """
+    이미지 내용별 속성 추출 결과 (사용자 간 공유)
+
+    쇼핑몰 상품 사진처럼 여러 사용자가 같은 이미지를 올리면 LLM 호출 없이 재사용합니다.
+    프롬프트/스키마가 바뀌면 version이 달라져 이전 결과는 조회되지 않습니다.
+    """
+
+    __tablename__ = "extraction_cache"
+
+    image_sha256 = Column(String(64), primary_key=True)
+    version = Column(String(32), primary_key=True)  # 프롬프트/스키마 버전
+
+    attributes = Column(JSONB, nullable=False)  # normalize()된 추출 결과
+
+    hit_count = Column(Integer, nullable=False, server_default="0")
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_hit_at = Column(DateTime(timezone=True), nullable=True)
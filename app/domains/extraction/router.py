@@ -1,15 +1,23 @@
+import asyncio
 import logging
+from typing import List
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.domains.user.router import get_current_user
 from app.domains.user.model import User
 from .service import extractor
+from .bulk import read_bulk_files, stream_bulk_extraction
 from app.domains.wardrobe.service import wardrobe_manager
 from .schema import ExtractionResponse, ExtractionUrlResponse
 from app.core.schemas import AttributesSchema
 from app.utils.validators import validate_uploaded_file
 from app.utils.response_helpers import handle_route_exception
+from app.utils.blob_storage import BlobStorageService, get_storage
+from app.utils.image_digest import image_sha256_async
+from app.utils.thumbnails import thumbnail_pool
+from app.core.config import Config
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +34,7 @@ async def extract(
     image: UploadFile = File(..., description="업로드할 옷 이미지 파일"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    storage: BlobStorageService = Depends(get_storage),
 ):
     """
     Extract and save clothing attributes (Single file)
@@ -53,9 +62,25 @@ async def extract(
         )
         logger.info("File validation passed")
 
+        # 같은 사용자의 동일 이미지 재업로드면 추출(LLM)/blob 쓰기 없이 기존 아이템 반환
+        image_sha256 = await image_sha256_async(contents)
+        duplicate = wardrobe_manager.find_duplicate(db, current_user.id, image_sha256)
+        if duplicate:
+            logger.info(
+                f"Duplicate upload detected. Existing item ID: {duplicate['item_id']}"
+            )
+            return _extraction_response(duplicate["attributes"], duplicate)
+
+        # 썸네일은 프로세스 풀에서 속성 추출(LLM 호출)과 동시에 생성
+        thumbs_task = asyncio.create_task(thumbnail_pool.render(contents))
+
         # Async extraction call
         logger.info("Starting attribute extraction...")
-        attributes = await extractor.extract(contents)
+        try:
+            attributes = await extractor.extract(contents, image_sha256=image_sha256)
+        except BaseException:
+            thumbs_task.cancel()
+            raise
         category_main = (
             attributes.get("category", {}).get("main", "N/A")
             if isinstance(attributes.get("category"), dict)
@@ -68,32 +93,22 @@ async def extract(
         logger.info(
             f"Saving item to database and blob storage for user_id={current_user.id}..."
         )
-        save_result = wardrobe_manager.save_item(
+        save_result = await wardrobe_manager.save_item(
             db=db,
             image_bytes=contents,
             original_filename=image.filename,
             attributes=attributes,
             user_id=current_user.id,
+            thumbnails=await thumbs_task,
+            image_sha256=image_sha256,
+            storage=storage,
         )
         logger.info(
             f"Item saved successfully. Item ID: {save_result.get('item_id')}, Image URL: {save_result.get('image_url')}"
         )
 
-        # Determine storage type
-        storage_type = "blob_storage" if save_result.get("blob_name") else "local"
-        logger.info(f"Storage type: {storage_type}")
-
         logger.info("=== Extract Request Completed Successfully ===")
-        # Return single object with attributes
-        return ExtractionResponse(
-            success=True,
-            attributes=attributes,
-            saved_to=f"db:{save_result['item_id']}",  # DB ID로 변경
-            image_url=save_result["image_url"],
-            item_id=str(save_result["item_id"]),
-            blob_name=save_result.get("blob_name"),
-            storage_type=storage_type,
-        )
+        return _extraction_response(attributes, save_result)
 
     except HTTPException as e:
         logger.error(f"HTTPException raised: {e.status_code} - {e.detail}")
@@ -104,3 +119,68 @@ async def extract(
             exc_info=True,
         )
         raise handle_route_exception(e)
+
+
+def _extraction_response(attributes: dict, save_result: dict) -> ExtractionResponse:
+    """save_item(또는 find_duplicate) 결과 -> 단건 응답"""
+    # Determine storage type
+    storage_type = "blob_storage" if save_result.get("blob_name") else "local"
+    logger.info(f"Storage type: {storage_type}")
+
+    # Return single object with attributes
+    return ExtractionResponse(
+        success=True,
+        attributes=attributes,
+        saved_to=f"db:{save_result['item_id']}",  # DB ID로 변경
+        image_url=save_result["image_url"],
+        item_id=str(save_result["item_id"]),
+        blob_name=save_result.get("blob_name"),
+        storage_type=storage_type,
+        duplicate=save_result.get("duplicate", False),
+    )
+
+
+@extraction_router.post(
+    "/extract/bulk",
+    summary="이미지 속성 추출 및 저장 (일괄 업로드, SSE)",
+    description="여러 옷 이미지를 한 번에 업로드합니다. 동시 추출 수를 제한하여 처리하고 "
+    "아이템별 결과를 Server-Sent Events(text/event-stream)로 완료 순서대로 전송합니다. (로그인 필요)",
+    response_class=StreamingResponse,
+)
+async def extract_bulk(
+    images: List[UploadFile] = File(..., description="업로드할 옷 이미지 파일들"),
+    current_user: User = Depends(get_current_user),
+    storage: BlobStorageService = Depends(get_storage),
+):
+    """
+    Extract and save clothing attributes (multiple files, streamed)
+
+    - **images**: 업로드할 이미지 파일 목록 (최대 EXTRACT_BULK_MAX_FILES개, 합계 EXTRACT_BULK_MAX_TOTAL_MB)
+    - **Authorization**: Bearer Token (필수)
+
+    개별 파일의 검증/추출 실패는 해당 `item` 이벤트의 `success: false`로 전달되며
+    나머지 파일 처리는 계속됩니다.
+    """
+    if len(images) > Config.EXTRACT_BULK_MAX_FILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many files. Maximum is {Config.EXTRACT_BULK_MAX_FILES} per request.",
+        )
+
+    # 스트리밍 시작 후에는 UploadFile이 닫히므로 먼저 읽어 둠 (총 용량 상한 적용)
+    files = await read_bulk_files(images)
+    logger.info(
+        f"Bulk extract started: user_id={current_user.id}, files={len(files)}"
+    )
+
+    return StreamingResponse(
+        stream_bulk_extraction(files, current_user.id, storage),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@extraction_router.get("/extract/metrics")
+async def get_extraction_metrics():
+    """추출 도메인 운영 지표 (결과 캐시 적중률 등)"""
+    return extractor.get_metrics()
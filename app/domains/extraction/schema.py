@@ -17,6 +17,10 @@ class ExtractionResponse(BaseModel):
         None,
         description="저장 타입: 'blob_storage' (Azure Blob Storage) 또는 'local' (로컬 파일 시스템)",
     )
+    duplicate: bool = Field(
+        False,
+        description="같은 이미지가 이미 옷장에 있어 추출/저장 없이 기존 아이템을 반환했는지 여부",
+    )
 
 
 class ExtractionUrlResponse(BaseModel):
@@ -1,6 +1,8 @@
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from app.ai.workflows.extraction_workflow import extract_attributes
+from app.utils.image_digest import image_sha256_async
+from .cache import ExtractionResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -10,10 +12,17 @@ class AttributeExtractor:
     이미지 속성 추출 서비스
 
     내부적으로 LangGraph 워크플로우를 사용하여 이미지에서 의류 속성을 추출합니다.
+    같은 이미지(SHA-256)의 이전 결과가 있으면 LLM 호출 없이 재사용합니다.
     """
 
+    def __init__(self, cache: Optional[ExtractionResultCache] = None):
+        self.cache = cache or ExtractionResultCache()
+
     async def extract(
-        self, image_bytes: bytes, retry_on_schema_fail: bool = True
+        self,
+        image_bytes: bytes,
+        retry_on_schema_fail: bool = True,
+        image_sha256: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         이미지에서 의류 속성 추출
@@ -21,6 +30,7 @@ class AttributeExtractor:
         Args:
             image_bytes: 이미지 바이트 데이터
             retry_on_schema_fail: 스키마 검증 실패 시 재시도 여부
+            image_sha256: 이미 계산한 이미지 SHA-256 (없으면 여기서 계산)
 
         Returns:
             추출된 속성 딕셔너리 (신뢰도 포함)
@@ -29,10 +39,22 @@ class AttributeExtractor:
         # 필요 시 여기서 직접 azure_openai_client를 호출하도록 변경 가능합니다.
         # 현재는 기존 워크플로우가 이미 신뢰도를 포함한 구조를 반환하므로 이를 활용합니다.
         # 다만, 가독성과 유지보수를 위해 향후 여기서 직접 호출로 단순화할 수 있습니다.
+        image_sha256 = image_sha256 or await image_sha256_async(image_bytes)
+        cached = await self.cache.get(image_sha256)
+        if cached is not None:
+            logger.info(f"Extraction cache hit: {image_sha256[:12]}")
+            return cached
+
         logger.info("Extracting attributes with confidence scores...")
-        return await extract_attributes(
+        attributes = await extract_attributes(
             image_bytes, retry_on_schema_fail=retry_on_schema_fail
         )
+        await self.cache.put(image_sha256, attributes)
+        return attributes
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """추출 결과 캐시 운영 지표"""
+        return {"result_cache": self.cache.stats()}
 
 
 # 싱글톤 인스턴스 (하위 호환성 유지)
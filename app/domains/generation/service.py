@@ -116,7 +116,7 @@ class GenerationService:
 
             # 3. Upload to Blob Storage
             # We use a distinct filename prefix or rely on the blob service's unique naming
-            result = self.blob_service.upload_image(
+            result = await self.blob_service.upload_image(
                 image_bytes=image_bytes,
                 user_id=str(user_id),
                 original_filename="generated_outfit.png",
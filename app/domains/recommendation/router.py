@@ -1,3 +1,4 @@
+import asyncio
 from typing import Optional
 from uuid import UUID
 from fastapi import APIRouter, Query, HTTPException, Depends
@@ -105,7 +106,8 @@ async def recommend_outfit(
     ),
 ):
     try:
-        all_items = wardrobe_manager.load_items()
+        # load_items는 동기 blob 클라이언트로 목록/다운로드하므로 이벤트 루프 밖에서 실행
+        all_items = await asyncio.to_thread(wardrobe_manager.load_items)
 
         tops = [
             item
@@ -446,7 +446,7 @@ class OutfitRecommender:
         logger.info(f"Creating new Today's Pick for user {user_id}")
 
         try:
-            result = recommend_todays_pick_v2(user_id, weather_info, db)
+            result = await recommend_todays_pick_v2(user_id, weather_info, db)
 
             # Ensure SAS URL for viewing
             from app.domains.wardrobe.service import wardrobe_manager
@@ -0,0 +1,65 @@
+"""
+옷장 아이템 수 프로세스 로컬 캐시
+목록 API의 total_count를 페이지마다 COUNT(*)로 다시 세지 않도록
+(user_id, category) 단위로 보관하고, 해당 사용자의 쓰기가 일어나면 즉시 무효화합니다.
+다른 인스턴스의 쓰기는 TTL(WARDROBE_COUNT_CACHE_TTL) 이내에 반영됩니다.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from app.core.config import Config
+
+CountKey = Tuple[UUID, Optional[str]]
+
+
+class ItemCountCache:
+    """(user_id, category) -> 아이템 수"""
+
+    def __init__(
+        self, ttl: float = Config.WARDROBE_COUNT_CACHE_TTL, max_entries: int = 10000
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[CountKey, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: UUID, category: Optional[str] = None) -> Optional[int]:
+        key = (user_id, category)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[1] > now:
+                self.hits += 1
+                return entry[0]
+            if entry:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, user_id: UUID, category: Optional[str], count: int) -> None:
+        key = (user_id, category)
+        with self._lock:
+            if len(self._entries) >= self.max_entries and key not in self._entries:
+                # 가장 먼저 들어온 항목 제거 (dict 삽입 순서)
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (count, time.monotonic() + self.ttl)
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        """사용자의 모든 카테고리 수 무효화 (아이템 추가/삭제 시)"""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == user_id]:
+                del self._entries[key]
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 3) if total else 0.0,
+        }
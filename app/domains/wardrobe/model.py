@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -23,6 +23,19 @@ class ClosetItem(Base):
     season = Column(ARRAY(String), nullable=True)  # ['SPRING', 'FALL']
     mood_tags = Column(ARRAY(String), nullable=True)  # ['CASUAL', 'STREET']
 
+    # 업로드 시 생성한 WebP 썸네일 {"160": url, "480": url, ...} (레거시 아이템은 NULL)
+    thumbnails = Column(JSONB, nullable=True)
+
+    # 원본 이미지 SHA-256 (같은 사용자의 동일 이미지 재업로드 감지, 레거시 아이템은 NULL)
+    image_sha256 = Column(String(64), nullable=True)
+
     # Relationships
     owner = relationship("User", back_populates="closet_items")
     outfit_associations = relationship("OutfitItem", back_populates="item")
+
+    __table_args__ = (
+        # 사용자별 목록 키셋 페이지네이션 (WHERE user_id = ? AND id < ? ORDER BY id DESC)
+        Index("ix_closet_items_user_id_id", "user_id", "id"),
+        # 중복 업로드 조회 (WHERE user_id = ? AND image_sha256 = ?)
+        Index("ix_closet_items_user_id_image_sha256", "user_id", "image_sha256"),
+    )
@@ -9,6 +9,7 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.core.security import ALGORITHM, SECRET_KEY
 from .service import wardrobe_manager
 from .schema import WardrobeResponse, WardrobeItemSchema
+from app.core.config import Config
 from app.domains.extraction.schema import ExtractionUrlResponse
 from .model import ClosetItem
 from app.database import get_db
@@ -74,8 +75,21 @@ def get_my_wardrobe_images(
     category: Optional[str] = Query(
         None, description="Category filter (e.g. top, bottom)"
     ),
-    skip: int = Query(0, ge=0, description="Number of items to skip (pagination)"),
+    skip: int = Query(
+        0, ge=0, description="Number of items to skip (deprecated: use cursor)"
+    ),
     limit: int = Query(20, ge=1, le=100, description="Max number of items to return"),
+    cursor: Optional[str] = Query(
+        None, description="Opaque cursor from the previous page's next_cursor"
+    ),
+    include_total: bool = Query(
+        False, description="Include total_count (cached per user)"
+    ),
+    thumb_width: int = Query(
+        Config.WARDROBE_FEED_THUMBNAIL_WIDTH,
+        ge=1,
+        description="Minimum width of thumbnail_url in pixels",
+    ),
     user_id: UUID = Depends(get_user_id_from_token),
     db: Session = Depends(get_db),
 ):
@@ -84,13 +98,21 @@ def get_my_wardrobe_images(
     """
     try:
         result = wardrobe_manager.get_user_wardrobe_items(
-            db=db, user_id=user_id, category=category, skip=skip, limit=limit
+            db=db,
+            user_id=user_id,
+            category=category,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+            thumb_width=thumb_width,
         )
         return create_success_response(
             {"items": result["items"]},
             count=result["count"],
             total_count=result["total_count"],
             has_more=result["has_more"],
+            next_cursor=result["next_cursor"],
         )
     except Exception as e:
         raise handle_route_exception(e)
@@ -100,7 +122,7 @@ def get_my_wardrobe_images(
     "/wardrobe/items/{item_id}",
     response_model=WardrobeItemSchema,
     summary="옷장 아이템 상세 조회",
-    description="옷장 아이템의 상세 정보를 조회합니다. Blob Storage의 JSON 메타데이터를 포함합니다.",
+    description="옷장 아이템의 상세 정보를 조회합니다. 전체 속성은 DB(features)에서 제공합니다.",
 )
 def get_wardrobe_item_detail(
     item_id: str,
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel
 from app.core.schemas import AttributesSchema
 
@@ -8,6 +8,9 @@ class WardrobeItemSchema(BaseModel):
     filename: str
     attributes: AttributesSchema
     image_url: Optional[str] = None
+    # 목록: 요청 폭에 맞는 썸네일, 상세: 가장 큰 썸네일 (썸네일이 없으면 image_url)
+    thumbnail_url: Optional[str] = None
+    thumbnails: Optional[Dict[str, str]] = None  # 상세 전용 {"폭": URL}
 
 
 class WardrobeResponse(BaseModel):
@@ -16,3 +19,4 @@ class WardrobeResponse(BaseModel):
     count: int
     total_count: Optional[int] = None
     has_more: Optional[bool] = None
+    next_cursor: Optional[str] = None  # 다음 페이지 요청 시 cursor로 전달
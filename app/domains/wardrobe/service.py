@@ -1,134 +1,88 @@
+import asyncio
 import os
 import json
 import uuid
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Dict, Any, Optional
 from uuid import UUID
-from azure.storage.blob import (
-    BlobServiceClient,
-    ContentSettings,
-    generate_blob_sas,
-    BlobSasPermissions,
-)
+from azure.core.exceptions import ResourceNotFoundError
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 
 from app.core.config import Config
+from app.utils.blob_storage import (
+    BlobStorageService,
+    content_blob_name,
+    content_type_for,
+    get_blob_storage_service,
+)
+from app.utils.image_digest import image_sha256 as compute_image_sha256
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.sas_signer import sas_signer, split_blob_url
+from app.utils.thumbnails import (
+    THUMBNAIL_CONTENT_TYPE,
+    THUMBNAIL_EXT,
+    pick_thumbnail,
+)
 from app.utils.validators import validate_file_extension
 
 # Import models inside methods to avoid circular imports where possible,
 # or use TYPE_CHECKING pattern. For simplicity in this file scope:
 
 logger = logging.getLogger(__name__)
+from .cache import ItemCountCache
 from .schema import WardrobeResponse, WardrobeItemSchema
 from app.core.schemas import AttributesSchema, CategoryModel
 
 
 class WardrobeManager:
-    def __init__(self):
-        self.account_name = Config.AZURE_STORAGE_ACCOUNT_NAME
-        self.account_key = Config.AZURE_STORAGE_ACCOUNT_KEY
-        self.container_name = Config.AZURE_STORAGE_CONTAINER_NAME
-        self.blob_service_client = None
-        self.container_client = None
-
-        if self.account_name and self.account_key:
-            try:
-                account_url = f"https://{self.account_name}.blob.core.windows.net"
-                self.blob_service_client = BlobServiceClient(
-                    account_url=account_url, credential=self.account_key
-                )
-                self.container_client = self.blob_service_client.get_container_client(
-                    self.container_name
-                )
-                # Create container if it doesn't exist
-                if not self.container_client.exists():
-                    self.container_client.create_container()
-            except Exception as e:
-                print(f"Failed to initialize Blob Storage: {e}")
+    def __init__(self, storage: Optional[BlobStorageService] = None):
+        # 모든 blob 접근은 공유 스토리지 서비스를 통해 수행 (생성 시 네트워크 호출 없음)
+        self.storage = storage or get_blob_storage_service()
+        self.container_name = self.storage.container_name
+        self.count_cache = ItemCountCache()
 
     def generate_sas_token(self, blob_name: str, container_name: str = None) -> str:
-        """Generate a read-only SAS token for a specific blob"""
-        try:
-            if not self.account_name or not self.account_key:
-                return ""
-
-            target_container = container_name or self.container_name
-
-            sas_token = generate_blob_sas(
-                account_name=self.account_name,
-                container_name=target_container,
-                blob_name=blob_name,
-                account_key=self.account_key,
-                permission=BlobSasPermissions(read=True),
-                start=datetime.utcnow() - timedelta(minutes=15),  # Clock skew buffer
-                expiry=datetime.utcnow() + timedelta(hours=1),
-            )
-            return sas_token
-        except Exception as e:
-            print(f"Error generating SAS token: {e}")
-            return ""
+        """Read-only SAS token for a specific blob (cached until near expiry)"""
+        return sas_signer.blob_token(container_name or self.container_name, blob_name)
 
     def get_sas_url(self, image_path: str) -> str:
-        """Helper to append SAS token to a blob URL, handling dynamic containers"""
-        if not ".blob.core.windows.net/" in image_path:
-            return image_path
+        """Append a per-blob SAS token to a blob URL, handling dynamic containers"""
+        return self.storage.sign_url(image_path)
 
-        try:
-            # Extract blob name from URL
-            parts = image_path.split(".blob.core.windows.net/")
-            if len(parts) > 1:
-                # e.g. "images/users/..." or "codify0blob0storage/users/..."
-                container_and_blob = parts[1]
-
-                # Split container and blob path dynamically
-                if "/" in container_and_blob:
-                    container_name, blob_name = container_and_blob.split("/", 1)
-
-                    sas_token = self.generate_sas_token(
-                        blob_name, container_name=container_name
-                    )
-                    if sas_token:
-                        return f"{image_path}?{sas_token}"
-        except Exception:
-            pass
-
-        return image_path
+    def get_feed_sas_url(self, image_path: str) -> str:
+        """Append the shared container SAS to a blob URL (bulk listings)"""
+        return self.storage.sign_feed_url(image_path)
 
     def load_items(self) -> List[Dict[str, Any]]:
         # ... (Legacy logic kept if needed, but we focusing on new methods)
         items = []
-        if not self.container_client:
+        if not self.storage.enabled:
             return items
         # ... (Keeping existing implementation or placeholder if it's unused now.
         # User only asked to move get_user_wardrobe_images_internal.
         # I will leave load_items as is for safety of other endpoints.)
         try:
-            blobs = self.container_client.list_blobs()
+            blob_names = self.storage.list_blob_names_sync()
             item_map = {}
-            for blob in blobs:
-                name_parts = os.path.splitext(blob.name)
+            for blob_name in blob_names:
+                name_parts = os.path.splitext(blob_name)
                 item_id = name_parts[0]
                 ext = name_parts[1].lower()
                 if item_id not in item_map:
                     item_map[item_id] = {"json": None, "image": None, "id": item_id}
                 if ext == ".json":
-                    item_map[item_id]["json"] = blob.name
+                    item_map[item_id]["json"] = blob_name
                 elif ext in [".jpg", ".jpeg", ".png", ".gif", ".webp"]:
-                    item_map[item_id]["image"] = blob.name
+                    item_map[item_id]["image"] = blob_name
 
             for item_id, data in item_map.items():
                 if data["json"] and data["image"]:
                     try:
-                        blob_client = self.container_client.get_blob_client(
-                            data["json"]
-                        )
-                        json_content = blob_client.download_blob().readall()
+                        json_content = self.storage.download_bytes_sync(data["json"])
                         attributes = json.loads(json_content)
-                        image_url = self.container_client.get_blob_client(
-                            data["image"]
-                        ).url
+                        image_url = self.storage.blob_url(data["image"])
 
                         items.append(
                             {
@@ -151,8 +105,17 @@ class WardrobeManager:
         category: Optional[str] = None,
         skip: int = 0,
         limit: int = 20,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        thumb_width: int = Config.WARDROBE_FEED_THUMBNAIL_WIDTH,
     ) -> Dict[str, Any]:
-        """Get paginated wardrobe items from DB (optimized for feed)"""
+        """Get paginated wardrobe items from DB (optimized for feed)
+
+        `cursor`가 있으면 키셋 페이지네이션(`id < 커서`)으로 이어서 조회하고,
+        없으면 기존 `skip`(OFFSET)을 사용합니다. has_more는 limit+1건 조회로 판단하므로
+        COUNT(*)는 `include_total`일 때만, 그것도 사용자별 캐시 미스에만 실행합니다.
+        `thumbnail_url`은 `thumb_width` 이상인 가장 작은 썸네일 (없으면 원본 URL)입니다.
+        """
         from .model import ClosetItem
 
         try:
@@ -163,19 +126,37 @@ class WardrobeManager:
             if category:
                 query = query.filter(ClosetItem.category == category.lower())
 
-            # 3. Total Count
-            total_count = query.count()
-
-            if total_count == 0:
-                return {"items": [], "count": 0, "total_count": 0, "has_more": False}
-
-            # 4. Apply Pagination
-            closet_items = (
-                query.order_by(ClosetItem.id.desc()).offset(skip).limit(limit).all()
-            )
-
-            # 5. Determine has_more
-            has_more = (skip + len(closet_items)) < total_count
+            # 3. Total Count (선택, 사용자별 캐시)
+            total_count = None
+            if include_total:
+                total_count = self.count_cache.get(user_id, category)
+                if total_count is None:
+                    total_count = query.count()
+                    self.count_cache.put(user_id, category, total_count)
+                if total_count == 0:
+                    return {
+                        "items": [],
+                        "count": 0,
+                        "total_count": 0,
+                        "has_more": False,
+                        "next_cursor": None,
+                    }
+
+            # 4. Apply Pagination ((user_id, id) 인덱스를 id 역순으로 탐색)
+            query = query.order_by(ClosetItem.id.desc())
+            if cursor:
+                last_id = decode_cursor(cursor).get("id")
+                if not isinstance(last_id, int):
+                    raise HTTPException(status_code=400, detail="Invalid cursor")
+                query = query.filter(ClosetItem.id < last_id)
+            elif skip:
+                query = query.offset(skip)
+            closet_items = query.limit(limit + 1).all()
+
+            # 5. Determine has_more (limit+1번째 행이 있으면 다음 페이지 존재)
+            has_more = len(closet_items) > limit
+            closet_items = closet_items[:limit]
+            next_cursor = encode_cursor(id=closet_items[-1].id) if has_more else None
 
             # 6. Convert to Schema (OPTIMIZED: No Blob Reading)
             items: List[WardrobeItemSchema] = []
@@ -190,14 +171,20 @@ class WardrobeManager:
                     },
                 )
 
-                # Generate SAS URL
-                final_image_url = self.get_sas_url(item.image_path)
+                # 페이지 전체가 컨테이너 SAS 하나를 공유 (아이템별 서명 없음)
+                final_image_url = self.get_feed_sas_url(item.image_path)
+                thumb_path = pick_thumbnail(item.thumbnails, thumb_width)
 
                 wardrobe_item = WardrobeItemSchema(
                     id=str(item.id),
                     filename=f"item_{item.id}",
                     attributes=attributes_schema,
                     image_url=final_image_url,
+                    thumbnail_url=(
+                        self.get_feed_sas_url(thumb_path)
+                        if thumb_path
+                        else final_image_url
+                    ),
                 )
                 items.append(wardrobe_item)
 
@@ -206,6 +193,7 @@ class WardrobeManager:
                 "count": len(items),
                 "total_count": total_count,
                 "has_more": has_more,
+                "next_cursor": next_cursor,
             }
         except Exception as e:
             print(f"Error in get_user_wardrobe_items: {e}")
@@ -214,7 +202,7 @@ class WardrobeManager:
     def get_item_detail(
         self, db: Session, item_id: str, user_id: UUID
     ) -> WardrobeItemSchema:
-        """Get detailed item info including Blob metadata"""
+        """Get detailed item info (attributes from closet_items.features)"""
         from .model import ClosetItem
 
         # 1. Fetch from DB
@@ -228,32 +216,10 @@ class WardrobeManager:
                 status_code=403, detail="Not authorized to view this item"
             )
 
-        # 3. Load full attributes
+        # 3. Load full attributes (save_item이 전체 속성을 features에 저장하므로 DB만 조회)
         image_path = item.image_path
-        blob_name = None
-
-        if ".blob.core.windows.net/" in image_path:
-            parts = image_path.split(".blob.core.windows.net/")
-            if len(parts) > 1:
-                container_and_blob = parts[1]
-                container_prefix = f"{self.container_name}/"
-                if container_and_blob.startswith(container_prefix):
-                    blob_name = container_and_blob[len(container_prefix) :]
-
-        attributes: Dict[str, Any] = {}
-        if blob_name and self.container_client:
-            try:
-                base_id = os.path.splitext(blob_name)[0]
-                json_blob_name = f"{base_id}.json"
-                json_client = self.container_client.get_blob_client(json_blob_name)
-                if json_client.exists():
-                    json_content = json_client.download_blob().readall()
-                    attributes = json.loads(json_content)
-            except Exception as e:
-                print(f"Warning: Could not load JSON for item {item.id}: {e}")
-                attributes = item.features or {}
-        else:
-            attributes = item.features or {}
+        blob_name = self._blob_name_of(image_path)
+        attributes: Dict[str, Any] = dict(item.features or {})
 
         # Merge DB fields
         if "category" not in attributes:
@@ -272,56 +238,129 @@ class WardrobeManager:
 
         # Generate SAS URL
         final_image_url = self.get_sas_url(image_path)
+        thumbnails = {
+            width: self.get_sas_url(url)
+            for width, url in (item.thumbnails or {}).items()
+        }
 
         return WardrobeItemSchema(
             id=str(item.id),
             filename=blob_name.split("/")[-1] if blob_name else f"item_{item.id}",
             attributes=attributes_schema,
             image_url=final_image_url,
+            thumbnail_url=(
+                pick_thumbnail(thumbnails, max(map(int, thumbnails)))
+                if thumbnails
+                else final_image_url
+            ),
+            thumbnails=thumbnails or None,
         )
 
-    def save_item(
+    def _blob_name_of(self, image_path: str) -> Optional[str]:
+        """기본 컨테이너에 있는 이미지 URL -> blob 이름 (다른 컨테이너/외부 URL이면 None)"""
+        parts = split_blob_url(image_path or "")
+        if parts is None or parts[0] != self.container_name:
+            return None
+        return parts[1]
+
+    def load_sidecar_attributes(self, image_path: str) -> Optional[Dict[str, Any]]:
+        """레거시 JSON 사이드카(`{이미지 경로}.json`) 속성 (없으면 None, features 백필 전용)"""
+        blob_name = self._blob_name_of(image_path)
+        if not blob_name or not self.storage.enabled:
+            return None
+
+        json_blob_name = f"{os.path.splitext(blob_name)[0]}.json"
+        try:
+            return json.loads(self.storage.download_bytes_sync(json_blob_name))
+        except ResourceNotFoundError:
+            return None
+
+    def find_duplicate(
+        self, db: Session, user_id: UUID, image_sha256: str
+    ) -> Optional[dict]:
+        """
+        같은 사용자가 동일 이미지(SHA-256)를 이미 저장했으면 기존 아이템 정보 (없으면 None)
+
+        반환 형식은 save_item 결과 + attributes/duplicate로, 추출(LLM)과 blob 쓰기 없이 응답에 사용합니다.
+        """
+        from .model import ClosetItem
+
+        item = (
+            db.query(ClosetItem)
+            .filter(
+                ClosetItem.user_id == user_id, ClosetItem.image_sha256 == image_sha256
+            )
+            .order_by(ClosetItem.id)
+            .first()
+        )
+        if item is None:
+            return None
+        return {
+            "success": "success",
+            "image_url": item.image_path,
+            "item_id": item.id,
+            "blob_name": self._blob_name_of(item.image_path),
+            "attributes": dict(item.features or {}),
+            "duplicate": True,
+        }
+
+    async def save_item(
         self,
         db: Session,
         image_bytes: bytes,
         original_filename: str,
         attributes: dict,
         user_id: UUID,
+        thumbnails: Optional[Dict[int, bytes]] = None,
+        image_sha256: Optional[str] = None,
+        storage: Optional[BlobStorageService] = None,
     ) -> dict:
-        if not self.container_client:
+        """
+        원본 이미지(+썸네일) 업로드 후 closet_items에 저장
+
+        업로드는 공유 비동기 blob 클라이언트로 원본과 썸네일을 동시에 진행합니다.
+        thumbnails({폭: WebP bytes})는 `{이미지}_w{폭}.webp`로 업로드하며,
+        썸네일 업로드 실패는 로그만 남기고 원본 저장은 계속합니다.
+        AZURE_BLOB_LAYOUT=content면 원본/썸네일 모두 내용 해시 이름의 불변 blob으로 저장합니다.
+        image_sha256은 라우터에서 중복 확인에 쓴 값을 재사용 (없으면 여기서 계산)
+        storage는 라우터에서 주입한 스토리지 서비스 (없으면 공유 인스턴스)
+        """
+        blob_storage = storage or self.storage
+        if not blob_storage.enabled:
             raise Exception("Blob Storage not initialized")
 
         # 1. Save Image to Blob
-        namespace_uuid = uuid.UUID("6ba7b810-9dad-11d1-80b4-00c04fd430c8")
-        user_uuid = str(uuid.uuid5(namespace_uuid, f"user_{user_id}"))
-
-        now = datetime.now()
-        date_str = now.strftime("%Y%m%d")
-        image_uuid = str(uuid.uuid4())
-
         if original_filename:
             ext = validate_file_extension(original_filename)
         else:
             ext = ".jpg"
+        image_sha256 = image_sha256 or compute_image_sha256(image_bytes)
 
-        image_filename = f"users/{user_uuid}/{date_str}/{image_uuid}{ext}"
-        image_client = self.container_client.get_blob_client(image_filename)
-
-        content_type = "image/jpeg"
-        if ext == ".png":
-            content_type = "image/png"
-        elif ext == ".gif":
-            content_type = "image/gif"
-        elif ext == ".webp":
-            content_type = "image/webp"
-
-        image_client.upload_blob(
-            image_bytes,
-            overwrite=True,
-            content_settings=ContentSettings(content_type=content_type),
-        )
+        if blob_storage.content_addressed:
+            # 내용 해시 이름 (같은 이미지는 사용자와 무관하게 blob 하나를 공유)
+            image_filename = content_blob_name(image_sha256, ext)
+            upload_original = blob_storage.upload_immutable(
+                image_bytes, ext, digest=image_sha256
+            )
+        else:
+            namespace_uuid = uuid.UUID("6ba7b810-9dad-11d1-80b4-00c04fd430c8")
+            user_uuid = str(uuid.uuid5(namespace_uuid, f"user_{user_id}"))
+            date_str = datetime.now().strftime("%Y%m%d")
+            image_uuid = str(uuid.uuid4())
+
+            image_filename = f"users/{user_uuid}/{date_str}/{image_uuid}{ext}"
+            upload_original = blob_storage.upload_bytes(
+                image_filename, image_bytes, content_type_for(image_filename)
+            )
 
-        image_url = image_client.url
+        image_url, thumbnail_urls = await asyncio.gather(
+            upload_original,
+            self._upload_thumbnails(
+                blob_storage,
+                os.path.splitext(image_filename)[0],
+                thumbnails or {},
+            ),
+        )
 
         # 2. Save to Database
         from .model import ClosetItem
@@ -369,10 +408,13 @@ class WardrobeManager:
             features=features,
             season=season,
             mood_tags=mood_tags,
+            thumbnails=thumbnail_urls or None,
+            image_sha256=image_sha256,
         )
         db.add(db_item)
         db.commit()
         db.refresh(db_item)
+        self.count_cache.invalidate_user(user_id)
 
         return {
             "success": "success",
@@ -381,5 +423,41 @@ class WardrobeManager:
             "blob_name": image_filename,
         }
 
+    async def _upload_thumbnails(
+        self,
+        blob_storage: BlobStorageService,
+        blob_prefix: str,
+        thumbnails: Dict[int, bytes],
+    ) -> Dict[str, str]:
+        """
+        {폭: WebP bytes} 동시 업로드 -> {"폭": URL} (실패한 폭은 제외)
+
+        content 레이아웃에서는 썸네일도 자기 내용 해시 이름으로 저장 (blob_prefix 미사용)
+        """
+        widths = sorted(thumbnails)
+
+        def upload(width: int):
+            if blob_storage.content_addressed:
+                return blob_storage.upload_immutable(
+                    thumbnails[width], THUMBNAIL_EXT, THUMBNAIL_CONTENT_TYPE
+                )
+            return blob_storage.upload_bytes(
+                f"{blob_prefix}_w{width}{THUMBNAIL_EXT}",
+                thumbnails[width],
+                THUMBNAIL_CONTENT_TYPE,
+            )
+
+        results = await asyncio.gather(
+            *(upload(width) for width in widths),
+            return_exceptions=True,
+        )
+        urls: Dict[str, str] = {}
+        for width, result in zip(widths, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Thumbnail upload failed ({width}px): {result}")
+                continue
+            urls[str(width)] = result
+        return urls
+
 
 wardrobe_manager = WardrobeManager()
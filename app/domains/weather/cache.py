@@ -0,0 +1,204 @@
+"""
+날씨 요약 프로세스 로컬 캐시
+(base_date, nx, ny) 단위로 KST 자정까지 메모리에 보관합니다.
+당일 재수집(WEATHER_INTRADAY_REFRESH)이 켜져 있으면 다음 재수집 슬롯에서 만료시켜,
+다른 인스턴스가 갱신한 값도 슬롯 단위로 반영되도록 합니다.
+"""
+
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import Config
+from .forecast import BASE_TIMES, KST
+from .model import DailyWeather
+
+CacheKey = Tuple[str, int, int]
+Hourly = Dict[str, List[Optional[float]]]
+
+# DailyWeather 컬럼 + JIT 속성 중 캐시에 보관하는 필드
+_SNAPSHOT_FIELDS = (
+    "base_date",
+    "base_time",
+    "nx",
+    "ny",
+    "region",
+    "min_temp",
+    "max_temp",
+    "rain_type",
+    "updated_at",
+)
+
+# DB 컬럼이 아닌 JIT 속성 -> 기본값
+_JIT_FIELDS = {
+    "current_rain_type": None,
+    "is_stale": False,  # 이전 날짜 예보를 대신 제공 중인지 여부
+}
+
+
+def snapshot_of(weather: DailyWeather) -> Dict[str, Any]:
+    """DailyWeather(ORM/transient) 값을 세션과 무관한 dict로 복사"""
+    snapshot = {field: getattr(weather, field, None) for field in _SNAPSHOT_FIELDS}
+    for field, default in _JIT_FIELDS.items():
+        snapshot[field] = getattr(weather, field, default)
+    return snapshot
+
+
+def materialize(snapshot: Dict[str, Any]) -> DailyWeather:
+    """스냅샷으로부터 세션에 붙지 않은 새 DailyWeather 생성"""
+    values = dict(snapshot)
+    jit = {field: values.pop(field, default) for field, default in _JIT_FIELDS.items()}
+    weather = DailyWeather(**values)
+    for field, value in jit.items():
+        setattr(weather, field, value)
+    return weather
+
+
+def next_kst_midnight(now: Optional[datetime] = None) -> datetime:
+    """다음 KST 자정 시각 (UTC aware datetime)"""
+    now_kst = (now or datetime.now(timezone.utc)).astimezone(KST)
+    midnight = (now_kst + timedelta(days=1)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    return midnight.astimezone(timezone.utc)
+
+
+def next_cache_expiry(
+    now: Optional[datetime] = None, align_to_refresh: bool = True
+) -> datetime:
+    """다음 KST 자정과 다음 당일 재수집 슬롯 중 빠른 시각 (UTC aware datetime)"""
+    now = now or datetime.now(timezone.utc)
+    expiry = next_kst_midnight(now)
+    if not align_to_refresh:
+        return expiry
+
+    now_kst = now.astimezone(KST)
+    # 0200 발표분은 일 배치, 2300 발표분은 다음 날 예보이므로 당일 재수집 대상이 아님
+    for base_time in BASE_TIMES[1:-1]:
+        slot = now_kst.replace(
+            hour=int(base_time[:2]),
+            minute=Config.WEATHER_INTRADAY_CACHE_EXPIRY_MIN,
+            second=0,
+            microsecond=0,
+        )
+        if slot > now_kst:
+            return min(expiry, slot.astimezone(timezone.utc))
+    return expiry
+
+
+def kst_datetime(base_date: str, base_time: str = "0000") -> datetime:
+    """KMA 날짜/시각 문자열 (YYYYMMDD, HHMM) -> UTC aware datetime"""
+    local = datetime.strptime(base_date + base_time, "%Y%m%d%H%M").replace(tzinfo=KST)
+    return local.astimezone(timezone.utc)
+
+
+class WeatherSummaryCache:
+    """(base_date, nx, ny) -> DailyWeather 스냅샷
+
+    ORM 객체는 세션에 묶여 있으므로 값만 dict로 저장하고,
+    조회 시마다 세션과 무관한 새 DailyWeather 인스턴스를 만들어 반환합니다.
+    (라우터가 반환 객체에 `message`를 주입하므로 공유 객체를 돌려주면 안 됨)
+    실패(None)는 절대 저장하지 않습니다.
+
+    같은 항목에 시간별 배열(카테고리 -> 길이 24)을 함께 보관합니다(put_hourly).
+    요약을 새로 저장(put)하거나 무효화하면 시간별 배열도 함께 지워집니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        align_to_refresh: bool = Config.WEATHER_INTRADAY_REFRESH,
+    ):
+        self.max_entries = max_entries
+        self.align_to_refresh = align_to_refresh
+        # key -> [스냅샷, 만료 시각, 시간별 배열 (미조회 None, 행 없음 {})]
+        self._entries: Dict[CacheKey, List[Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, base_date: str, nx: int, ny: int) -> Optional[DailyWeather]:
+        key = (base_date, nx, ny)
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[1] > now:
+                self.hits += 1
+                snapshot = entry[0]
+            else:
+                if entry:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+        return materialize(snapshot)
+
+    def put(
+        self,
+        weather: Optional[DailyWeather],
+        key_date: Optional[str] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Args:
+            key_date: 캐시 키 날짜 (기본값: weather.base_date).
+                이전 날짜 예보를 오늘 키로 대신 제공(stale)할 때 사용
+            ttl: 만료까지 최대 초 (기본값: 다음 KST 자정 또는 재수집 슬롯까지)
+        """
+        if weather is None:
+            return
+
+        snapshot = snapshot_of(weather)
+        key = (key_date or snapshot["base_date"], snapshot["nx"], snapshot["ny"])
+        expires_at = next_cache_expiry(align_to_refresh=self.align_to_refresh)
+        if ttl is not None:
+            expires_at = min(expires_at, datetime.now(timezone.utc) + timedelta(seconds=ttl))
+
+        with self._lock:
+            if len(self._entries) >= self.max_entries and key not in self._entries:
+                self._evict_expired()
+                if len(self._entries) >= self.max_entries:
+                    # 가장 먼저 들어온 항목 제거 (dict 삽입 순서)
+                    self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = [snapshot, expires_at, None]
+
+    def get_hourly(self, base_date: str, nx: int, ny: int) -> Optional[Hourly]:
+        """캐시된 시간별 배열 (요약이 없거나 만료됐거나 아직 조회 전이면 None)
+
+        반환한 배열은 공유 객체이므로 수정하지 않습니다.
+        """
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            entry = self._entries.get((base_date, nx, ny))
+            if entry and entry[1] > now:
+                return entry[2]
+        return None
+
+    def put_hourly(self, base_date: str, nx: int, ny: int, hourly: Hourly) -> None:
+        """요약 항목에 시간별 배열을 붙임 (요약이 없으면 저장하지 않음)"""
+        with self._lock:
+            entry = self._entries.get((base_date, nx, ny))
+            if entry:
+                entry[2] = hourly
+
+    def invalidate(self, base_date: str, nx: int, ny: int) -> None:
+        with self._lock:
+            self._entries.pop((base_date, nx, ny), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 3) if total else 0.0,
+        }
+
+    def _evict_expired(self) -> None:
+        now = datetime.now(timezone.utc)
+        expired = [k for k, entry in self._entries.items() if entry[1] <= now]
+        for k in expired:
+            del self._entries[k]
@@ -0,0 +1,100 @@
+"""
+요청 좌표 -> 날씨 조회 격자 정규화 (canonicalization)
+같은 동네 사용자가 5km 격자 단위로 흩어져 각자 KMA를 호출하지 않도록,
+설정된 정책(WEATHER_GRID_POLICY)에 따라 조회 격자를 하나로 모읍니다.
+
+- region: 가장 가까운 시/군/구 대표 격자 (캐시 적중률 최대, 정밀도 최저)
+- coarse: 원 격자를 N x N 블록으로 묶은 블록 중심 격자 (WEATHER_GRID_COARSE_FACTOR)
+- exact: 원 격자 그대로 (정밀도 최대, 캐시 적중률 최저)
+"""
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Set, Tuple
+
+from app.core.config import Config
+from app.core.regions import get_nearest_region
+from .cache import KST
+from .grid import latlon_to_grid
+
+POLICY_REGION = "region"
+POLICY_COARSE = "coarse"
+POLICY_EXACT = "exact"
+POLICIES = (POLICY_REGION, POLICY_COARSE, POLICY_EXACT)
+
+
+@dataclass(frozen=True)
+class CanonicalCell:
+    nx: int
+    ny: int
+    region: str  # 표시/저장용 지역명 (정책과 무관하게 가장 가까운 시/군/구)
+
+
+class GridCanonicalizer:
+    """좌표 정규화 + 격자 재사용 지표
+
+    하루(KST) 동안 정규화된 격자 집합을 유지하여,
+    요청 중 이미 다른 요청이 사용한 격자로 모인 비율(cell_reuse_ratio)을 보고합니다.
+    이 값이 높을수록 같은 격자의 캐시/DB 데이터를 공유하므로 KMA 호출이 줄어듭니다.
+    """
+
+    def __init__(
+        self,
+        policy: str = Config.WEATHER_GRID_POLICY,
+        coarse_factor: int = Config.WEATHER_GRID_COARSE_FACTOR,
+    ):
+        if policy not in POLICIES:
+            raise ValueError(
+                f"지원하지 않는 격자 정책입니다: {policy} (지원: {', '.join(POLICIES)})"
+            )
+        if coarse_factor < 1:
+            raise ValueError("coarse_factor는 1 이상이어야 합니다.")
+        self.policy = policy
+        self.coarse_factor = coarse_factor
+        self._lock = threading.Lock()
+        self._day = None
+        self._cells: Set[Tuple[int, int]] = set()
+        self.requests = 0
+        self.reused = 0
+
+    def canonicalize(self, lat: float, lon: float) -> CanonicalCell:
+        region_name, region_data = get_nearest_region(lat, lon)
+
+        if self.policy == POLICY_REGION:
+            nx, ny = region_data["nx"], region_data["ny"]
+        else:
+            nx, ny = latlon_to_grid(lat, lon)
+            if self.policy == POLICY_COARSE:
+                nx, ny = self._snap(nx), self._snap(ny)
+
+        self._track(nx, ny)
+        return CanonicalCell(nx=nx, ny=ny, region=region_name)
+
+    def _snap(self, value: int) -> int:
+        # 블록 중심으로 스냅 (factor=3: 0,1,2 -> 1 / 3,4,5 -> 4)
+        f = self.coarse_factor
+        return (value // f) * f + f // 2
+
+    def _track(self, nx: int, ny: int) -> None:
+        today = datetime.now(KST).date()
+        with self._lock:
+            if today != self._day:
+                self._day = today
+                self._cells.clear()
+            self.requests += 1
+            if (nx, ny) in self._cells:
+                self.reused += 1
+            else:
+                self._cells.add((nx, ny))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "policy": self.policy,
+            "coarse_factor": self.coarse_factor,
+            "requests": self.requests,
+            "distinct_cells_today": len(self._cells),
+            "cell_reuse_ratio": (
+                round(self.reused / self.requests, 3) if self.requests else 0.0
+            ),
+        }
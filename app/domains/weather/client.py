@@ -1,35 +1,178 @@
+import asyncio
+import logging
 import aiohttp
 from typing import Dict, Any, Optional
 from urllib.parse import unquote
 from app.core.config import Config
+from .forecast import DailyForecast
+from .parser import StreamingForecastParser
+from app.utils.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
 
 
 class KMAWeatherClient:
-    """기상청 단기예보 API 클라이언트"""
+    """기상청 단기예보 API 클라이언트
 
-    BASE_URL = "http://apis.data.go.kr/1360000/VilageFcstInfoService_2.0/getVilageFcst"
+    하나의 장수명(long-lived) `aiohttp.ClientSession`을 공유하여
+    배치/캐시 미스마다 TCP 연결 및 DNS 조회 비용을 반복하지 않습니다.
+    세션은 첫 호출 시 지연 생성되며, 앱 lifespan 종료 시 `close()`로 정리합니다.
+    모든 호출은 토큰 버킷 + 동시 실행 상한(RateLimiter)을 거치므로
+    배치가 여러 격자를 한꺼번에 gather해도 KMA 호출 속도는 설정값을 넘지 않습니다.
+    """
 
-    async def fetch_forecast(
-        self, base_date: str, base_time: str, nx: int, ny: int, numOfRows: int
-    ) -> Optional[Dict[str, Any]]:
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, base_url: Optional[str] = None):
+        self.base_url = base_url or Config.KMA_BASE_URL
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
+        self._limiter = RateLimiter(
+            rate=Config.KMA_RATE_LIMIT_PER_SEC,
+            burst=Config.KMA_RATE_LIMIT_BURST,
+            max_concurrency=Config.KMA_MAX_CONCURRENCY,
+        )
+        self._metrics = {
+            "requests": 0,
+            "failures": 0,
+            "connections_created": 0,
+            "connections_reused": 0,
+            "dns_cache_hits": 0,
+            "dns_cache_misses": 0,
+            "sessions_created": 0,
+        }
+
+    def _build_trace_config(self) -> aiohttp.TraceConfig:
+        """연결 재사용/DNS 캐시 지표 수집용 TraceConfig"""
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_connection_create_end(session, ctx, params):
+            self._metrics["connections_created"] += 1
+
+        async def on_connection_reuseconn(session, ctx, params):
+            self._metrics["connections_reused"] += 1
+
+        async def on_dns_cache_hit(session, ctx, params):
+            self._metrics["dns_cache_hits"] += 1
+
+        async def on_dns_cache_miss(session, ctx, params):
+            self._metrics["dns_cache_misses"] += 1
+
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace_config
+
+    async def start(self) -> aiohttp.ClientSession:
+        """공유 세션을 생성합니다. (이미 열려 있으면 그대로 반환)"""
+        if self._session is not None and not self._session.closed:
+            return self._session
+
+        async with self._session_lock:
+            if self._session is None or self._session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=Config.KMA_HTTP_POOL_SIZE,
+                    limit_per_host=Config.KMA_HTTP_POOL_SIZE_PER_HOST,
+                    ttl_dns_cache=Config.KMA_HTTP_DNS_TTL,
+                    keepalive_timeout=Config.KMA_HTTP_KEEPALIVE,
+                )
+                self._session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=aiohttp.ClientTimeout(total=Config.KMA_HTTP_TIMEOUT),
+                    trace_configs=[self._build_trace_config()],
+                )
+                self._metrics["sessions_created"] += 1
+                logger.info("KMA HTTP session opened")
+        return self._session
+
+    async def close(self) -> None:
+        """공유 세션을 닫습니다. (앱 종료 시 호출)"""
+        async with self._session_lock:
+            if self._session is not None and not self._session.closed:
+                await self._session.close()
+                logger.info(f"KMA HTTP session closed. metrics={self.get_metrics()}")
+            self._session = None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """연결 재사용 지표를 반환합니다."""
+        metrics = dict(self._metrics)
+        total_conns = metrics["connections_created"] + metrics["connections_reused"]
+        metrics["connection_reuse_ratio"] = (
+            round(metrics["connections_reused"] / total_conns, 3) if total_conns else 0.0
+        )
+        metrics["session_open"] = self._session is not None and not self._session.closed
+        metrics["rate_limiter"] = self._limiter.stats()
+        return metrics
+
+    async def fetch_daily_forecast(
+        self,
+        base_date: str,
+        base_time: str,
+        nx: int,
+        ny: int,
+        numOfRows: int,
+        target_date: Optional[str] = None,
+        require_summary: bool = False,
+    ) -> Optional[DailyForecast]:
         """
-        기상청 API를 호출하여 예보 데이터를 가져옵니다.
+        예보를 스트리밍 파싱하여 DailyForecast로 바로 반환합니다.
+        응답 전체를 dict로 만들지 않고 필요한 카테고리만 배열에 기록합니다.
 
         Args:
-            base_date (str): 기준 날짜 (YYYYMMDD)
-            base_time (str): 기준 시간 (HHMM)
-            nx (int): 격자 X 좌표
-            ny (int): 격자 Y 좌표
+            target_date (str): 시간별 배열로 보관할 날짜 (기본값: base_date)
+            require_summary (bool): TMN/TMX가 없으면 실패로 처리 (0200 발표분 일 요약용)
 
         Returns:
-            Optional[Dict[str, Any]]: API 응답 데이터 (JSON) 또는 실패 시 None
+            Optional[DailyForecast]: 파싱 결과 또는 실패(네트워크 오류, resultCode != "00",
+                보관한 item 없음, require_summary인데 TMN/TMX 없음) 시 None
         """
+        params = self._build_params(base_date, base_time, nx, ny, numOfRows)
+
+        self._metrics["requests"] += 1
+        try:
+            session = await self.start()
+            async with self._limiter:
+                async with session.get(self.base_url, params=params) as response:
+                    response.raise_for_status()
+                    parser = StreamingForecastParser(target_date or base_date)
+                    async for chunk in response.content.iter_chunked(
+                        self.STREAM_CHUNK_SIZE
+                    ):
+                        parser.feed(chunk)
+                    forecast = parser.close()
+        except aiohttp.ClientError as e:
+            self._metrics["failures"] += 1
+            print(f"KMA API Connection Failed: {e}")
+            return None
+        except Exception as e:
+            self._metrics["failures"] += 1
+            print(f"Unexpected error: {e}")
+            return None
+
+        if parser.result_code != "00":
+            print(f"KMA API Error: {parser.result_code} {parser.result_msg}")
+            return None
+        # 정상 코드여도 item을 하나도 못 읽었으면 빈 예보("강수 없음")를 저장하지 않도록 실패 처리
+        missing_summary = require_summary and not forecast.has_daily_summary
+        if parser.items_kept == 0 or missing_summary:
+            self._metrics["failures"] += 1
+            print(
+                f"KMA API Error: unusable forecast for ({nx}, {ny}) "
+                f"(items kept: {parser.items_kept})"
+            )
+            return None
+        return forecast
+
+    def _build_params(
+        self, base_date: str, base_time: str, nx: int, ny: int, numOfRows: int
+    ) -> Dict[str, Any]:
         # API Key Decoding: requests 라이브러리는 파라미터를 자동으로 인코딩하므로,
         # 이미 인코딩된 키가 들어오면 이중 인코딩되는 문제가 발생합니다.
         # 따라서 항상 디코딩된 상태로 만들어 requests에 넘겨줍니다.
         service_key = unquote(Config.KMA_API_KEY)
 
-        params = {
+        return {
             "serviceKey": service_key,
             "pageNo": "1",
             "numOfRows": numOfRows,  # 하루치 데이터 커버
@@ -39,19 +182,3 @@ class KMAWeatherClient:
             "nx": nx,
             "ny": ny,
         }
-
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    self.BASE_URL,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as response:
-                    response.raise_for_status()
-                    return await response.json()
-        except aiohttp.ClientError as e:
-            print(f"KMA API Connection Failed: {e}")
-            return None
-        except Exception as e:
-            print(f"Unexpected error: {e}")
-            return None
@@ -0,0 +1,140 @@
+"""
+격자 수요 추적
+사용자 요청이 들어온 (nx, ny) 격자를 메모리에서 집계하고 주기적으로 weather_grid_demand에 반영합니다.
+점수는 반감기(WEATHER_DEMAND_HALF_LIFE_HOURS)로 지수 감쇠하므로,
+최근 자주 조회된 격자만 배치 사전 수집 대상으로 남습니다.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, func, literal_column, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.config import Config
+from app.database import engine
+from .model import WeatherGridDemand
+
+logger = logging.getLogger(__name__)
+
+GridKey = Tuple[int, int]
+
+# 이 값 아래로 감쇠한 격자는 정리
+PRUNE_SCORE = 0.01
+
+
+def decayed_score(half_life_hours: float):
+    """현재 시각 기준 감쇠 점수 SQL 식"""
+    elapsed = func.extract("epoch", func.now() - WeatherGridDemand.last_requested_at)
+    return WeatherGridDemand.score * func.power(
+        0.5, elapsed / (half_life_hours * 3600.0)
+    )
+
+
+class GridDemandTracker:
+    """요청 격자 집계 (프로세스 메모리 -> DB 주기적 flush)
+
+    요청 경로에서는 메모리 카운터만 올리고, flush 주기마다 한 번의
+    INSERT ... ON CONFLICT로 기존 점수를 감쇠시킨 뒤 누적합니다.
+    요청 세션의 트랜잭션과 섞이지 않도록 flush는 전용 커넥션을 사용합니다.
+    """
+
+    def __init__(
+        self,
+        half_life_hours: float = Config.WEATHER_DEMAND_HALF_LIFE_HOURS,
+        flush_interval: float = Config.WEATHER_DEMAND_FLUSH_SEC,
+    ):
+        self.half_life_hours = half_life_hours
+        self.flush_interval = flush_interval
+        self._pending: Dict[GridKey, List] = {}  # (nx, ny) -> [count, region]
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self.recorded = 0
+        self.flushed_cells = 0
+
+    def record(self, nx: int, ny: int, region: Optional[str] = None) -> None:
+        with self._lock:
+            entry = self._pending.get((nx, ny))
+            if entry is None:
+                self._pending[(nx, ny)] = [1, region]
+            else:
+                entry[0] += 1
+                if region:
+                    entry[1] = region
+            self.recorded += 1
+
+    def flush_if_due(self) -> None:
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> int:
+        """집계된 수요를 DB에 반영하고 반영한 격자 수를 반환"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+        if not pending:
+            return 0
+
+        rows = [
+            {"nx": nx, "ny": ny, "region": region, "score": float(count)}
+            for (nx, ny), (count, region) in pending.items()
+        ]
+        try:
+            with engine.begin() as conn:
+                conn.execute(self._upsert_statement(rows))
+        except Exception as e:
+            # 수요 집계는 best-effort: 실패한 구간은 버리고 요청 처리는 계속
+            logger.error(f"Failed to flush weather grid demand: {e}")
+            return 0
+
+        self.flushed_cells += len(rows)
+        return len(rows)
+
+    def _upsert_statement(self, rows: List[dict]):
+        stmt = pg_insert(WeatherGridDemand).values(rows)
+        return stmt.on_conflict_do_update(
+            index_elements=["nx", "ny"],
+            set_={
+                # 기존 점수를 지금까지 감쇠시킨 뒤 이번 구간 요청 수를 더함
+                "score": decayed_score(self.half_life_hours) + stmt.excluded.score,
+                "region": func.coalesce(stmt.excluded.region, WeatherGridDemand.region),
+                "last_requested_at": func.now(),
+            },
+        )
+
+    def hot_cells(
+        self,
+        db,
+        min_score: float = Config.WEATHER_PREFETCH_MIN_SCORE,
+        limit: int = Config.WEATHER_PREFETCH_MAX_CELLS,
+    ) -> List[Tuple[int, int, Optional[str], float]]:
+        """감쇠 점수가 min_score 이상인 격자 (점수 내림차순)"""
+        score = decayed_score(self.half_life_hours)
+        stmt = (
+            select(
+                WeatherGridDemand.nx,
+                WeatherGridDemand.ny,
+                WeatherGridDemand.region,
+                score.label("score"),
+            )
+            .where(score >= min_score)
+            .order_by(literal_column("score").desc())
+            .limit(limit)
+        )
+        return [tuple(row) for row in db.execute(stmt)]
+
+    def prune(self, db) -> int:
+        """충분히 감쇠한 격자 삭제 (commit은 호출자)"""
+        stmt = delete(WeatherGridDemand).where(
+            decayed_score(self.half_life_hours) < PRUNE_SCORE
+        )
+        return db.execute(stmt).rowcount
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "pending_cells": len(self._pending),
+            "recorded": self.recorded,
+            "flushed_cells": self.flushed_cells,
+        }
@@ -0,0 +1,152 @@
+"""
+기상청 단기예보 응답 파싱
+일 요약(TMN/TMX/최대 PTY)과 함께, 시간별 예보를 카테고리별 고정 길이(24) 배열로 변환합니다.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
+
+HOURS_PER_DAY = 24
+
+# 시간별로 보관하는 KMA 카테고리 -> 값 변환 함수
+HOURLY_CATEGORIES = {
+    "TMP": float,  # 1시간 기온 (℃)
+    "POP": int,  # 강수확률 (%)
+    "PTY": int,  # 강수형태 (0:없음, 1:비, 2:비/눈, 3:눈, 4:소나기)
+    "SKY": int,  # 하늘상태 (1:맑음, 3:구름많음, 4:흐림)
+    "REH": int,  # 습도 (%)
+    "WSD": float,  # 풍속 (m/s)
+}
+
+# 추천에서 사용하는 대표 시각
+MORNING_HOUR = 8
+EVENING_HOUR = 19
+
+# 기상청 예보의 날짜/시각 기준 (호스트 시간대와 무관하게 항상 KST 사용)
+KST = timezone(timedelta(hours=9))
+
+# 단기예보 발표 시각 (KST, 하루 8회). 각 발표분은 약 10분 뒤 API로 제공됨
+BASE_TIMES = ("0200", "0500", "0800", "1100", "1400", "1700", "2000", "2300")
+PUBLISH_DELAY_MIN = 10
+
+
+def latest_base_time(now_kst: datetime) -> Optional[str]:
+    """now_kst 시점에 조회 가능한 가장 최근 발표 시각 (당일 0200 발표 전이면 None)"""
+    minutes = now_kst.hour * 60 + now_kst.minute
+    latest = None
+    for base_time in BASE_TIMES:
+        published = int(base_time[:2]) * 60 + int(base_time[2:]) + PUBLISH_DELAY_MIN
+        if published <= minutes:
+            latest = base_time
+    return latest
+
+
+def empty_hourly() -> Dict[str, List[Optional[float]]]:
+    return {cat: [None] * HOURS_PER_DAY for cat in HOURLY_CATEGORIES}
+
+
+def merge_hourly(
+    old: Dict[str, List[Optional[float]]], new: Dict[str, List[Optional[float]]]
+) -> Dict[str, List[Optional[float]]]:
+    """이전 시간별 배열 위에 새 발표분 값을 덮어씀 (새 발표분에 없는 시각은 유지)"""
+    merged = {}
+    for cat in HOURLY_CATEGORIES:
+        old_values = old.get(cat) or [None] * HOURS_PER_DAY
+        new_values = new.get(cat) or [None] * HOURS_PER_DAY
+        merged[cat] = [
+            n if n is not None else o for o, n in zip(old_values, new_values)
+        ]
+    return merged
+
+
+def hourly_value(
+    hourly: Dict[str, List[Optional[float]]], category: str, hour: int
+) -> Optional[float]:
+    """시간별 배열(카테고리 -> 길이 24)에서 특정 시각 값 (없으면 None)"""
+    values = hourly.get(category)
+    if not values or not 0 <= hour < len(values):
+        return None
+    return values[hour]
+
+
+@dataclass
+class DailyForecast:
+    """하루치 예보 (일 요약 + 시간별 배열)"""
+
+    min_temp: Optional[float] = None
+    max_temp: Optional[float] = None
+    rain_type: int = 0  # 하루 중 가장 심한 강수 형태 (target_date 기준)
+    current_rain_type: int = 0  # 현재 시각 강수 형태 (JIT)
+    hourly: Dict[str, List[Optional[float]]] = field(default_factory=empty_hourly)
+
+    @property
+    def has_daily_summary(self) -> bool:
+        """일 최저/최고 기온(TMN/TMX)이 모두 있는지 (0200 발표분이면 항상 있어야 함)"""
+        return self.min_temp is not None and self.max_temp is not None
+
+
+# 일 요약 계산에 필요한 카테고리 (날짜와 무관하게 사용)
+SUMMARY_CATEGORIES = frozenset({"TMN", "TMX", "PTY"})
+
+# 파싱 대상 카테고리 전체 (그 외 카테고리는 버림)
+WANTED_CATEGORIES = SUMMARY_CATEGORIES | frozenset(HOURLY_CATEGORIES)
+
+
+class ForecastBuilder:
+    """KMA item을 하나씩 받아 DailyForecast를 누적하는 빌더
+
+    dict 기반 파서(parse_forecast_items)와 스트리밍 파서(parser.py)가 공유하므로
+    두 경로의 결과는 항상 동일합니다.
+    """
+
+    def __init__(self, target_date: str, now_hour: Optional[str] = None):
+        self.target_date = target_date
+        self.now_hour = now_hour or datetime.now(KST).strftime("%H00")
+        self.forecast = DailyForecast()
+
+    def add(self, cat: str, fcst_date: str, fcst_time: str, val: str) -> None:
+        # 일 요약/시간별 배열 모두 target_date 하루만 대상
+        # (후속 발표분은 다음 날 TMN/TMX까지 포함하므로 날짜 필터가 필요)
+        if fcst_date != self.target_date:
+            return
+
+        forecast = self.forecast
+
+        if cat == "TMN":
+            forecast.min_temp = float(val)
+        elif cat == "TMX":
+            forecast.max_temp = float(val)
+        elif cat == "PTY":
+            rain_val = int(val)
+            if rain_val > forecast.rain_type:
+                forecast.rain_type = rain_val
+
+        if cat == "PTY" and fcst_time == self.now_hour:
+            forecast.current_rain_type = int(val)
+
+        convert = HOURLY_CATEGORIES.get(cat)
+        if convert is not None:
+            try:
+                forecast.hourly[cat][int(fcst_time[:2])] = convert(val)
+            except (TypeError, ValueError):
+                pass
+
+
+def parse_forecast_items(
+    items: Iterable[dict], target_date: str, now_hour: Optional[str] = None
+) -> DailyForecast:
+    """
+    KMA item 목록을 DailyForecast로 변환합니다.
+
+    Args:
+        items: response.body.items.item
+        target_date: 시간별 배열로 보관할 예보 날짜 (YYYYMMDD)
+        now_hour: 현재 시각 (HH00). 생략 시 현재 시각 사용
+    """
+    builder = ForecastBuilder(target_date, now_hour)
+    for item in items:
+        builder.add(
+            item["category"], item["fcstDate"], item["fcstTime"], item["fcstValue"]
+        )
+    return builder.forecast
@@ -0,0 +1,146 @@
+"""
+기상청 LCC(Lambert Conformal Conic) 격자 변환기
+투영 상수(sn, sf, ro)를 모듈 로드 시 한 번만 계산하고,
+단건 변환(scalar)과 NumPy 배열 일괄 변환(batch) API를 제공합니다.
+
+scalar 경로는 `utils.dfs_xy_conv`와 동일한 연산 순서를 따르므로 결과가 비트 단위로 일치합니다.
+batch 경로의 격자 좌표(to_grid_batch) 역시 동일한 정수 값을 반환하며,
+역변환(to_latlon_batch)은 NumPy 삼각함수 구현 차이로 마지막 비트(약 1e-14도)까지만 다를 수 있습니다.
+"""
+
+import math
+from typing import Tuple
+
+import numpy as np
+
+
+class LCCGrid:
+    """기상청 동네예보 격자 투영 (상수 사전 계산)"""
+
+    RE = 6371.00877  # 지구 반경(km)
+    GRID = 5.0  # 격자 간격(km)
+    SLAT1 = 30.0  # 투영 위도1(degree)
+    SLAT2 = 60.0  # 투영 위도2(degree)
+    OLON = 126.0  # 기준점 경도(degree)
+    OLAT = 38.0  # 기준점 위도(degree)
+    XO = 43  # 기준점 X좌표(GRID)
+    YO = 136  # 기준점 Y좌표(GRID)
+
+    DEGRAD = math.pi / 180.0
+    RADDEG = 180.0 / math.pi
+
+    def __init__(self):
+        re = self.RE / self.GRID
+        slat1 = self.SLAT1 * self.DEGRAD
+        slat2 = self.SLAT2 * self.DEGRAD
+        olon = self.OLON * self.DEGRAD
+        olat = self.OLAT * self.DEGRAD
+
+        sn = math.tan(math.pi * 0.25 + slat2 * 0.5) / math.tan(
+            math.pi * 0.25 + slat1 * 0.5
+        )
+        sn = math.log(math.cos(slat1) / math.cos(slat2)) / math.log(sn)
+        sf = math.tan(math.pi * 0.25 + slat1 * 0.5)
+        sf = math.pow(sf, sn) * math.cos(slat1) / sn
+        ro = math.tan(math.pi * 0.25 + olat * 0.5)
+        ro = re * sf / math.pow(ro, sn)
+
+        self.re = re
+        self.olon = olon
+        self.sn = sn
+        self.sf = sf
+        self.ro = ro
+
+    # ------------------------------------------------------------------
+    # Scalar fast path
+    # ------------------------------------------------------------------
+    def to_grid(self, lat: float, lon: float) -> Tuple[int, int]:
+        """위경도 -> 격자 (nx, ny)"""
+        ra = math.tan(math.pi * 0.25 + lat * self.DEGRAD * 0.5)
+        ra = self.re * self.sf / math.pow(ra, self.sn)
+        theta = lon * self.DEGRAD - self.olon
+        if theta > math.pi:
+            theta -= 2.0 * math.pi
+        if theta < -math.pi:
+            theta += 2.0 * math.pi
+        theta *= self.sn
+        x = math.floor(ra * math.sin(theta) + self.XO + 0.5)
+        y = math.floor(self.ro - ra * math.cos(theta) + self.YO + 0.5)
+        return x, y
+
+    def to_latlon(self, x: float, y: float) -> Tuple[float, float]:
+        """격자 (nx, ny) -> 위경도"""
+        xn = x - self.XO
+        yn = self.ro - y + self.YO
+        ra = math.sqrt(xn * xn + yn * yn)
+        if self.sn < 0.0:
+            ra = -ra
+        alat = math.pow((self.re * self.sf / ra), (1.0 / self.sn))
+        alat = 2.0 * math.atan(alat) - math.pi * 0.5
+
+        if abs(xn) <= 0.0:
+            theta = 0.0
+        else:
+            if abs(yn) <= 0.0:
+                theta = math.pi * 0.5
+                if xn < 0.0:
+                    theta = -theta
+            else:
+                theta = math.atan2(xn, yn)
+        alon = theta / self.sn + self.olon
+        return alat * self.RADDEG, alon * self.RADDEG
+
+    # ------------------------------------------------------------------
+    # NumPy batch API
+    # ------------------------------------------------------------------
+    def to_grid_batch(self, lats, lons):
+        """위경도 배열 -> (nx 배열, ny 배열) (int64)"""
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+
+        ra = np.tan(math.pi * 0.25 + lats * self.DEGRAD * 0.5)
+        ra = self.re * self.sf / np.power(ra, self.sn)
+        theta = lons * self.DEGRAD - self.olon
+        theta = np.where(theta > math.pi, theta - 2.0 * math.pi, theta)
+        theta = np.where(theta < -math.pi, theta + 2.0 * math.pi, theta)
+        theta = theta * self.sn
+        x = np.floor(ra * np.sin(theta) + self.XO + 0.5).astype(np.int64)
+        y = np.floor(self.ro - ra * np.cos(theta) + self.YO + 0.5).astype(np.int64)
+        return x, y
+
+    def to_latlon_batch(self, xs, ys):
+        """격자 배열 -> (위도 배열, 경도 배열)"""
+        xn = np.asarray(xs, dtype=np.float64) - self.XO
+        yn = self.ro - np.asarray(ys, dtype=np.float64) + self.YO
+        ra = np.sqrt(xn * xn + yn * yn)
+        if self.sn < 0.0:
+            ra = -ra
+        alat = np.power((self.re * self.sf / ra), (1.0 / self.sn))
+        alat = 2.0 * np.arctan(alat) - math.pi * 0.5
+
+        # scalar 경로와 동일한 분기: xn == 0 -> 0, yn == 0 -> ±pi/2, 그 외 atan2
+        theta = np.where(
+            np.abs(xn) <= 0.0,
+            0.0,
+            np.where(
+                np.abs(yn) <= 0.0,
+                np.where(xn < 0.0, -math.pi * 0.5, math.pi * 0.5),
+                np.arctan2(xn, yn),
+            ),
+        )
+        alon = theta / self.sn + self.olon
+        return alat * self.RADDEG, alon * self.RADDEG
+
+
+# Singleton Instance
+lcc_grid = LCCGrid()
+
+
+def latlon_to_grid(lat: float, lon: float) -> Tuple[int, int]:
+    """위경도 -> 기상청 격자 (nx, ny) 단건 변환"""
+    return lcc_grid.to_grid(lat, lon)
+
+
+def grid_to_latlon(x: float, y: float) -> Tuple[float, float]:
+    """기상청 격자 (nx, ny) -> 위경도 단건 변환"""
+    return lcc_grid.to_latlon(x, y)
@@ -1,6 +1,19 @@
-from sqlalchemy import Column, Integer, String, Float, Date, UniqueConstraint
+from typing import Dict, List, Optional
+from sqlalchemy import (
+    Column,
+    Integer,
+    SmallInteger,
+    String,
+    Float,
+    REAL,
+    Date,
+    DateTime,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.sql import func
 from app.database import Base
+from .forecast import HOURLY_CATEGORIES, HOURS_PER_DAY
 
 
 class DailyWeather(Base):
@@ -19,6 +32,10 @@ class DailyWeather(Base):
     # 하루 중 가장 심한 기상 상태를 저장 (보수적 코디 추천)
 
     created_at = Column(Date, server_default=func.now())
+    # 당일 재수집 등으로 값이 바뀐 시각 (HTTP ETag/Last-Modified 기준)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
 
     # 같은 날짜, 같은 지역(nx, ny)에는 데이터가 1개만 존재해야 함
     # region이 있으면 region 기준 중복 방지도 고려할 수 있으나,
@@ -31,3 +48,66 @@ class DailyWeather(Base):
     @property
     def date_id(self):
         return self.base_date
+
+
+class DailyWeatherHourly(Base):
+    """격자별 하루치 시간별 예보 (카테고리당 길이 24 배열, 인덱스 = 시각)
+
+    한 격자/하루가 한 행이므로 조회는 항상 단일 행 읽기입니다.
+    예보가 없는 시각(예: 02시 발표 이전의 00~02시)은 NULL 원소로 채웁니다.
+    """
+
+    __tablename__ = "daily_weather_hourly"
+
+    id = Column(Integer, primary_key=True, index=True)
+    base_date = Column(String(8), nullable=False)  # 예보 대상 날짜 (YYYYMMDD)
+    base_time = Column(String(4), nullable=False)  # 마지막으로 반영한 발표 시각 (HHMM)
+    nx = Column(Integer, nullable=False)
+    ny = Column(Integer, nullable=False)
+
+    tmp = Column(ARRAY(REAL))  # 기온 (TMP, ℃)
+    pop = Column(ARRAY(SmallInteger))  # 강수확률 (POP, %)
+    pty = Column(ARRAY(SmallInteger))  # 강수형태 (PTY)
+    sky = Column(ARRAY(SmallInteger))  # 하늘상태 (SKY)
+    reh = Column(ARRAY(SmallInteger))  # 습도 (REH, %)
+    wsd = Column(ARRAY(REAL))  # 풍속 (WSD, m/s)
+
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    __table_args__ = (
+        UniqueConstraint("base_date", "nx", "ny", name="uix_daily_weather_hourly"),
+    )
+
+    def to_hourly(self) -> Dict[str, List[Optional[float]]]:
+        """카테고리(TMP, POP, ...) -> 길이 24 배열
+
+        REAL 컬럼은 float32로 저장되므로 KMA 원래 정밀도(0.1)로 반올림하여,
+        새로 파싱한 값과 그대로 비교할 수 있게 합니다.
+        """
+        hourly = {}
+        for cat in HOURLY_CATEGORIES:
+            values = getattr(self, cat.lower()) or [None] * HOURS_PER_DAY
+            hourly[cat] = [
+                round(v, 1) if isinstance(v, float) else v for v in values
+            ]
+        return hourly
+
+
+class WeatherGridDemand(Base):
+    """사용자가 실제로 조회한 격자별 수요 점수 (지수 감쇠)
+
+    score는 last_requested_at 시점의 값이며, 현재 점수는
+    score * 0.5 ^ (경과 시간 / 반감기)로 계산합니다. (demand.py 참고)
+    """
+
+    __tablename__ = "weather_grid_demand"
+
+    nx = Column(Integer, primary_key=True)
+    ny = Column(Integer, primary_key=True)
+    region = Column(String(50), nullable=True)  # 마지막 요청 시 가장 가까운 지역명
+    score = Column(Float, nullable=False, default=0.0)
+    last_requested_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
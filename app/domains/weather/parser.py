@@ -0,0 +1,130 @@
+"""
+기상청 단기예보 응답 스트리밍 파서
+응답 본문을 dict 트리로 만들지 않고 바이트 청크 단위로 훑으면서,
+필요한 카테고리(TMN/TMX/PTY + 시간별 보관 대상)의 item만 골라 DailyForecast 배열에 바로 기록합니다.
+
+원하는 카테고리의 category 필드만 정규식으로 찾고(나머지 item은 객체로 만들지 않음),
+KMA 기본 필드 순서면 바로 뒤의 fcstDate/fcstTime/fcstValue를 한 번에 읽습니다.
+순서가 다르면 item이 중첩 없는 평평한 객체라는 점을 이용해 category를 감싼 `{...}` 범위에서
+필드를 각각 찾으므로, 결과는 필드 순서에 의존하지 않습니다.
+"""
+
+import re
+from typing import FrozenSet, Iterable, Optional, Tuple
+
+from .forecast import DailyForecast, ForecastBuilder, WANTED_CATEGORIES
+
+_RESULT_CODE = re.compile(rb'"resultCode"\s*:\s*"([^"]*)"')
+_RESULT_MSG = re.compile(rb'"resultMsg"\s*:\s*"([^"]*)"')
+
+
+def _item_pattern(categories: FrozenSet[str]) -> "re.Pattern[bytes]":
+    # 원하는 카테고리의 category 필드만 찾으므로 나머지 item은 객체로 만들지 않음
+    # KMA 기본 필드 순서(category, fcstDate, fcstTime, fcstValue)면 뒤따르는 값까지 한 번에 추출
+    # (순서가 다르면 2~4번 그룹은 None)
+    alternation = b"|".join(re.escape(c.encode()) for c in sorted(categories))
+    return re.compile(
+        rb'"category"\s*:\s*"(' + alternation + rb')"'
+        rb'(?:\s*,\s*"fcstDate"\s*:\s*"?(\d{8})"?\s*,'
+        rb'\s*"fcstTime"\s*:\s*"?(\d{4})"?\s*,'
+        rb'\s*"fcstValue"\s*:\s*"([^"]*)")?'
+    )
+
+
+# 순서가 다르면 category를 감싼 item 객체 범위에서 필드를 각각 찾음
+_FCST_DATE = re.compile(rb'"fcstDate"\s*:\s*"?(\d{8})')
+_FCST_TIME = re.compile(rb'"fcstTime"\s*:\s*"?(\d{4})')
+_FCST_VALUE = re.compile(rb'"fcstValue"\s*:\s*"([^"]*)"')
+
+
+_DEFAULT_ITEM = _item_pattern(WANTED_CATEGORIES)
+
+
+def _unordered_fields(
+    buf: bytes, category: "re.Match[bytes]", end: int
+) -> Tuple[Optional[bytes], Optional[bytes], Optional[bytes]]:
+    """category를 감싼 item에서 (fcstDate, fcstTime, fcstValue) (하나라도 없으면 모두 None)"""
+    # item은 중첩 없는 객체이므로 category 앞뒤의 가장 가까운 '{', '}'가 item 경계
+    start = buf.rfind(b"{", 0, category.start())
+    stop = buf.find(b"}", category.end(), end) + 1
+    if start < 0 or not stop:
+        return None, None, None
+    patterns = (_FCST_DATE, _FCST_TIME, _FCST_VALUE)
+    found = [pattern.search(buf, start, stop) for pattern in patterns]
+    if not all(found):
+        return None, None, None
+    return tuple(m.group(1) for m in found)
+
+
+class StreamingForecastParser:
+    """청크 단위 KMA 응답 파서
+
+    Example:
+        parser = StreamingForecastParser("20260123")
+        async for chunk in response.content.iter_chunked(65536):
+            parser.feed(chunk)
+        forecast = parser.close()
+        if parser.result_code != "00": ...
+    """
+
+    def __init__(
+        self,
+        target_date: str,
+        now_hour: Optional[str] = None,
+        categories: FrozenSet[str] = WANTED_CATEGORIES,
+    ):
+        self._builder = ForecastBuilder(target_date, now_hour)
+        self._item = (
+            _DEFAULT_ITEM if categories == WANTED_CATEGORIES else _item_pattern(categories)
+        )
+        self._buffer = b""
+        self.result_code: Optional[str] = None
+        self.result_msg: Optional[str] = None
+        self.items_kept = 0
+
+    def feed(self, chunk: bytes) -> None:
+        buf = self._buffer + chunk if self._buffer else chunk
+
+        # 마지막 '}'까지만 검사하고, 그 뒤(청크 경계에 걸친 미완성 item)는 다음 청크와 이어 붙임
+        end = buf.rfind(b"}") + 1
+        self._buffer = buf[end:]
+
+        # header는 items보다 앞에 오므로 결과 코드를 찾을 때까지만 검사
+        if self.result_code is None:
+            code = _RESULT_CODE.search(buf, 0, end)
+            if code is not None:
+                self.result_code = code.group(1).decode()
+                msg = _RESULT_MSG.search(buf, code.end(), end)
+                self.result_msg = msg.group(1).decode() if msg else None
+
+        add = self._builder.add
+        kept = 0
+        for match in self._item.finditer(buf, 0, end):
+            cat, fcst_date, fcst_time, val = match.groups()
+            if val is None:
+                fcst_date, fcst_time, val = _unordered_fields(buf, match, end)
+                if val is None:
+                    continue
+            add(cat.decode(), fcst_date.decode(), fcst_time.decode(), val.decode())
+            kept += 1
+        self.items_kept += kept
+
+    def close(self) -> DailyForecast:
+        self._buffer = b""
+        return self._builder.forecast
+
+    @property
+    def forecast(self) -> DailyForecast:
+        return self._builder.forecast
+
+
+def parse_forecast_bytes(
+    chunks: Iterable[bytes], target_date: str, now_hour: Optional[str] = None
+) -> StreamingForecastParser:
+    """동기 청크 이터러블(또는 bytes 목록)을 끝까지 파싱한 파서를 반환"""
+    parser = StreamingForecastParser(target_date, now_hour)
+    for chunk in chunks:
+        parser.feed(chunk)
+    parser.close()
+    return parser
+
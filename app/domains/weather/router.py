@@ -1,9 +1,13 @@
+from datetime import datetime, timezone
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
+from app.core.config import Config
 from app.database import SessionLocal
+from app.utils.http_cache import ConditionalGet, conditional_get, make_etag
+from .cache import next_cache_expiry
 from .service import weather_service
 from .schema import DailyWeatherResponse
-from app.core.regions import get_nearest_region
+from app.batch import run_daily_weather_batch, run_intraday_weather_refresh
 
 router = APIRouter()
 
@@ -21,15 +25,14 @@ async def get_today_summary(
     lat: float = Query(..., description="위도"),
     lon: float = Query(..., description="경도"),
     db: Session = Depends(get_db),
+    http_cache: ConditionalGet = Depends(conditional_get),
 ):
-    # 1. 가장 가까운 지역 찾기
-    region_name, region_data = get_nearest_region(lat, lon)
-    nx = region_data["nx"]
-    ny = region_data["ny"]
+    # 1. 좌표 -> 조회 격자 정규화 (WEATHER_GRID_POLICY)
+    cell = weather_service.canonicalizer.canonicalize(lat, lon)
 
-    # 2. 날씨 데이터 조회 (Region 이름으로 캐싱/조회)
+    # 2. 날씨 데이터 조회 (정규화된 격자로 캐싱/조회)
     weather_data, msg = await weather_service.get_daily_weather_summary(
-        db, nx, ny, region_name
+        db, cell.nx, cell.ny, cell.region
     )
 
     if not weather_data:
@@ -39,14 +42,51 @@ async def get_today_summary(
             detail=f"오늘 기상 정보가 아직 준비되지 않았습니다. (02:15 이후 시도) - 상세: {msg}",
         )
 
+    # 3. 조건부 GET: 클라이언트가 같은 버전을 가지고 있으면 본문 없이 304
+    # (메모리 캐시 적중 시에는 세션이 커넥션을 잡지 않으므로 DB 왕복 없음)
+    etag = make_etag(
+        weather_data.base_date,
+        weather_data.nx,
+        weather_data.ny,
+        weather_data.updated_at,
+    )
+    if http_cache.prepare(
+        etag, weather_data.updated_at, max_age=_summary_max_age(weather_data)
+    ):
+        return http_cache.not_modified()
+
     # Pydantic 모델 변환을 위해 객체에 메시지 추가 (JIT 속성 주입)
     # SQLAlchemy 객체는 동적 속성 할당이 가능함
     weather_data.message = msg
     return weather_data
 
 
+def _summary_max_age(weather_data) -> int:
+    """다음 캐시 만료(KST 자정/재수집 슬롯)까지 초, 이전 예보는 갱신 전까지 짧게"""
+    now = datetime.now(timezone.utc)
+    expires_at = next_cache_expiry(now, weather_service.cache.align_to_refresh)
+    max_age = int((expires_at - now).total_seconds())
+    if getattr(weather_data, "is_stale", False):
+        max_age = min(max_age, int(Config.WEATHER_STALE_CACHE_TTL))
+    return max_age
+
+
 @router.get("/weather/batch")
 async def fetchAndLoadWeather(
+    force: bool = False,
+    db: Session = Depends(get_db),
+):
+    return await run_daily_weather_batch(db, force=force)
+
+
+@router.get("/weather/batch/intraday")
+async def refreshIntradayWeather(
     db: Session = Depends(get_db),
 ):
-    return await weather_service.fetchAndLoadWeather(db)
+    return await run_intraday_weather_refresh(db)
+
+
+@router.get("/weather/metrics")
+async def get_weather_metrics():
+    """날씨 도메인 운영 지표 (KMA HTTP 연결 재사용 등)"""
+    return weather_service.get_metrics()
@@ -9,5 +9,6 @@ class DailyWeatherResponse(BaseModel):
     rain_type: int
     message: str
     region: Optional[str] = None
+    is_stale: bool = False  # 오늘 예보 대신 최근 이전 예보를 제공 중
 
     model_config = ConfigDict(from_attributes=True)
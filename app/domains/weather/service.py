@@ -1,34 +1,83 @@
 import logging
 from datetime import datetime
-from typing import Tuple, Optional, Dict, Any
+from typing import Tuple, Optional, Dict, Any, List
 from sqlalchemy.orm import Session
-from .model import DailyWeather
+from .model import DailyWeather, DailyWeatherHourly
 from .client import KMAWeatherClient
-from .utils import dfs_xy_conv
+from .cache import KST, WeatherSummaryCache, kst_datetime, materialize, snapshot_of
+from .demand import GridDemandTracker
+from .canonical import GridCanonicalizer
+from .forecast import (
+    DailyForecast,
+    MORNING_HOUR,
+    EVENING_HOUR,
+    BASE_TIMES,
+    empty_hourly,
+    hourly_value,
+    latest_base_time,
+    merge_hourly,
+)
 import asyncio
+import random
+from app.core.config import Config
 from app.core.regions import KOREA_REGIONS
-from datetime import datetime, timedelta
+from app.database import SessionLocal
+from app.utils.singleflight import SingleFlight
+from app.utils.db_upsert import UpsertResult, bulk_upsert
+from datetime import datetime, timedelta, timezone
 
 logger = logging.getLogger(__name__)
 
+# daily_weather / daily_weather_hourly 공통 UNIQUE 키
+WEATHER_KEY = ("base_date", "nx", "ny")
+
+# KMA 강수형태(PTY) 코드
+RAIN_TYPE_LABELS = {1: "비", 2: "비/눈", 3: "눈", 4: "소나기"}
+
+
+def kst_now(now: Optional[datetime] = None) -> datetime:
+    """현재(또는 now) KST 시각. 호스트가 UTC여도 날짜/시각은 항상 KST 기준"""
+    return (now or datetime.now(timezone.utc)).astimezone(KST)
+
+
+def kst_today(now: Optional[datetime] = None) -> str:
+    """오늘 KST 날짜 (base_date 형식 YYYYMMDD). 날씨 읽기/쓰기 경로 공통"""
+    return kst_now(now).strftime("%Y%m%d")
+
 
 class WeatherService:
     def __init__(self):
         self.client = KMAWeatherClient()
+        self.cache = WeatherSummaryCache()
+        self._inflight = SingleFlight()
+        self.demand = GridDemandTracker()
+        self.canonicalizer = GridCanonicalizer()
+        # (base_date, nx, ny) -> 예약된 백그라운드 갱신 태스크
+        self._refresh_tasks: Dict[Tuple[str, int, int], asyncio.Task] = {}
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """캐시/KMA 호출 관련 운영 지표"""
+        return {
+            "kma_client": self.client.get_metrics(),
+            "summary_cache": self.cache.stats(),
+            "kma_single_flight": self._inflight.stats(),
+            "grid_demand": self.demand.stats(),
+            "grid_canonicalization": self.canonicalizer.stats(),
+            "scheduled_refreshes": len(self._refresh_tasks),
+        }
 
     async def fetchAndLoadWeather(self, db: Session):
         # 기상청 데이터는 02:10에 생성되므로, 02:16 실행 시 당일 데이터 조회
-        today_str = datetime.now().strftime("%Y%m%d")
+        # 호스트(Azure Functions)는 UTC이므로 날짜는 KST 기준 (17:16 UTC = 02:16 KST)
+        today_str = kst_today()
 
-        # 전국 17개 지역 정보
-        pending_regions = [
-            (region, value["nx"], value["ny"])
-            for region, value in KOREA_REGIONS.items()
-        ]
+        # 전국 17개 지역 + 최근 사용자 수요가 있는 격자
+        pending_regions = self._prefetch_targets(db)
 
         # 최대 3번 재시도
         max_retries = 3
-        all_weathers = {}  # region -> DailyWeather
+        all_weathers = {}  # (nx, ny) -> daily_weather 행 값
+        all_hourly = {}  # (nx, ny) -> daily_weather_hourly 행 값
 
         for attempt in range(1, max_retries + 1):
             if not pending_regions:
@@ -36,37 +85,36 @@ class WeatherService:
 
             tasks = []
             for region, nx, ny in pending_regions:
-                tasks.append(self.client.fetch_forecast(today_str, "0200", nx, ny, 168))
+                # 300행: 02시 발표 기준 당일 03~23시 전 카테고리(시간당 12개) 포함
+                tasks.append(
+                    self.client.fetch_daily_forecast(
+                        today_str, "0200", nx, ny, 300, require_summary=True
+                    )
+                )
 
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
             # 성공/실패 분류
             failed_regions = []
 
-            for (region, nx, ny), result in zip(pending_regions, results):
-                # 성공 여부 확인
-                if isinstance(result, Exception) or not result:
-                    failed_regions.append((region, nx, ny))
-                    continue
-
-                if result["response"]["header"]["resultCode"] != "00":
+            for (region, nx, ny), forecast in zip(pending_regions, results):
+                # 성공 여부 확인 (None = 네트워크 오류, resultCode != "00", 빈/불완전 예보)
+                if isinstance(forecast, Exception) or forecast is None:
                     failed_regions.append((region, nx, ny))
                     continue
 
-                # 성공: 데이터 파싱
-                items = result["response"]["body"]["items"]["item"]
-                # _parse_weather_data returns 4 values now (min, max, max_pty, current_pty)
-                min_val, max_val, max_rain_type, _ = self._parse_weather_data(items)
-
-                all_weathers[region] = DailyWeather(
+                all_weathers[(nx, ny)] = dict(
                     base_date=today_str,
                     base_time="0200",
                     nx=nx,
                     ny=ny,
                     region=region,
-                    min_temp=min_val,
-                    max_temp=max_val,
-                    rain_type=max_rain_type,
+                    min_temp=forecast.min_temp,
+                    max_temp=forecast.max_temp,
+                    rain_type=forecast.rain_type,
+                )
+                all_hourly[(nx, ny)] = self._hourly_values(
+                    today_str, "0200", nx, ny, forecast
                 )
 
             # 재시도할 지역 업데이트
@@ -78,129 +126,439 @@ class WeatherService:
                 await asyncio.sleep(wait_time)
 
         # 성공한 데이터 저장 (멱등성 보장: upsert 방식)
-        total = len(KOREA_REGIONS)
+        total = len(all_weathers) + len(pending_regions)
         success = len(all_weathers)
         failed = total - success
 
+        daily_result = hourly_result = UpsertResult()
         if success > 0:
-            # 기존 데이터 일괄 조회 (nx, ny 기반 매칭을 위해 base_date 기준 전체 로드)
-            existing_records = (
-                db.query(DailyWeather).filter(DailyWeather.base_date == today_str).all()
-            )
-            # lookup dict: (nx, ny) -> record
-            lookup = {(r.nx, r.ny): r for r in existing_records}
-
-            for region, weather_data in all_weathers.items():
-                existing = lookup.get((weather_data.nx, weather_data.ny))
-
-                if existing:
-                    # 업데이트 (메모리상 객체 수정)
-                    existing.region = weather_data.region
-                    existing.min_temp = weather_data.min_temp
-                    existing.max_temp = weather_data.max_temp
-                    existing.rain_type = weather_data.rain_type
-                else:
-                    # 삽입
-                    db.add(weather_data)
+            # DB와 메모리 캐시가 같은 updated_at(ETag 기준)을 갖도록 저장 시각을 직접 지정
+            written_at = datetime.now(timezone.utc)
+            for values in all_weathers.values():
+                values["updated_at"] = written_at
 
+            # INSERT ... ON CONFLICT (base_date, nx, ny) DO UPDATE 한 번의 왕복으로 저장
             try:
+                daily_result = bulk_upsert(
+                    db, DailyWeather, list(all_weathers.values()), WEATHER_KEY
+                )
+                hourly_result = bulk_upsert(
+                    db, DailyWeatherHourly, list(all_hourly.values()), WEATHER_KEY
+                )
                 db.commit()
             except Exception as e:
                 db.rollback()
                 raise Exception(f"DB commit failed: {str(e)}")
 
+            for values in all_weathers.values():
+                self.cache.put(DailyWeather(**values))
+
         # 결과 반환
         if failed > 0:
             failed_region_names = [r for r, _, _ in pending_regions]
             # 일부만 성공 - 경고 로그 (Exception 발생 안 함)
             return {
                 "status": "partial_success",
+                "base_date": today_str,
                 "total": total,
                 "success": success,
                 "failed": failed,
                 "failed_regions": failed_region_names,
+                "daily": daily_result.to_dict(),
+                "hourly": hourly_result.to_dict(),
                 "message": f"Saved {success}/{total} regions. Failed: {failed_region_names}",
             }
         else:
             # 전부 성공
             return {
                 "status": "success",
+                "base_date": today_str,
                 "total": total,
                 "success": success,
                 "failed": 0,
+                "daily": daily_result.to_dict(),
+                "hourly": hourly_result.to_dict(),
                 "message": f"All {total} regions saved successfully",
             }
 
+    async def refresh_intraday(
+        self, db: Session, now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        당일 후속 발표분(0500~2000)으로 오늘 이미 수집된(warm) 격자를 갱신합니다.
+
+        새 발표분의 시간별 값을 기존 배열 위에 병합하고, 일 요약(TMX, 최대 PTY)을 다시 계산한 뒤
+        값이 실제로 바뀐 격자만 upsert합니다. 바뀐 격자의 메모리 캐시는 즉시 무효화하며,
+        다른 인스턴스의 캐시는 재수집 슬롯에 맞춘 만료 시각(cache.next_cache_expiry)에 갱신됩니다.
+        """
+        now_kst = kst_now(now)
+        today_str = kst_today(now_kst)
+        base_time = latest_base_time(now_kst)
+
+        # 0200 발표분은 일 배치, 2300 발표분은 다음 날 예보이므로 대상 아님
+        if base_time is None or base_time in (BASE_TIMES[0], BASE_TIMES[-1]):
+            return {
+                "status": "skipped",
+                "base_time": base_time,
+                "message": "No intraday base time to apply",
+            }
+
+        daily_rows = {
+            (r.nx, r.ny): r
+            for r in db.query(DailyWeather).filter_by(base_date=today_str).all()
+        }
+        hourly_rows = {
+            (r.nx, r.ny): r
+            for r in db.query(DailyWeatherHourly).filter_by(base_date=today_str).all()
+        }
+        cells = list(daily_rows)
+
+        # 호출 속도/동시성은 KMA 클라이언트의 RateLimiter가 제한
+        results = await asyncio.gather(
+            *(
+                self.client.fetch_daily_forecast(
+                    today_str, base_time, nx, ny, 300, target_date=today_str
+                )
+                for nx, ny in cells
+            ),
+            return_exceptions=True,
+        )
+
+        daily_updates, hourly_updates, failed = [], [], []
+        for (nx, ny), forecast in zip(cells, results):
+            if isinstance(forecast, Exception) or forecast is None:
+                failed.append((nx, ny))
+                continue
+
+            daily = daily_rows[(nx, ny)]
+            hourly = hourly_rows.get((nx, ny))
+            old_hourly = hourly.to_hourly() if hourly else empty_hourly()
+            merged = merge_hourly(old_hourly, forecast.hourly)
+
+            pty = [v for v in merged["PTY"] if v is not None]
+            new_daily = {
+                # 후속 발표분에는 당일 TMN이 없고, 15시 이후 발표분에는 당일 TMX도 없음
+                "min_temp": (
+                    forecast.min_temp
+                    if forecast.min_temp is not None
+                    else daily.min_temp
+                ),
+                "max_temp": (
+                    forecast.max_temp
+                    if forecast.max_temp is not None
+                    else daily.max_temp
+                ),
+                "rain_type": max(pty) if pty else daily.rain_type,
+            }
+            key = dict(base_date=today_str, base_time=base_time, nx=nx, ny=ny)
+
+            if any(getattr(daily, k) != v for k, v in new_daily.items()):
+                daily_updates.append(dict(key, region=daily.region, **new_daily))
+            if merged != old_hourly:
+                hourly_updates.append(
+                    dict(key, **{cat.lower(): merged[cat] for cat in merged})
+                )
+
+        try:
+            bulk_upsert(
+                db,
+                DailyWeather,
+                daily_updates,
+                WEATHER_KEY,
+                update_columns=["base_time", "min_temp", "max_temp", "rain_type"],
+            )
+            bulk_upsert(db, DailyWeatherHourly, hourly_updates, WEATHER_KEY)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            raise Exception(f"DB commit failed: {str(e)}")
+
+        changed = {(r["nx"], r["ny"]) for r in daily_updates + hourly_updates}
+        for nx, ny in changed:
+            self.cache.invalidate(today_str, nx, ny)
+
+        return {
+            "status": "partial_success" if failed else "success",
+            "base_time": base_time,
+            "cells": len(cells),
+            "changed_daily": len(daily_updates),
+            "changed_hourly": len(hourly_updates),
+            "unchanged": len(cells) - len(failed) - len(changed),
+            "failed": len(failed),
+            "message": f"Applied {base_time} forecast: {len(changed)}/{len(cells)} cells changed",
+        }
+
+    def _prefetch_targets(self, db: Session) -> List[Tuple[str, int, int]]:
+        """배치 수집 대상 (지역명, nx, ny) 목록. 같은 격자는 한 번만 포함"""
+        targets = {
+            (value["nx"], value["ny"]): region for region, value in KOREA_REGIONS.items()
+        }
+
+        # 다른 인스턴스 수요는 이미 DB에 있고, 이 인스턴스의 미반영분만 먼저 flush
+        self.demand.flush()
+        try:
+            for nx, ny, region, _ in self.demand.hot_cells(db):
+                targets.setdefault((nx, ny), region or f"grid {nx},{ny}")
+            self.demand.prune(db)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to load weather grid demand: {e}")
+
+        return [(region, nx, ny) for (nx, ny), region in targets.items()]
+
     async def get_daily_weather_summary(
         self, db: Session, nx: int, ny: int, region: Optional[str] = None
     ) -> Tuple[Optional[DailyWeather], str]:
         """
         오늘 데이터가 DB에 없으면 KMA에서 가져와 저장하고 반환합니다.
+        조회 순서: 프로세스 메모리 캐시 -> DB -> (이전 예보 + 백그라운드 갱신) -> KMA
+
+        WEATHER_SERVE_STALE이 켜져 있으면 오늘 예보가 아직 없을 때(02:10 발표 전, KMA 장애)
+        최근 이전 예보를 `is_stale=True`로 즉시 반환하고, 발표 이후 백그라운드에서 갱신합니다.
+        이전 예보도 없는 격자만 요청 경로에서 KMA를 호출합니다.
         """
+        today_str = kst_today()
+
+        # 배치 사전 수집 대상 선정을 위한 격자 수요 기록 (메모리 집계, 주기적 flush)
+        self.demand.record(nx, ny, region)
+        self.demand.flush_if_due()
+
+        # 0. 메모리 캐시 조회 (DB 왕복 생략)
+        memory_cached = self.cache.get(today_str, nx, ny)
+        if memory_cached:
+            return memory_cached, "Memory Cached"
+
         # 1. DB 조회
-        today_str = datetime.now().strftime("%Y%m%d")
         cached = (
             db.query(DailyWeather).filter_by(base_date=today_str, nx=nx, ny=ny).first()
         )
 
         if cached:
+            self.cache.put(cached)
             return cached, "DB Cached"
 
-        # 2. KMA 요청
+        # 2. 이전 예보 즉시 반환 + 백그라운드 갱신 (stale-while-revalidate)
+        if Config.WEATHER_SERVE_STALE:
+            stale = self._latest_prior(db, today_str, nx, ny)
+            if stale is not None:
+                self._schedule_refresh(today_str, nx, ny, region)
+                stale_obj = materialize(snapshot_of(stale))
+                stale_obj.is_stale = True
+                # 갱신 전까지 짧게만 보관 (갱신 성공 시 오늘 데이터로 덮어씀)
+                self.cache.put(
+                    stale_obj, key_date=today_str, ttl=Config.WEATHER_STALE_CACHE_TTL
+                )
+                return stale_obj, f"Stale ({stale.base_date} forecast, refreshing)"
+
+        # 3. KMA 요청
+        # 같은 (날짜, 격자)에 대한 동시 미스는 하나의 KMA 호출/INSERT로 병합하고,
+        # 나머지 요청은 그 결과를 기다립니다.
+        weather_obj, msg = await self._inflight.do(
+            (today_str, nx, ny),
+            lambda: self._fetch_and_store(db, today_str, nx, ny, region),
+        )
+        if weather_obj is None:
+            return None, msg
+
+        # 병합된 요청들이 같은 객체를 공유하지 않도록 사본 반환
+        return materialize(snapshot_of(weather_obj)), msg
+
+    def _latest_prior(
+        self, db: Session, today_str: str, nx: int, ny: int
+    ) -> Optional[DailyWeather]:
+        """격자의 가장 최근 이전 날짜 예보 (WEATHER_STALE_MAX_AGE_DAYS 이내)"""
+        oldest = (
+            datetime.strptime(today_str, "%Y%m%d")
+            - timedelta(days=Config.WEATHER_STALE_MAX_AGE_DAYS)
+        ).strftime("%Y%m%d")
+        return (
+            db.query(DailyWeather)
+            .filter(
+                DailyWeather.nx == nx,
+                DailyWeather.ny == ny,
+                DailyWeather.base_date < today_str,
+                DailyWeather.base_date >= oldest,
+            )
+            .order_by(DailyWeather.base_date.desc())
+            .first()
+        )
+
+    def _schedule_refresh(
+        self, today_str: str, nx: int, ny: int, region: Optional[str]
+    ) -> None:
+        """0200 발표분이 준비되는 시각 이후로 백그라운드 갱신 예약 (격자당 1개)"""
+        key = (today_str, nx, ny)
+        if key in self._refresh_tasks:
+            return
+
+        ready_at = kst_datetime(today_str, "0200") + timedelta(
+            minutes=Config.WEATHER_REFRESH_OFFSET_MIN
+        )
+        delay = (ready_at - datetime.now(ready_at.tzinfo)).total_seconds()
+        if delay > 0:
+            # 여러 격자가 같은 시각에 몰리지 않도록 분산
+            delay += random.uniform(0, 60)
+
+        task = asyncio.create_task(self._background_refresh(key, max(delay, 0.0), region))
+        self._refresh_tasks[key] = task
+        task.add_done_callback(lambda _: self._refresh_tasks.pop(key, None))
+
+    async def _background_refresh(
+        self, key: Tuple[str, int, int], delay: float, region: Optional[str]
+    ) -> None:
+        """요청 세션과 분리된 세션으로 오늘 예보를 가져와 저장/캐시"""
+        if delay:
+            await asyncio.sleep(delay)
+
+        today_str, nx, ny = key
+        db = SessionLocal()
+        try:
+            # 배치나 다른 인스턴스가 이미 저장했으면 KMA 호출 없이 캐시만 갱신
+            stored = (
+                db.query(DailyWeather)
+                .filter_by(base_date=today_str, nx=nx, ny=ny)
+                .first()
+            )
+            if stored:
+                self.cache.put(stored)
+                return
+
+            weather_obj, msg = await self._inflight.do(
+                key, lambda: self._fetch_and_store(db, today_str, nx, ny, region)
+            )
+            if weather_obj is None:
+                logger.warning(f"Background weather refresh failed {key}: {msg}")
+        except Exception as e:
+            logger.error(f"Background weather refresh error {key}: {e}")
+        finally:
+            db.close()
+
+    async def cancel_background_refreshes(self) -> None:
+        """예약된 백그라운드 갱신 취소 (앱 종료 시)"""
+        tasks = list(self._refresh_tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _fetch_and_store(
+        self, db: Session, today_str: str, nx: int, ny: int, region: Optional[str]
+    ) -> Tuple[Optional[DailyWeather], str]:
+        """KMA에서 오늘 예보를 가져와 daily_weather에 저장 (single-flight 리더 전용)"""
         # 02:00 데이터가 가장 안정적 (Min/Max 포함)
-        data = await self.client.fetch_forecast(today_str, "0200", nx, ny, 300)
+        forecast = await self.client.fetch_daily_forecast(
+            today_str, "0200", nx, ny, 300, require_summary=True
+        )
 
-        if not data or data["response"]["header"]["resultCode"] != "00":
+        if forecast is None:
             # 02:00 실패 시 전날 23:00 등 시도할 수도 있지만,
             # 여기서는 간단히 실패 처리 or "아직 생성 안됨"
             return None, "API Error or No Data"
 
-        items = data["response"]["body"]["items"]["item"]
-        min_val, max_val, rain_type, current_rain_type = self._parse_weather_data(items)
-
-        # 3. 저장 (DB 오류가 나도 데이터는 반환하도록 예외 처리)
-        weather_obj = DailyWeather(
+        values = dict(
             base_date=today_str,
             base_time="0200",
             nx=nx,
             ny=ny,
             region=region,
-            min_temp=min_val,
-            max_temp=max_val,
-            rain_type=rain_type,
+            min_temp=forecast.min_temp,
+            max_temp=forecast.max_temp,
+            rain_type=forecast.rain_type,
+            updated_at=datetime.now(timezone.utc),
         )
 
+        # 3. 저장 (DB 오류가 나도 데이터는 반환하도록 예외 처리)
+        # 다른 인스턴스가 먼저 저장했을 수 있으므로 uix_daily_weather 충돌은 무시
         msg = "Fetched from KMA"
+        saved = False
         try:
-            db.add(weather_obj)
+            result = bulk_upsert(
+                db, DailyWeather, [values], WEATHER_KEY, update_columns=[]
+            )
+            bulk_upsert(
+                db,
+                DailyWeatherHourly,
+                [self._hourly_values(today_str, "0200", nx, ny, forecast)],
+                WEATHER_KEY,
+                update_columns=[],
+            )
             db.commit()
-            db.refresh(weather_obj)
-            msg += " (Saved to DB)"
+            saved = True
+            msg += " (Saved to DB)" if result.inserted else " (Already in DB)"
         except Exception as e:
             # DB 연결/저장 실패 시 롤백 및 로그 출력
             db.rollback()
             print(f"Failed to save weather data to DB: {e}")
             msg += f" (DB Save Failed: {str(e)})"
 
+        weather_obj = None
+        if saved and not result.inserted:
+            # 다른 인스턴스가 먼저 저장한 행을 그대로 사용
+            # (자체 값/updated_at을 쓰면 인스턴스마다 ETag/Last-Modified가 달라짐)
+            weather_obj = (
+                db.query(DailyWeather)
+                .filter_by(base_date=today_str, nx=nx, ny=ny)
+                .first()
+            )
+        if weather_obj is None:
+            weather_obj = DailyWeather(**values)
         # JIT inject current_rain_type (DB에는 없지만 API 응답에는 포함)
-        weather_obj.current_rain_type = current_rain_type
+        weather_obj.current_rain_type = forecast.current_rain_type
+
+        # DB 저장까지 성공한 경우에만 캐시 (실패는 캐시하지 않음)
+        if saved:
+            self.cache.put(weather_obj)
 
         return weather_obj, msg
 
+    def get_hourly_forecast(
+        self, db: Session, nx: int, ny: int, base_date: Optional[str] = None
+    ) -> Optional[DailyWeatherHourly]:
+        """격자의 하루치 시간별 예보 (단일 행 조회)"""
+        base_date = base_date or kst_today()
+        return (
+            db.query(DailyWeatherHourly)
+            .filter_by(base_date=base_date, nx=nx, ny=ny)
+            .first()
+        )
+
+    def _cached_hourly(
+        self, db: Session, weather: DailyWeather
+    ) -> Dict[str, List[Optional[float]]]:
+        """
+        요약과 같은 캐시 항목에 보관한 시간별 배열 (없으면 DB 단일 행 조회 후 보관)
+
+        이전 예보(stale)는 오늘 키로 캐시되므로 같은 키를 사용합니다.
+        시간별 행이 없으면 {}를 보관하여 반복 조회하지 않습니다.
+        """
+        nx, ny = weather.nx, weather.ny
+        is_stale = getattr(weather, "is_stale", False)
+        key_date = kst_today() if is_stale else weather.base_date
+        hourly = self.cache.get_hourly(key_date, nx, ny)
+        if hourly is None:
+            row = self.get_hourly_forecast(db, nx, ny, weather.base_date)
+            hourly = row.to_hourly() if row else {}
+            self.cache.put_hourly(key_date, nx, ny, hourly)
+        return hourly
+
+    @staticmethod
+    def _hourly_values(
+        base_date: str, base_time: str, nx: int, ny: int, forecast: DailyForecast
+    ) -> Dict[str, Any]:
+        values = dict(base_date=base_date, base_time=base_time, nx=nx, ny=ny)
+        for cat, hours in forecast.hourly.items():
+            values[cat.lower()] = hours
+        return values
+
     async def get_weather_info(
         self, db: Session, lat: float, lon: float
     ) -> Dict[str, Any]:
         """
         코디 추천 엔진에서 사용하기 위한 날씨 정보 간편 반환 함수
         """
-        from app.core.regions import get_nearest_region
-
-        # 1. 좌표 변환 (lat, lon -> nx, ny)
-        grid = dfs_xy_conv("toGRID", lat, lon)
-        nx, ny = int(grid.get("x", 60)), int(grid.get("y", 127))
-
-        # 2. 가장 가까운 지역명 가져오기
-        region_name, _ = get_nearest_region(lat, lon)
+        # 1. 좌표 -> 조회 격자 정규화 (/today/summary와 동일한 정책)
+        cell = self.canonicalizer.canonicalize(lat, lon)
+        nx, ny, region_name = cell.nx, cell.ny, cell.region
 
         try:
             # 3. 데이터 조회 (DB 또는 API)
@@ -216,6 +574,7 @@ class WeatherService:
                 summary = (
                     f"{weather_obj.region or '현위치'} 기온 {min_temp}°C ~ {max_temp}°C"
                 )
+                is_stale = getattr(weather_obj, "is_stale", False)
                 if max_temp >= 24:
                     summary += " (여름 날씨)"
                 elif max_temp <= 12:
@@ -223,11 +582,33 @@ class WeatherService:
                 else:
                     summary += " (선선한 날씨)"
 
+                # 아침/저녁 기온, 현재 강수 (시간별 예보가 있을 때만)
+                # 시간별 배열은 당일 재수집으로 갱신되므로 요청 시각 기준 값을 사용
+                temp_morning = temp_evening = current_rain_type = None
+                hourly = self._cached_hourly(db, weather_obj)
+                if hourly:
+                    temp_morning = hourly_value(hourly, "TMP", MORNING_HOUR)
+                    temp_evening = hourly_value(hourly, "TMP", EVENING_HOUR)
+                    if not is_stale:
+                        current_rain_type = hourly_value(
+                            hourly, "PTY", kst_now().hour
+                        )
+                if temp_morning is not None and temp_evening is not None:
+                    summary += f", 아침 {temp_morning:g}°C / 저녁 {temp_evening:g}°C"
+                if current_rain_type:
+                    summary += f", 현재 {RAIN_TYPE_LABELS.get(current_rain_type, '강수')}"
+                if is_stale:
+                    summary += " (이전 예보 기준)"
+
                 return {
                     "summary": summary,
                     "temp_min": min_temp,
                     "temp_max": max_temp,
+                    "temp_morning": temp_morning,
+                    "temp_evening": temp_evening,
                     "region": region_name,
+                    "current_rain_type": current_rain_type,
+                    "is_stale": is_stale,
                 }
         except Exception as e:
             logger.error(f"Error in get_weather_info: {e}", exc_info=True)
@@ -239,37 +620,6 @@ class WeatherService:
             "region": region_name,
         }
 
-    def _parse_weather_data(
-        self, items: list
-    ) -> Tuple[Optional[float], Optional[float], int, Optional[int]]:
-        min_val = None
-        max_val = None
-        max_rain_type = 0
-        current_rain_type = 0
-
-        # 현재 시간 (HH00) 구하기
-        now_hour_str = datetime.now().strftime("%H00")
-
-        for item in items:
-            cat = item["category"]
-            val = item["fcstValue"]
-            fcst_time = item["fcstTime"]
-
-            if cat == "TMN":
-                min_val = float(val)
-            elif cat == "TMX":
-                max_val = float(val)
-            elif cat == "PTY":
-                rain_val = int(val)
-                if rain_val > max_rain_type:
-                    max_rain_type = rain_val
-
-                # 현재 시각의 강수 형태
-                if fcst_time == now_hour_str:
-                    current_rain_type = rain_val
-
-        return min_val, max_val, max_rain_type, current_rain_type
-
 
 # Singleton Instance
 weather_service = WeatherService()
@@ -5,6 +5,9 @@ def dfs_xy_conv(code, v1, v2):
     """
     LCC DFS 좌표변환 (Global version)
     code: "toGRID"(위경도->좌표, v1:lat, v2:lon), "toLL"(좌표->위경도, v1:x, v2:y)
+
+    NOTE: 호출마다 투영 상수를 다시 계산하는 레거시 dict API입니다.
+    새 코드는 상수를 사전 계산하는 `grid.latlon_to_grid` / `grid.lcc_grid`를 사용하세요.
     """
     RE = 6371.00877  # 지구 반경(km)
     GRID = 5.0  # 격자 간격(km)
@@ -85,7 +85,7 @@ def save_todays_pick_to_db(
     return new_pick
 
 
-def recommend_todays_pick_v2(
+async def recommend_todays_pick_v2(
     user_id: UUID, weather: Dict, db: Session, context: Optional[str] = None
 ) -> Dict:
     """
@@ -127,7 +127,7 @@ def recommend_todays_pick_v2(
                 f"Selected items not found in wardrobe: top={recommendation['top_id']}, bottom={recommendation['bottom_id']}"
             )
 
-        image_url = generate_todays_pick_composite(top_item, bottom_item, user, db)
+        image_url = await generate_todays_pick_composite(top_item, bottom_item, user, db)
 
         # If generation failed, handle it
         if not image_url:
@@ -1,5 +1,6 @@
 import os
 import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
@@ -51,15 +52,45 @@ from app.domains.user.model import User
 from app.domains.wardrobe.model import ClosetItem
 from app.domains.outfit.model import OutfitLog, OutfitItem
 from app.domains.chat.models import ChatSession, ChatMessage
-from app.domains.weather.model import DailyWeather
+from app.domains.weather.model import (
+    DailyWeather,
+    DailyWeatherHourly,
+    WeatherGridDemand,
+)
+from app.batch.model import BatchRun
+from app.domains.extraction.model import ExtractionCacheEntry
 from app.domains.recommendation.model import TodaysPick
 from app.domains.auth.router import router as auth_router
 
 HAS_DB = True
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    앱 수명주기 훅
+    Azure Functions(AsgiFunctionApp)도 ASGI lifespan 이벤트를 전달하므로 동일하게 동작합니다.
+    """
+    from app.domains.weather.service import weather_service
+    from app.utils.blob_storage import close_blob_storage_service
+    from app.utils.thumbnails import thumbnail_pool
+
+    await weather_service.client.start()
+    try:
+        yield
+    finally:
+        # 아직 DB에 반영하지 않은 격자 수요 집계 flush
+        weather_service.demand.flush()
+        await weather_service.cancel_background_refreshes()
+        await weather_service.client.close()
+        thumbnail_pool.shutdown()
+        await close_blob_storage_service()
+
+
 def create_app() -> FastAPI:
-    app = FastAPI(title="Clothing Attribute Extractor", version="1.0.0")
+    app = FastAPI(
+        title="Clothing Attribute Extractor", version="1.0.0", lifespan=lifespan
+    )
 
     # 데이터베이스 초기화 (파일이 존재할 때만)
     if HAS_DB:
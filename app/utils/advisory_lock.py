@@ -0,0 +1,59 @@
+"""
+PostgreSQL advisory lock 기반 리더 선출
+스케일 아웃된 여러 인스턴스가 같은 타이머 트리거를 동시에 실행하더라도
+락을 얻은 한 인스턴스만 작업을 수행하도록 합니다.
+"""
+
+import hashlib
+import logging
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+
+def lock_key(name: str) -> int:
+    """락 이름 -> pg_advisory_lock용 signed 64bit 키 (프로세스/인스턴스 간 동일)"""
+    digest = hashlib.blake2b(name.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+@contextmanager
+def advisory_lock(engine: Engine, name: str) -> Iterator[bool]:
+    """
+    세션 수준 advisory lock을 non-blocking으로 시도합니다.
+
+    ORM 세션의 트랜잭션(commit/rollback)과 무관하게 락을 유지하도록 전용 커넥션을 사용하며,
+    블록을 벗어나면 락을 해제하고 커넥션을 풀에 반환합니다.
+    (프로세스가 비정상 종료되어 커넥션이 끊기면 PostgreSQL이 락을 자동 해제)
+
+    Example:
+        with advisory_lock(engine, "batch:daily_weather") as acquired:
+            if not acquired:
+                return  # 다른 인스턴스가 실행 중
+            ...
+    """
+    key = lock_key(name)
+    conn = engine.connect()
+    acquired = False
+    try:
+        acquired = bool(
+            conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": key}).scalar()
+        )
+        # 락 획득 쿼리가 연 트랜잭션은 바로 종료 (세션 수준 락은 유지됨)
+        conn.commit()
+        yield acquired
+    finally:
+        try:
+            if acquired:
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to release advisory lock {name}: {e}")
+            # 해제 실패 시 커넥션을 폐기해야 락이 풀에 남지 않음
+            conn.invalidate()
+        finally:
+            conn.close()
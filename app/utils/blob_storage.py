@@ -1,69 +1,331 @@
 """
 Azure Blob Storage 서비스
-이미지를 Azure Blob Storage에 저장하고 관리합니다.
+이미지를 Azure Blob Storage에 저장하고 관리하는 단일 창구(facade)입니다.
+옷장/마네킹/생성 이미지 등 모든 blob 사용처는 이 서비스(`get_storage`)를 통해 접근합니다.
+
+- 비동기 경로: `azure.storage.blob.aio` 클라이언트 하나(aiohttp 연결 풀)를 프로세스 전체가 공유
+- 동기 경로(레거시 목록 라우트, 배치 CLI): 동기 클라이언트 하나를 첫 사용 시 생성하여 공유
+- 컨테이너 존재 확인은 컨테이너별로 프로세스당 한 번, 첫 업로드 시에만 수행 (생성자에서 네트워크 호출 없음)
+- AZURE_BLOB_LAYOUT=content: 이미지를 내용 해시 이름(`objects/{sha256[:2]}/{sha256}{ext}`)으로
+  한 번만 업로드하고 `Cache-Control: immutable`을 붙여 CDN/클라이언트 캐시가 재사용하도록 함
+- 업로드/다운로드/서명 등 작업별 호출 수, 실패 수, 소요 시간을 `stats()`로 제공
+
+클라이언트는 앱 종료 시(lifespan) `close_blob_storage_service()`로 정리됩니다.
 """
 
 import os
+import threading
+import time
 import uuid
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime
-from typing import Optional
-from azure.storage.blob import (
-    BlobServiceClient,
-    BlobClient,
-    ContainerClient,
-    ContentSettings,
-)
-from azure.core.exceptions import AzureError
+from typing import Any, Dict, Iterator, List, Optional, Set
+from urllib.parse import quote
+from azure.storage.blob import BlobServiceClient as SyncBlobServiceClient
+from azure.storage.blob import ContainerClient, ContentSettings
+from azure.storage.blob.aio import BlobServiceClient
+from azure.core.exceptions import AzureError, ResourceExistsError
 import logging
 
 from app.core.config import Config
+from app.utils.image_digest import image_sha256_async
+from app.utils.sas_signer import sas_signer
 from app.utils.validators import validate_file_extension
 
 logger = logging.getLogger(__name__)
 
+MB = 1024 * 1024
+
+LAYOUT_DATED = "dated"
+LAYOUT_CONTENT = "content"
+
+# 내용 해시 이름의 blob은 바뀌지 않으므로 캐시 만료 없이 재사용 가능
+IMMUTABLE_CACHE_CONTROL = (
+    f"public, max-age={Config.AZURE_BLOB_IMMUTABLE_MAX_AGE_SEC}, immutable"
+)
+
+CONTENT_TYPE_MAP = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+}
+
+
+def content_type_for(filename: str) -> str:
+    """확장자 기반 Content-Type 추정 (알 수 없으면 image/jpeg)"""
+    ext = os.path.splitext(filename or "")[1].lower()
+    return CONTENT_TYPE_MAP.get(ext, "image/jpeg")
+
+
+def content_blob_name(digest: str, ext: str) -> str:
+    """SHA-256 hex + 확장자 -> objects/{앞 2자}/{digest}{ext} (접두어로 이름 공간 분산)"""
+    return f"objects/{digest[:2]}/{digest}{ext}"
+
+
+class OperationMetrics:
+    """작업 하나(upload, download 등)의 호출 수/실패 수/소요 시간"""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, elapsed_ms: float, failed: bool) -> None:
+        self.calls += 1
+        self.errors += int(failed)
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / self.calls, 2) if self.calls else 0.0,
+            "max_ms": round(self.max_ms, 2),
+        }
+
 
 class BlobStorageService:
     """Azure Blob Storage를 사용하여 이미지를 저장하고 관리하는 서비스"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        upload_concurrency: int = Config.AZURE_BLOB_UPLOAD_CONCURRENCY,
+        block_size_mb: float = Config.AZURE_BLOB_BLOCK_SIZE_MB,
+        single_put_mb: float = Config.AZURE_BLOB_SINGLE_PUT_MB,
+        layout: str = Config.AZURE_BLOB_LAYOUT,
+    ):
         self.account_name = Config.AZURE_STORAGE_ACCOUNT_NAME
         self.account_key = Config.AZURE_STORAGE_ACCOUNT_KEY
         self.container_name = Config.AZURE_STORAGE_CONTAINER_NAME
+        self.upload_concurrency = upload_concurrency
+        self.block_size = int(block_size_mb * MB)
+        self.single_put_size = int(single_put_mb * MB)
+        self.layout = layout
+        self._client: Optional[BlobServiceClient] = None
+        self._sync_client: Optional[SyncBlobServiceClient] = None
+        self._ensured_containers: Set[str] = set()
+        self._metrics: Dict[str, OperationMetrics] = {}
+        self._immutable_skipped = 0
+        self._lock = threading.Lock()
 
-        if not self.account_name or not self.account_key:
-            # 로컬 개발 환경 등에서 설정을 건너뛸 수 있도록 로그만 남기고 pass 할 수도 있음
-            # 하지만 서비스 사용 시에는 필수
-            pass
+    @property
+    def account_url(self) -> str:
+        return f"https://{self.account_name}.blob.core.windows.net"
 
-        try:
-            if self.account_name and self.account_key:
-                account_url = f"https://{self.account_name}.blob.core.windows.net"
-                self.blob_service_client = BlobServiceClient(
-                    account_url=account_url, credential=self.account_key
+    @property
+    def enabled(self) -> bool:
+        return bool(self.account_name and self.account_key)
+
+    @property
+    def content_addressed(self) -> bool:
+        return self.layout == LAYOUT_CONTENT
+
+    @property
+    def blob_service_client(self) -> BlobServiceClient:
+        """공유 비동기 클라이언트 (첫 사용 시 생성, 네트워크 호출 없음)"""
+        if not self.enabled:
+            raise RuntimeError("Blob Storage not initialized")
+        if self._client is None:
+            self._client = BlobServiceClient(
+                account_url=self.account_url,
+                credential=self.account_key,
+                max_block_size=self.block_size,
+                max_single_put_size=self.single_put_size,
+            )
+        return self._client
+
+    def sync_container_client(
+        self, container: Optional[str] = None
+    ) -> ContainerClient:
+        """동기 경로 전용 컨테이너 클라이언트 (공유 동기 클라이언트, 네트워크 호출 없음)"""
+        if not self.enabled:
+            raise RuntimeError("Blob Storage not initialized")
+        with self._lock:
+            if self._sync_client is None:
+                self._sync_client = SyncBlobServiceClient(
+                    account_url=self.account_url, credential=self.account_key
                 )
-                self._ensure_container_exists()
-        except Exception as e:
-            logger.error(f"Failed to initialize Blob Storage client: {e}")
-            # raise # 초기화 실패 시 에러를 던질지 여부
+        return self._sync_client.get_container_client(
+            container or self.container_name
+        )
 
-    def _ensure_container_exists(self):
-        """컨테이너가 존재하는지 확인하고, 없으면 생성"""
+    def blob_url(self, blob_name: str, container: Optional[str] = None) -> str:
+        """blob 이름 -> URL (SAS 없음, 네트워크 호출 없음)"""
+        container = quote(container or self.container_name)
+        return f"{self.account_url}/{container}/{quote(blob_name, safe='~/')}"
+
+    async def ensure_container(self, container: Optional[str] = None) -> None:
+        """컨테이너가 없으면 생성 (프로세스당 컨테이너별 1회만 확인)"""
+        container = container or self.container_name
+        if container in self._ensured_containers:
+            return
         try:
-            container_client = self.blob_service_client.get_container_client(
-                self.container_name
-            )
-            if not container_client.exists():
-                container_client.create_container()
-                logger.info(f"Container '{self.container_name}' created successfully")
+            async with self._atimed("ensure_container"):
+                await self.blob_service_client.get_container_client(
+                    container
+                ).create_container()
+            logger.info(f"Container '{container}' created successfully")
+        except ResourceExistsError:
+            pass
         except AzureError as e:
             logger.error(f"Failed to ensure container exists: {e}")
             raise
+        self._ensured_containers.add(container)
+
+    async def upload_bytes(
+        self,
+        blob_name: str,
+        data: bytes,
+        content_type: str,
+        container: Optional[str] = None,
+        overwrite: bool = True,
+        cache_control: Optional[str] = None,
+    ) -> str:
+        """
+        bytes 업로드 -> blob URL (SAS 없음)
+
+        AZURE_BLOB_SINGLE_PUT_MB보다 큰 데이터는 AZURE_BLOB_BLOCK_SIZE_MB 블록으로 나누어
+        AZURE_BLOB_UPLOAD_CONCURRENCY개씩 병렬 업로드합니다.
+        """
+        await self.ensure_container(container)
+        blob_client = self.blob_service_client.get_blob_client(
+            container=container or self.container_name, blob=blob_name
+        )
+        async with self._atimed("upload"):
+            await blob_client.upload_blob(
+                data,
+                overwrite=overwrite,
+                content_settings=ContentSettings(
+                    content_type=content_type, cache_control=cache_control
+                ),
+                max_concurrency=self.upload_concurrency,
+            )
+        return blob_client.url
+
+    async def upload_immutable(
+        self,
+        data: bytes,
+        ext: str,
+        content_type: Optional[str] = None,
+        digest: Optional[str] = None,
+        container: Optional[str] = None,
+    ) -> str:
+        """
+        내용 해시 이름으로 업로드 -> blob URL (SAS 없음)
+
+        같은 내용의 blob이 이미 있으면 업로드하지 않습니다.
+        digest는 호출자가 이미 계산한 SHA-256 (없으면 여기서 계산)
+        """
+        blob_name = content_blob_name(digest or await image_sha256_async(data), ext)
+        if await self.exists(blob_name, container):
+            self._record_skip()
+            return self.blob_url(blob_name, container)
+        try:
+            return await self.upload_bytes(
+                blob_name,
+                data,
+                content_type or content_type_for(blob_name),
+                container=container,
+                overwrite=False,
+                cache_control=IMMUTABLE_CACHE_CONTROL,
+            )
+        except ResourceExistsError:
+            # exists 확인과 업로드 사이에 다른 요청이 같은 내용을 올린 경우
+            self._record_skip()
+            return self.blob_url(blob_name, container)
+
+    async def download_bytes(
+        self, blob_name: str, container: Optional[str] = None
+    ) -> bytes:
+        """blob 내용 다운로드 (없으면 ResourceNotFoundError)"""
+        blob_client = self.blob_service_client.get_blob_client(
+            container=container or self.container_name, blob=blob_name
+        )
+        async with self._atimed("download"):
+            stream = await blob_client.download_blob(
+                max_concurrency=self.upload_concurrency
+            )
+            return await stream.readall()
+
+    async def exists(self, blob_name: str, container: Optional[str] = None) -> bool:
+        blob_client = self.blob_service_client.get_blob_client(
+            container=container or self.container_name, blob=blob_name
+        )
+        async with self._atimed("exists"):
+            return await blob_client.exists()
+
+    def download_bytes_sync(
+        self, blob_name: str, container: Optional[str] = None
+    ) -> bytes:
+        """동기 경로용 다운로드 (배치 CLI, 동기 라우트)"""
+        blob_client = self.sync_container_client(container).get_blob_client(blob_name)
+        with self._timed("download_sync"):
+            return blob_client.download_blob().readall()
+
+    def list_blob_names_sync(self, container: Optional[str] = None) -> List[str]:
+        """동기 경로용 blob 목록 (레거시 전체 목록 라우트)"""
+        with self._timed("list_sync"):
+            return [b.name for b in self.sync_container_client(container).list_blobs()]
+
+    def sign_url(self, url: str) -> str:
+        """blob URL + 해당 blob 전용 읽기 SAS (단건 응답용, 캐시)"""
+        with self._timed("sign"):
+            return sas_signer.sign_url(url)
+
+    def sign_feed_url(self, url: str) -> str:
+        """blob URL + 공유 컨테이너 읽기 SAS (목록 응답용, 캐시)"""
+        with self._timed("sign_feed"):
+            return sas_signer.sign_feed_url(url)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            operations = {op: m.to_dict() for op, m in self._metrics.items()}
+        return {
+            "layout": self.layout,
+            "operations": operations,
+            "immutable_skipped": self._immutable_skipped,
+            "ensured_containers": sorted(self._ensured_containers),
+            "sas": sas_signer.stats(),
+        }
+
+    def _record(self, op: str, started: float, failed: bool) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self._metrics.setdefault(op, OperationMetrics()).record(elapsed_ms, failed)
+
+    def _record_skip(self) -> None:
+        with self._lock:
+            self._immutable_skipped += 1
+
+    @contextmanager
+    def _timed(self, op: str) -> Iterator[None]:
+        started = time.perf_counter()
+        failed = True
+        try:
+            yield
+            failed = False
+        finally:
+            self._record(op, started, failed)
+
+    @asynccontextmanager
+    async def _atimed(self, op: str):
+        started = time.perf_counter()
+        failed = True
+        try:
+            yield
+            failed = False
+        finally:
+            self._record(op, started, failed)
 
     def generate_blob_name(
         self, user_id: str, original_filename: Optional[str] = None
     ) -> str:
         """
-        Blob Storage에 저장할 파일명 생성
+        Blob Storage에 저장할 파일명 생성 (dated 레이아웃)
         형식: users/{user_id}/{yyyyMMdd}/{uuid}.{ext}
         """
         # 현재 날짜/시간
@@ -84,7 +346,7 @@ class BlobStorageService:
 
         return blob_name
 
-    def upload_image(
+    async def upload_image(
         self,
         image_bytes: bytes,
         user_id: str,
@@ -93,38 +355,31 @@ class BlobStorageService:
     ) -> dict:
         """
         이미지를 Azure Blob Storage에 업로드
+        content 레이아웃에서는 내용 해시 이름으로 저장 (item_id = SHA-256)
         """
         try:
-            # 파일명 생성
-            blob_name = self.generate_blob_name(user_id, original_filename)
-
-            # Blob 클라이언트 생성
-            blob_client = self.blob_service_client.get_blob_client(
-                container=self.container_name, blob=blob_name
-            )
+            if self.content_addressed:
+                ext = (
+                    validate_file_extension(original_filename)
+                    if original_filename
+                    else ".jpg"
+                )
+                digest = await image_sha256_async(image_bytes)
+                blob_name = content_blob_name(digest, ext)
+                blob_url = await self.upload_immutable(
+                    image_bytes, ext, content_type, digest=digest
+                )
+            else:
+                # 파일명 생성
+                blob_name = self.generate_blob_name(user_id, original_filename)
 
-            # Content-Type 설정
-            if not content_type:
-                # 확장자 기반으로 Content-Type 추정
-                ext = validate_file_extension(original_filename or blob_name)
-                content_type_map = {
-                    ".jpg": "image/jpeg",
-                    ".jpeg": "image/jpeg",
-                    ".png": "image/png",
-                    ".gif": "image/gif",
-                    ".webp": "image/webp",
-                }
-                content_type = content_type_map.get(ext.lower(), "image/jpeg")
-
-            # Blob 업로드
-            blob_client.upload_blob(
-                image_bytes,
-                overwrite=True,
-                content_settings=ContentSettings(content_type=content_type),
-            )
+                # Content-Type 설정 (없으면 확장자 기반으로 추정)
+                content_type = content_type or content_type_for(blob_name)
 
-            # Blob URL 생성
-            blob_url = blob_client.url
+                # Blob 업로드
+                blob_url = await self.upload_bytes(
+                    blob_name, image_bytes, content_type
+                )
 
             # Item ID는 파일명의 UUID만 사용
             file_uuid_with_ext = os.path.basename(blob_name)
@@ -141,6 +396,16 @@ class BlobStorageService:
             logger.error(f"Unexpected error during image upload: {e}")
             raise
 
+    async def close(self) -> None:
+        """공유 클라이언트(aiohttp 세션, 동기 연결 풀) 종료 (다음 사용 시 다시 생성)"""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.close()
+        with self._lock:
+            sync_client, self._sync_client = self._sync_client, None
+        if sync_client is not None:
+            sync_client.close()
+
 
 # 싱글톤 인스턴스
 _blob_storage_service: Optional[BlobStorageService] = None
@@ -152,3 +417,14 @@ def get_blob_storage_service() -> BlobStorageService:
     if _blob_storage_service is None:
         _blob_storage_service = BlobStorageService()
     return _blob_storage_service
+
+
+def get_storage() -> BlobStorageService:
+    """FastAPI 의존성: 공유 스토리지 서비스 (`storage = Depends(get_storage)`)"""
+    return get_blob_storage_service()
+
+
+async def close_blob_storage_service() -> None:
+    """앱 종료 시 공유 비동기 클라이언트 정리"""
+    if _blob_storage_service is not None:
+        await _blob_storage_service.close()
@@ -0,0 +1,93 @@
+"""
+PostgreSQL 일괄 upsert 헬퍼
+`INSERT ... ON CONFLICT (...) DO UPDATE ... RETURNING`을 한 번의 왕복으로 실행하고,
+행마다 신규 삽입/갱신 여부를 집계합니다.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+# PostgreSQL 바인드 파라미터 상한(65535)을 넘지 않도록 문장당 행 수 제한
+DEFAULT_CHUNK_SIZE = 1000
+
+
+@dataclass
+class UpsertResult:
+    inserted: int = 0
+    updated: int = 0
+    # RETURNING으로 돌려받은 행 (key 컬럼들 + inserted 여부)
+    rows: List[Tuple[Any, ...]] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated
+
+    def to_dict(self) -> Dict[str, int]:
+        return {"inserted": self.inserted, "updated": self.updated}
+
+
+def bulk_upsert(
+    db: Session,
+    model,
+    rows: Sequence[Dict[str, Any]],
+    index_elements: Sequence[str],
+    update_columns: Optional[Sequence[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> UpsertResult:
+    """
+    여러 행을 한 문장으로 upsert합니다. (commit은 호출자가 수행)
+
+    Args:
+        db: 데이터베이스 세션
+        model: SQLAlchemy 모델 클래스
+        rows: 컬럼명 -> 값 dict 목록 (모든 행이 같은 키를 가져야 함)
+        index_elements: 충돌 판정 컬럼 (UNIQUE 제약과 동일해야 함)
+        update_columns: 충돌 시 갱신할 컬럼.
+            None이면 키/PK를 제외한 전체, 빈 목록이면 DO NOTHING
+        chunk_size: 문장당 최대 행 수
+
+    Returns:
+        UpsertResult: inserted/updated 개수와 RETURNING 결과
+            (DO NOTHING인 경우 충돌 행은 반환되지 않으므로 updated는 항상 0)
+    """
+    result = UpsertResult()
+    if not rows:
+        return result
+
+    # 같은 키가 한 문장에 두 번 들어가면 PostgreSQL이 거부하므로 마지막 값만 유지
+    unique_rows = {tuple(row[name] for name in index_elements): row for row in rows}
+    rows = list(unique_rows.values())
+
+    table = model.__table__
+    if update_columns is None:
+        skip = set(index_elements) | {c.name for c in table.primary_key.columns}
+        update_columns = [c for c in rows[0] if c not in skip]
+
+    key_columns = [table.c[name] for name in index_elements]
+    # xmax = 0 이면 이번 문장에서 새로 삽입된 행 (갱신된 행은 xmax에 트랜잭션 ID가 기록됨)
+    inserted_flag = literal_column("(xmax = 0)").label("inserted")
+
+    for start in range(0, len(rows), chunk_size):
+        stmt = pg_insert(model).values(rows[start : start + chunk_size])
+        if update_columns:
+            set_ = {name: stmt.excluded[name] for name in update_columns}
+            if "updated_at" in table.c and "updated_at" not in set_:
+                # ON CONFLICT 경로에서는 onupdate가 동작하지 않으므로 직접 갱신
+                set_["updated_at"] = func.now()
+            stmt = stmt.on_conflict_do_update(index_elements=index_elements, set_=set_)
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=index_elements)
+
+        for row in db.execute(stmt.returning(*key_columns, inserted_flag)):
+            result.rows.append(tuple(row))
+            if row.inserted:
+                result.inserted += 1
+            else:
+                result.updated += 1
+
+    return result
@@ -0,0 +1,112 @@
+"""
+HTTP 조건부 GET 유틸 (ETag / Last-Modified / Cache-Control)
+하루 단위로 고정되는 조회 응답에 검증자와 캐시 수명을 붙이고,
+클라이언트가 가진 버전과 같으면 본문 없이 304 Not Modified를 반환합니다.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response
+
+
+def make_etag(*parts: Any) -> str:
+    """키 값들로 약한(weak) ETag 생성
+
+    응답 본문의 부가 필드(message 등)는 달라질 수 있으므로
+    의미상 같은 데이터임을 나타내는 약한 검증자를 사용합니다.
+    """
+    raw = "|".join("" if p is None else str(p) for p in parts)
+    digest = hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _opaque(tag: str) -> str:
+    # 약한 비교: W/ 접두사를 무시하고 opaque-tag만 비교
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def _http_date(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+class ConditionalGet:
+    """조회 엔드포인트용 조건부 GET 의존성
+
+    Example:
+        @router.get("/items/{item_id}")
+        async def get_item(item_id: int, http_cache: ConditionalGet = Depends(conditional_get)):
+            item = load(item_id)
+            if http_cache.prepare(make_etag(item.id, item.updated_at), item.updated_at, max_age=60):
+                return http_cache.not_modified()
+            return item
+    """
+
+    def __init__(self, request: Request, response: Response):
+        self.request = request
+        self.response = response
+        self.headers: Dict[str, str] = {}
+
+    def prepare(
+        self,
+        etag: str,
+        last_modified: Optional[datetime] = None,
+        max_age: Optional[int] = None,
+        public: bool = True,
+    ) -> bool:
+        """
+        응답 헤더(ETag, Last-Modified, Cache-Control)를 설정하고
+        요청의 검증자가 현재 버전과 일치하는지(304 가능 여부)를 반환합니다.
+
+        Args:
+            etag: make_etag()로 만든 현재 버전 ETag
+            last_modified: 데이터 최종 수정 시각
+            max_age: 클라이언트가 재검증 없이 사용할 수 있는 초 (None이면 no-cache)
+            public: 사용자와 무관한 응답이면 True (공유 캐시 허용)
+        """
+        self.headers = {"ETag": etag}
+        if last_modified is not None:
+            self.headers["Last-Modified"] = _http_date(last_modified)
+        scope = "public" if public else "private"
+        if max_age is None:
+            self.headers["Cache-Control"] = f"{scope}, no-cache"
+        else:
+            self.headers["Cache-Control"] = f"{scope}, max-age={max(int(max_age), 0)}"
+        self.response.headers.update(self.headers)
+        return self._matches(etag, last_modified)
+
+    def not_modified(self) -> Response:
+        """본문 없는 304 응답 (prepare에서 설정한 헤더 포함)"""
+        return Response(status_code=304, headers=self.headers)
+
+    def _matches(self, etag: str, last_modified: Optional[datetime]) -> bool:
+        # If-None-Match가 있으면 If-Modified-Since보다 우선 (RFC 9110)
+        if_none_match = self.request.headers.get("if-none-match")
+        if if_none_match is not None:
+            if if_none_match.strip() == "*":
+                return True
+            current = _opaque(etag)
+            return any(_opaque(tag) == current for tag in if_none_match.split(","))
+
+        if_modified_since = self.request.headers.get("if-modified-since")
+        if if_modified_since and last_modified is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            if last_modified.tzinfo is None:
+                last_modified = last_modified.replace(tzinfo=timezone.utc)
+            # HTTP 날짜는 초 단위
+            return last_modified.replace(microsecond=0) <= since
+        return False
+
+
+def conditional_get(request: Request, response: Response) -> ConditionalGet:
+    return ConditionalGet(request, response)
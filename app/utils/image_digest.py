@@ -0,0 +1,17 @@
+"""
+이미지 내용 해시
+같은 바이트의 재업로드를 찾기 위한 SHA-256 (closet_items.image_sha256)
+"""
+
+import asyncio
+import hashlib
+
+
+def image_sha256(image_bytes: bytes) -> str:
+    """이미지 bytes -> SHA-256 hex (64자)"""
+    return hashlib.sha256(image_bytes).hexdigest()
+
+
+async def image_sha256_async(image_bytes: bytes) -> str:
+    """큰 원본(최대 15MB) 해시가 이벤트 루프를 막지 않도록 스레드에서 계산"""
+    return await asyncio.to_thread(image_sha256, image_bytes)
@@ -1,35 +1,19 @@
 import os
 import logging
-from typing import Optional
-from azure.storage.blob import BlobServiceClient, ContentSettings
-from app.core.config import Config
+from typing import Optional, Set
+from app.utils.blob_storage import get_blob_storage_service
 
 logger = logging.getLogger(__name__)
 
 
 class MannequinManager:
     def __init__(self):
-        self.account_name = Config.AZURE_STORAGE_ACCOUNT_NAME
-        self.account_key = Config.AZURE_STORAGE_ACCOUNT_KEY
-        self.container_name = Config.AZURE_STORAGE_CONTAINER_NAME
-        self.blob_service_client = None
-        self.container_client = None
-
-        if self.account_name and self.account_key:
-            try:
-                account_url = f"https://{self.account_name}.blob.core.windows.net"
-                self.blob_service_client = BlobServiceClient(
-                    account_url=account_url, credential=self.account_key
-                )
-                self.container_client = self.blob_service_client.get_container_client(
-                    self.container_name
-                )
-            except Exception as e:
-                logger.error(
-                    f"Failed to initialize Blob Storage for MannequinManager: {e}"
-                )
-
-    def get_mannequin_bytes(self, gender: str, body_shape: str) -> Optional[bytes]:
+        # 이미 Blob에 있는 것으로 확인한 마네킹 blob 이름 (매 요청 exists 호출 방지)
+        self._uploaded: Set[str] = set()
+
+    async def get_mannequin_bytes(
+        self, gender: str, body_shape: str
+    ) -> Optional[bytes]:
         """
         성별과 체형에 맞는 마네킹 이미지의 바이트 데이터를 반환합니다.
         AI 모델에 직접 주입할 때 사용합니다.
@@ -57,7 +41,7 @@ class MannequinManager:
 
         try:
             # Ensure it's uploaded to blob for visibility/persistence as requested
-            self.get_mannequin_url(gender, body_shape)
+            await self.get_mannequin_url(gender, body_shape)
 
             with open(local_path, "rb") as f:
                 return f.read()
@@ -65,7 +49,9 @@ class MannequinManager:
             logger.error(f"Error reading mannequin bytes: {e}")
             return None
 
-    def get_mannequin_url(self, gender: str, body_shape: str) -> Optional[str]:
+    async def get_mannequin_url(
+        self, gender: str, body_shape: str
+    ) -> Optional[str]:
         """
         성별과 체형에 맞는 마네킹 이미지의 Azure Blob URL을 반환합니다.
         로컬 static 폴더에서 파일을 찾아 없으면 기본 마네킹을 반환하고,
@@ -118,27 +104,23 @@ class MannequinManager:
         blob_name = f"static/mannequins/{gender_folder}/{filename}"
 
         try:
-            if not self.container_client:
-                logger.error("Blob container client not initialized")
+            blob_storage = get_blob_storage_service()
+            if not blob_storage.enabled:
+                logger.error("Blob Storage not initialized")
                 return None
 
-            blob_client = self.container_client.get_blob_client(blob_name)
-
-            # 존재 여부 확인 (매번 업로드하면 느리니까)
-            if not blob_client.exists():
-                logger.info(f"Uploading mannequin to blob: {blob_name}")
-                with open(local_path, "rb") as data:
-                    blob_client.upload_blob(
-                        data,
-                        overwrite=True,
-                        content_settings=ContentSettings(content_type="image/png"),
-                    )
-
-            # SAS Token 없이 Public Read가 가능하게 하거나, SAS URL 반환
-            # (현재 환경에서는 public access가 꺼져있을 수 있으므로 SAS URL 생성 유틸 재사용 필요)
-            from app.domains.wardrobe.service import wardrobe_manager
-
-            return wardrobe_manager.get_sas_url(blob_client.url)
+            # 존재 여부 확인 (매번 업로드하면 느리니까, 확인 결과는 프로세스 내 캐시)
+            if blob_name not in self._uploaded:
+                if not await blob_storage.exists(blob_name):
+                    logger.info(f"Uploading mannequin to blob: {blob_name}")
+                    with open(local_path, "rb") as data:
+                        await blob_storage.upload_bytes(
+                            blob_name, data.read(), "image/png"
+                        )
+                self._uploaded.add(blob_name)
+
+            # public access가 꺼져 있을 수 있으므로 SAS URL 반환
+            return blob_storage.sign_url(blob_storage.blob_url(blob_name))
 
         except Exception as e:
             logger.error(f"Error handling mannequin blob: {e}")
@@ -0,0 +1,29 @@
+"""
+키셋(커서) 페이지네이션 헬퍼
+마지막으로 반환한 정렬 키를 불투명(opaque) 문자열로 감싸 클라이언트에 전달하고,
+다음 페이지는 OFFSET 대신 `WHERE key < :last` 조건으로 이어서 조회합니다.
+"""
+
+import base64
+import json
+from typing import Any, Dict
+
+from fastapi import HTTPException
+
+
+def encode_cursor(**values: Any) -> str:
+    """정렬 키 값들 -> URL-safe base64 커서"""
+    raw = json.dumps(values, separators=(",", ":"), sort_keys=True).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """커서 -> 정렬 키 값들 (형식이 잘못되면 400)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        values = None
+    if not isinstance(values, dict):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
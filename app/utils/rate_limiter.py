@@ -0,0 +1,90 @@
+"""
+비동기 호출 속도 제한 유틸
+토큰 버킷(초당 호출 수 + 버스트)과 동시 실행 상한(세마포어)을 함께 적용합니다.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+
+class TokenBucket:
+    """초당 `rate`개씩 토큰이 채워지고 최대 `capacity`개까지 쌓이는 버킷"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    async def acquire(self) -> float:
+        """토큰 1개를 얻을 때까지 대기하고, 대기한 시간(초)을 반환"""
+        waited = 0.0
+        # 대기자끼리 순서대로 토큰을 받도록 lock 안에서 sleep
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                delay = (1 - self._tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited = delay
+                self._refill()
+            self._tokens -= 1
+        return waited
+
+
+class RateLimiter:
+    """토큰 버킷 + 동시 실행 상한
+
+    Example:
+        limiter = RateLimiter(rate=10, burst=10, max_concurrency=8)
+        async with limiter:
+            await session.get(...)
+    """
+
+    def __init__(self, rate: float, burst: Optional[float], max_concurrency: int):
+        self._bucket = TokenBucket(rate, burst)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.max_concurrency = max_concurrency
+        self.acquired = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.in_flight = 0
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self._semaphore.acquire()
+        try:
+            waited = await self._bucket.acquire()
+        except BaseException:
+            self._semaphore.release()
+            raise
+        self.acquired += 1
+        self.in_flight += 1
+        if waited > 0:
+            self.throttled += 1
+            self.total_wait += waited
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.in_flight -= 1
+        self._semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "rate": self._bucket.rate,
+            "burst": self._bucket.capacity,
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "total_wait_sec": round(self.total_wait, 3),
+        }
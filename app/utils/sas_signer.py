@@ -0,0 +1,189 @@
+"""
+Azure Blob SAS 서명 서비스
+SAS 토큰을 캐시하여 요청/아이템마다 HMAC 서명을 반복하지 않습니다.
+
+- 단건 URL: blob 경로별 SAS를 만료 직전(AZURE_SAS_REFRESH_MARGIN_MIN)까지 재사용
+- 목록(피드): 컨테이너 범위 읽기 전용 SAS(AZURE_SAS_FEED_TTL_MIN)를 한 번 발급하고
+  아이템마다 문자열 결합만 수행
+- 어느 경우든 반환하는 토큰은 최소 AZURE_SAS_REFRESH_MARGIN_MIN 이상 유효 시간이 남아 있음
+
+content 레이아웃(AZURE_BLOB_LAYOUT=content)에서는 시작/만료 시각을 TTL 단위 고정 창에 맞춰
+같은 창 안에서는 프로세스/인스턴스와 무관하게 같은 토큰(= 같은 URL)을 발급하므로,
+브라우저/CDN 캐시가 SAS 재발급과 관계없이 이미지를 재사용할 수 있습니다.
+
+컨테이너 SAS는 읽기(read) 권한만 가지며 목록(list) 권한이 없으므로,
+blob 이름(사용자/날짜/UUID)을 모르면 다른 blob에 접근할 수 없습니다.
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from azure.storage.blob import (
+    BlobSasPermissions,
+    ContainerSasPermissions,
+    generate_blob_sas,
+    generate_container_sas,
+)
+
+from app.core.config import Config
+
+logger = logging.getLogger(__name__)
+
+BLOB_HOST_MARKER = ".blob.core.windows.net/"
+
+# 클라이언트/서버 시계 오차 허용
+CLOCK_SKEW = timedelta(minutes=15)
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def window_start(now: datetime, window: timedelta) -> datetime:
+    """now가 속한 고정 창(EPOCH부터 window 단위)의 시작 시각"""
+    return EPOCH + ((now - EPOCH) // window) * window
+
+
+def split_blob_url(url: str) -> Optional[Tuple[str, str]]:
+    """blob URL -> (container, blob_name). Azure blob URL이 아니면 None"""
+    if BLOB_HOST_MARKER not in url:
+        return None
+    container_and_blob = url.split(BLOB_HOST_MARKER, 1)[1].split("?", 1)[0]
+    if "/" not in container_and_blob:
+        return None
+    container, blob_name = container_and_blob.split("/", 1)
+    return container, blob_name
+
+
+class SasSigner:
+    """SAS 토큰 발급 + 만료 직전까지 캐시"""
+
+    def __init__(
+        self,
+        account_name: str = Config.AZURE_STORAGE_ACCOUNT_NAME,
+        account_key: str = Config.AZURE_STORAGE_ACCOUNT_KEY,
+        ttl_minutes: float = Config.AZURE_SAS_TTL_MIN,
+        feed_ttl_minutes: float = Config.AZURE_SAS_FEED_TTL_MIN,
+        refresh_margin_minutes: float = Config.AZURE_SAS_REFRESH_MARGIN_MIN,
+        max_entries: int = 50000,
+        aligned: bool = Config.AZURE_BLOB_LAYOUT == "content",
+    ):
+        self.account_name = account_name
+        self.account_key = account_key
+        self.ttl = timedelta(minutes=ttl_minutes)
+        self.feed_ttl = timedelta(minutes=feed_ttl_minutes)
+        self.refresh_margin = timedelta(minutes=refresh_margin_minutes)
+        self.max_entries = max_entries
+        self.aligned = aligned
+        # (container, blob_name | None) -> (token, 재발급 시각)
+        self._tokens: Dict[Tuple[str, Optional[str]], Tuple[str, datetime]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.signed = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.account_name and self.account_key)
+
+    def blob_token(self, container: str, blob_name: str) -> str:
+        """특정 blob 읽기 전용 SAS 토큰 (캐시)"""
+        return self._cached((container, blob_name), self.ttl)
+
+    def container_token(self, container: str) -> str:
+        """컨테이너 범위 읽기 전용 SAS 토큰 (목록 응답용, 캐시)"""
+        return self._cached((container, None), self.feed_ttl)
+
+    def sign_url(self, url: str) -> str:
+        """blob URL에 해당 blob 전용 SAS를 붙여 반환 (단건 응답용)"""
+        parts = self._parts(url)
+        if parts is None:
+            return url
+        token = self.blob_token(*parts)
+        return f"{url}?{token}" if token else url
+
+    def sign_feed_url(self, url: str) -> str:
+        """blob URL에 컨테이너 SAS를 붙여 반환 (목록 응답용: 문자열 결합만 수행)"""
+        parts = self._parts(url)
+        if parts is None:
+            return url
+        token = self.container_token(parts[0])
+        return f"{url}?{token}" if token else url
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.signed
+        return {
+            "entries": len(self._tokens),
+            "hits": self.hits,
+            "signed": self.signed,
+            "hit_ratio": round(self.hits / total, 3) if total else 0.0,
+        }
+
+    def _parts(self, url: str) -> Optional[Tuple[str, str]]:
+        # 이미 쿼리(SAS 등)가 붙은 URL은 그대로 둠
+        if "?" in url:
+            return None
+        return split_blob_url(url)
+
+    def _cached(self, key: Tuple[str, Optional[str]], ttl: timedelta) -> str:
+        if not self.enabled:
+            return ""
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            entry = self._tokens.get(key)
+            if entry and entry[1] > now:
+                self.hits += 1
+                return entry[0]
+
+        if self.aligned:
+            # 창 끝까지 재사용하고, 만료는 창 끝 + 여유로 두어 남은 유효 시간을 보장
+            start = window_start(now, ttl)
+            expiry = start + ttl + self.refresh_margin
+            reuse_until = start + ttl
+        else:
+            start = now
+            # TTL이 여유보다 짧게 설정돼도 새 토큰은 여유 이상 유효
+            expiry = now + max(ttl, self.refresh_margin)
+            reuse_until = expiry - self.refresh_margin
+
+        try:
+            token = self._sign(key[0], key[1], start, expiry)
+        except Exception as e:
+            logger.error(f"Error generating SAS token for {key}: {e}")
+            return ""
+
+        with self._lock:
+            if len(self._tokens) >= self.max_entries and key not in self._tokens:
+                # 가장 먼저 들어온 항목 제거 (dict 삽입 순서)
+                self._tokens.pop(next(iter(self._tokens)))
+            self._tokens[key] = (token, reuse_until)
+            self.signed += 1
+        return token
+
+    def _sign(
+        self,
+        container: str,
+        blob_name: Optional[str],
+        start: datetime,
+        expiry: datetime,
+    ) -> str:
+        if blob_name is None:
+            return generate_container_sas(
+                account_name=self.account_name,
+                container_name=container,
+                account_key=self.account_key,
+                permission=ContainerSasPermissions(read=True),
+                start=start - CLOCK_SKEW,
+                expiry=expiry,
+            )
+        return generate_blob_sas(
+            account_name=self.account_name,
+            container_name=container,
+            blob_name=blob_name,
+            account_key=self.account_key,
+            permission=BlobSasPermissions(read=True),
+            start=start - CLOCK_SKEW,
+            expiry=expiry,
+        )
+
+
+sas_signer = SasSigner()
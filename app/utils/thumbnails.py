@@ -0,0 +1,122 @@
+"""
+옷장 이미지 썸네일 생성
+원본(최대 15MB 카메라 이미지)을 고정 폭 WebP 썸네일로 축소합니다.
+Pillow 디코딩/리사이즈는 CPU 작업이므로 프로세스 풀에서 실행하여 이벤트 루프와 GIL을 막지 않습니다.
+"""
+
+import asyncio
+import io
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Mapping, Optional, Sequence
+
+from PIL import Image, ImageOps
+
+from app.core.config import Config
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_CONTENT_TYPE = "image/webp"
+THUMBNAIL_EXT = ".webp"
+
+
+def render_thumbnails(
+    image_bytes: bytes, widths: Sequence[int], quality: int
+) -> Dict[int, bytes]:
+    """
+    원본 이미지 -> {폭: WebP bytes} (프로세스 풀 워커에서 실행되므로 모듈 최상위 함수)
+
+    원본보다 큰 폭은 확대하지 않고 건너뛰며,
+    원본이 모든 폭보다 작으면 원본 크기의 WebP 하나만 만듭니다.
+    """
+    with Image.open(io.BytesIO(image_bytes)) as img:
+        # JPEG는 디코딩 단계에서 축소(draft)하여 큰 원본의 메모리/시간을 줄임
+        # (EXIF 회전 후에도 폭이 target 이상이 되도록 양쪽 모두 target 이상 유지)
+        target = max(widths)
+        img.draft("RGB", (target, target))
+        img = ImageOps.exif_transpose(img)
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+
+        sizes = sorted(w for w in set(widths) if w < img.width) or [img.width]
+        thumbnails: Dict[int, bytes] = {}
+        for width in sizes:
+            resized = img
+            if width != img.width:
+                height = max(1, round(img.height * width / img.width))
+                resized = img.resize((width, height), Image.Resampling.LANCZOS)
+            buf = io.BytesIO()
+            resized.save(buf, format="WEBP", quality=quality, method=4)
+            thumbnails[width] = buf.getvalue()
+        return thumbnails
+
+
+def pick_thumbnail(
+    thumbnails: Optional[Mapping[str, str]], width: int
+) -> Optional[str]:
+    """{폭: URL}에서 width 이상 중 가장 작은 썸네일 (없으면 가장 큰 썸네일)"""
+    if not thumbnails:
+        return None
+    available = sorted(thumbnails.items(), key=lambda kv: int(kv[0]))
+    for w, url in available:
+        if int(w) >= width:
+            return url
+    return available[-1][1]
+
+
+class ThumbnailPool:
+    """썸네일 생성 프로세스 풀 (첫 사용 시 생성, 앱 종료 시 shutdown)"""
+
+    def __init__(
+        self,
+        widths: Sequence[int] = tuple(Config.WARDROBE_THUMBNAIL_WIDTHS),
+        quality: int = Config.WARDROBE_THUMBNAIL_QUALITY,
+        max_workers: int = Config.WARDROBE_THUMBNAIL_WORKERS,
+    ):
+        self.widths = tuple(widths)
+        self.quality = quality
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.rendered = 0
+        self.failures = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._executor
+
+    async def render(self, image_bytes: bytes) -> Dict[int, bytes]:
+        """썸네일 생성 (실패 시 빈 dict: 업로드 자체는 원본만으로 계속 진행)"""
+        if not self.widths:
+            return {}
+        loop = asyncio.get_running_loop()
+        try:
+            thumbnails = await loop.run_in_executor(
+                self._get_executor(),
+                render_thumbnails,
+                image_bytes,
+                self.widths,
+                self.quality,
+            )
+        except Exception as e:
+            self.failures += 1
+            logger.warning(f"Thumbnail generation failed: {e}")
+            if isinstance(e, BrokenProcessPool):
+                # 워커가 비정상 종료하면 풀을 다시 만들도록 폐기
+                self.shutdown()
+            return {}
+        self.rendered += 1
+        return thumbnails
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+thumbnail_pool = ThumbnailPool()
@@ -1,6 +1,9 @@
 import logging
 import azure.functions as func
 from app.main import app as fastapi_app
+from app.batch import run_daily_weather_batch, run_intraday_weather_refresh
+from app.core.config import Config
+from app.database import SessionLocal
 
 # 1. FastAPI 앱 연결
 app = func.AsgiFunctionApp(app=fastapi_app, http_auth_level=func.AuthLevel.ANONYMOUS)
@@ -11,22 +14,51 @@ app = func.AsgiFunctionApp(app=fastapi_app, http_auth_level=func.AuthLevel.ANONY
 # --------------------------------------------------------------------------------
 # schedule="0 16 17 * * *" -> 17:16 UTC = 02:16 KST (다음날)
 # 기상청 데이터 생성 지연을 고려하여 16분의 안전 마진(Safety Buffer)을 둠
-# @app.schedule(
-#     schedule="0 16 17 * * *",
-#     arg_name="myTimer",
-#     run_on_startup=False,
-#     use_monitor=False,
-# )
-# async def daily_weather_update(myTimer: func.TimerRequest) -> None:
-#     """매일 02:16 KST에 전국 날씨 데이터 수집"""
-#     logging.info("☀️ [Batch] Daily weather update started")
-#
-#     # DB 세션 컨텍스트 매니저로 관리 (자동 close)
-#     db = next(get_db())
-#     try:
-#         result = await run_daily_weather_batch(db)
-#         logging.info(f"✅ Batch completed: {result}")
-#     except Exception as e:
-#         logging.error(f"❌ Batch failed: {str(e)}")
-#     finally:
-#         db.close()
+# 스케일 아웃 시 모든 인스턴스에서 실행되지만, run_daily_weather_batch 내부의
+# PostgreSQL advisory lock으로 한 인스턴스만 수집하고 나머지는 skipped로 종료됨
+@app.schedule(
+    schedule="0 16 17 * * *",
+    arg_name="myTimer",
+    run_on_startup=False,
+    use_monitor=False,
+)
+async def daily_weather_update(myTimer: func.TimerRequest) -> None:
+    """매일 02:16 KST에 전국 날씨 데이터 수집"""
+    logging.info("☀️ [Batch] Daily weather update started")
+
+    db = SessionLocal()
+    try:
+        result = await run_daily_weather_batch(db)
+        logging.info(f"✅ Batch completed: {result}")
+    except Exception as e:
+        logging.error(f"❌ Batch failed: {str(e)}")
+    finally:
+        db.close()
+
+
+# --------------------------------------------------------------------------------
+# [Batch Job] Intraday Weather Refresh (05:15, 08:15, ..., 20:15 KST)
+# --------------------------------------------------------------------------------
+# 발표 시각(0500~2000) + 15분 = 20:15, 23:15, 02:15, 05:15, 08:15, 11:15 UTC
+# 오늘 이미 수집된 격자만 새 발표분으로 갱신하며, 값이 바뀐 격자만 기록
+@app.schedule(
+    schedule="0 15 20,23,2,5,8,11 * * *",
+    arg_name="myTimer",
+    run_on_startup=False,
+    use_monitor=False,
+)
+async def intraday_weather_refresh(myTimer: func.TimerRequest) -> None:
+    """당일 후속 발표분으로 날씨 데이터 갱신"""
+    if not Config.WEATHER_INTRADAY_REFRESH:
+        return
+
+    logging.info("🌦️ [Batch] Intraday weather refresh started")
+
+    db = SessionLocal()
+    try:
+        result = await run_intraday_weather_refresh(db)
+        logging.info(f"✅ Intraday refresh completed: {result}")
+    except Exception as e:
+        logging.error(f"❌ Intraday refresh failed: {str(e)}")
+    finally:
+        db.close()
@@ -0,0 +1,120 @@
+"""
+KMA 예보 파서 벤치마크: response.json() + dict 순회 vs 스트리밍 파서
+
+    python -m tests.benchmarks.bench_kma_parser [--regions 17] [--rows 300] [--repeat 20]
+
+실제 API 응답과 같은 형태의 payload를 생성하여
+파싱 시간과 최대 메모리 할당량(tracemalloc peak)을 비교합니다.
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from app.domains.weather.forecast import parse_forecast_items
+from app.domains.weather.parser import parse_forecast_bytes
+
+# getVilageFcst 응답의 카테고리 순서 (시간당 12개, TMN/TMX는 해당 시각에만)
+CATEGORIES = ["TMP", "UUU", "VVV", "VEC", "WSD", "SKY", "PTY", "POP", "WAV", "PCP", "REH", "SNO"]
+VALUES = {"PCP": "강수없음", "SNO": "적설없음", "PTY": "0", "SKY": "1", "POP": "20"}
+CHUNK_SIZE = 64 * 1024
+
+
+def build_payload(
+    rows: int,
+    base_date: str = "20260123",
+    base_time: str = "0200",
+    nx: int = 60,
+    ny: int = 127,
+) -> bytes:
+    items = []
+    # 발표 시각 다음 정시부터 예보가 시작됨 (0200 발표 -> 03시부터)
+    fcst_at = datetime.strptime(base_date + base_time[:2], "%Y%m%d%H")
+    fcst_at += timedelta(hours=1)
+    while len(items) < rows:
+        hour = fcst_at.hour
+        cats = list(CATEGORIES)
+        if hour == 6:
+            cats.append("TMN")
+        if hour == 15:
+            cats.append("TMX")
+        for cat in cats:
+            items.append(
+                {
+                    "baseDate": base_date,
+                    "baseTime": base_time,
+                    "category": cat,
+                    "fcstDate": fcst_at.strftime("%Y%m%d"),
+                    "fcstTime": fcst_at.strftime("%H00"),
+                    "fcstValue": VALUES.get(cat, str(hour % 10 - 3)),
+                    "nx": nx,
+                    "ny": ny,
+                }
+            )
+        fcst_at += timedelta(hours=1)
+    payload = {
+        "response": {
+            "header": {"resultCode": "00", "resultMsg": "NORMAL_SERVICE"},
+            "body": {
+                "dataType": "JSON",
+                "items": {"item": items[:rows]},
+                "pageNo": 1,
+                "numOfRows": rows,
+                "totalCount": 1000,
+            },
+        }
+    }
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def chunked(data: bytes, size: int = CHUNK_SIZE):
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+def dict_path(data: bytes):
+    body = json.loads(data)
+    items = body["response"]["body"]["items"]["item"]
+    return parse_forecast_items(items, "20260123", now_hour="1200")
+
+
+def stream_path(data: bytes):
+    return parse_forecast_bytes(chunked(data), "20260123", now_hour="1200").forecast
+
+
+def measure(fn, payloads, repeat: int):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for data in payloads:
+            fn(data)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    for data in payloads:
+        fn(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed / repeat, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--regions", type=int, default=17)
+    parser.add_argument("--rows", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    payloads = [build_payload(args.rows) for _ in range(args.regions)]
+    assert dict_path(payloads[0]) == stream_path(payloads[0])
+
+    size_kb = sum(len(p) for p in payloads) / 1024
+    print(f"payload: {args.regions} regions x {args.rows} rows ({size_kb:.0f} KB)")
+    for name, fn in (("json + dict", dict_path), ("streaming", stream_path)):
+        per_run, peak = measure(fn, payloads, args.repeat)
+        print(f"{name:>12}: {per_run * 1000:8.2f} ms/batch  peak {peak / 1024:8.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+로컬 가짜 KMA 단기예보(getVilageFcst) 서버
+
+실제 API 할당량을 쓰지 않고 날씨 경로를 부하/장애 테스트하기 위한 대체 서버입니다.
+응답 지연, HTTP 오류, resultCode 실패 비율을 설정할 수 있고 호출 수를 결과별로 집계합니다.
+
+    python -m tests.load.fake_kma --port 8089 --latency-ms 80 --result-error-rate 0.05
+
+앱을 가짜 서버에 붙이려면 KMA_BASE_URL을 지정합니다.
+
+    KMA_BASE_URL=http://127.0.0.1:8089/getVilageFcst uvicorn app.main:app
+"""
+
+import argparse
+import asyncio
+import random
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from aiohttp import web
+
+from tests.benchmarks.bench_kma_parser import build_payload
+
+PATH = "/getVilageFcst"
+
+# 실패 시 KMA가 돌려주는 resultCode -> resultMsg
+RESULT_MESSAGES = {
+    "03": "NO_DATA",
+    "10": "INVALID_REQUEST_PARAMETER_ERROR",
+    "22": "LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR",
+    "30": "SERVICE_KEY_IS_NOT_REGISTERED_ERROR",
+    "99": "UNKNOWN_ERROR",
+}
+
+
+@dataclass
+class FakeKMAConfig:
+    latency_ms: float = 50.0  # 응답 지연 평균
+    jitter_ms: float = 20.0  # 지연 편차 (균등 분포 ±)
+    http_error_rate: float = 0.0  # HTTP 오류 응답 비율
+    http_error_status: int = 503
+    result_error_rate: float = 0.0  # HTTP 200 + resultCode 실패 비율
+    result_error_code: str = "03"
+    seed: Optional[int] = None
+
+
+@lru_cache(maxsize=4096)
+def _payload(rows: int, base_date: str, base_time: str, nx: int, ny: int) -> bytes:
+    return build_payload(rows, base_date, base_time, nx, ny)
+
+
+def _error_payload(code: str) -> bytes:
+    msg = RESULT_MESSAGES.get(code, "UNKNOWN_ERROR")
+    return (
+        '{"response":{"header":{"resultCode":"%s","resultMsg":"%s"}}}' % (code, msg)
+    ).encode()
+
+
+class FakeKMAServer:
+    """aiohttp 기반 가짜 KMA 서버
+
+    Example:
+        async with FakeKMAServer(FakeKMAConfig(latency_ms=0)) as server:
+            client = KMAWeatherClient(base_url=server.url)
+            ...
+            server.stats()  # {"calls": 17, "ok": 17, ...}
+    """
+
+    def __init__(
+        self,
+        config: Optional[FakeKMAConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.config = config or FakeKMAConfig()
+        self.host = host
+        self.port = port
+        self.url: Optional[str] = None
+        self.calls: Counter = Counter()
+        self.cells: Counter = Counter()  # (base_date, base_time, nx, ny) -> 호출 수
+        self._random = random.Random(self.config.seed)
+        self._runner: Optional[web.AppRunner] = None
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_get(PATH, self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self.url = f"http://{host}:{port}{PATH}"
+        return self.url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "FakeKMAServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.stop()
+
+    def reset(self) -> None:
+        self.calls.clear()
+        self.cells.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": sum(self.calls.values()),
+            "ok": self.calls["ok"],
+            "http_error": self.calls["http_error"],
+            "result_error": self.calls["result_error"],
+            "distinct_cells": len(self.cells),
+        }
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        cfg = self.config
+        query = request.query
+        key = (
+            query.get("base_date", ""),
+            query.get("base_time", "0200"),
+            int(query.get("nx", 0)),
+            int(query.get("ny", 0)),
+        )
+        self.cells[key] += 1
+
+        delay = cfg.latency_ms + self._random.uniform(-cfg.jitter_ms, cfg.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+        if self._random.random() < cfg.http_error_rate:
+            self.calls["http_error"] += 1
+            return web.Response(status=cfg.http_error_status, text="Unavailable")
+
+        if self._random.random() < cfg.result_error_rate:
+            self.calls["result_error"] += 1
+            body = _error_payload(cfg.result_error_code)
+        else:
+            self.calls["ok"] += 1
+            body = _payload(int(query.get("numOfRows", 300)), *key)
+        return web.Response(body=body, content_type="application/json")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--http-error-rate", type=float, default=0.0)
+    parser.add_argument("--http-error-status", type=int, default=503)
+    parser.add_argument("--result-error-rate", type=float, default=0.0)
+    parser.add_argument("--result-error-code", default="03")
+    args = parser.parse_args()
+
+    config = FakeKMAConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        http_error_rate=args.http_error_rate,
+        http_error_status=args.http_error_status,
+        result_error_rate=args.result_error_rate,
+        result_error_code=args.result_error_code,
+    )
+
+    async def serve():
+        async with FakeKMAServer(config, args.host, args.port) as server:
+            print(f"fake KMA listening on {server.url}")
+            try:
+                while True:
+                    await asyncio.sleep(60)
+                    print(server.stats())
+            except asyncio.CancelledError:
+                pass
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
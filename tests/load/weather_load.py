@@ -0,0 +1,188 @@
+"""
+날씨 경로 부하 테스트 (가짜 KMA 서버 사용)
+
+    python -m tests.load.weather_load [--scenario all] [--requests 500]
+        [--concurrency 50] [--latency-ms 50] [--spread random]
+        [--http-error-rate 0.0] [--result-error-rate 0.0]
+
+시나리오:
+- batch:   WeatherService.fetchAndLoadWeather (일 배치 수집/저장)
+- summary: GET /api/today/summary (라우터 + 조건부 GET 포함, ASGI in-process 호출)
+- pick:    WeatherService.get_weather_info (Today's Pick 날씨 조회 경로)
+
+시나리오별로 p50/p95/p99 지연과 가짜 KMA 호출 수(결과별)를 출력합니다.
+KMA만 가짜로 대체하므로 DATABASE_URL은 개발/테스트용 DB를 가리켜야 합니다.
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import time
+from collections import Counter
+from typing import Awaitable, Callable, List, Sequence, Tuple
+
+import httpx
+from fastapi import FastAPI
+
+from app.core.regions import KOREA_REGIONS
+from app.database import SessionLocal
+from app.domains.weather.router import router as weather_router
+from app.domains.weather.service import weather_service
+from tests.load.fake_kma import FakeKMAConfig, FakeKMAServer
+
+# 대한민국 본토 대략 범위 (random 분포용)
+LAT_RANGE = (34.6, 38.0)
+LON_RANGE = (126.5, 129.3)
+
+
+def percentile(values: Sequence[float], p: float) -> float:
+    """nearest-rank 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(p / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def coordinates(n: int, spread: str, seed: int) -> List[Tuple[float, float]]:
+    rng = random.Random(seed)
+    if spread == "region":
+        points = [(r["lat"], r["lon"]) for r in KOREA_REGIONS.values()]
+        return [rng.choice(points) for _ in range(n)]
+    return [(rng.uniform(*LAT_RANGE), rng.uniform(*LON_RANGE)) for _ in range(n)]
+
+
+async def run_concurrent(
+    n: int, concurrency: int, fn: Callable[[int], Awaitable[str]]
+) -> Tuple[List[float], Counter]:
+    """fn(i)를 동시 실행 상한 안에서 n번 실행하고 (지연 ms 목록, 결과 집계) 반환"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    outcomes: Counter = Counter()
+
+    async def one(i: int):
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                outcomes[await fn(i)] += 1
+            except Exception as e:
+                outcomes[type(e).__name__] += 1
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(one(i) for i in range(n)))
+    return latencies, outcomes
+
+
+def report(name: str, latencies: List[float], outcomes: Counter, server) -> None:
+    print(
+        f"[{name}] n={len(latencies)}"
+        f"  p50 {percentile(latencies, 50):8.1f} ms"
+        f"  p95 {percentile(latencies, 95):8.1f} ms"
+        f"  p99 {percentile(latencies, 99):8.1f} ms"
+        f"  max {max(latencies, default=0):8.1f} ms"
+    )
+    print(f"    outcomes: {dict(outcomes)}")
+    print(f"    KMA: {server.stats()}")
+    server.reset()
+
+
+async def scenario_batch(args, server) -> None:
+    async def run(_: int) -> str:
+        db = SessionLocal()
+        try:
+            result = await weather_service.fetchAndLoadWeather(db)
+            return result["status"]
+        finally:
+            db.close()
+
+    latencies, outcomes = await run_concurrent(args.batch_runs, 1, run)
+    report("batch", latencies, outcomes, server)
+
+
+async def scenario_summary(args, server) -> None:
+    app = FastAPI()
+    app.include_router(weather_router, prefix="/api")
+    coords = coordinates(args.requests, args.spread, args.seed)
+    weather_service.cache.clear()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://load") as http:
+
+        async def run(i: int) -> str:
+            lat, lon = coords[i]
+            response = await http.get(
+                "/api/today/summary", params={"lat": lat, "lon": lon}
+            )
+            return str(response.status_code)
+
+        latencies, outcomes = await run_concurrent(
+            args.requests, args.concurrency, run
+        )
+    report("summary", latencies, outcomes, server)
+
+
+async def scenario_pick(args, server) -> None:
+    coords = coordinates(args.requests, args.spread, args.seed + 1)
+    weather_service.cache.clear()
+
+    async def run(i: int) -> str:
+        db = SessionLocal()
+        try:
+            info = await weather_service.get_weather_info(db, *coords[i])
+            return "stale" if info.get("is_stale") else "ok"
+        finally:
+            db.close()
+
+    latencies, outcomes = await run_concurrent(args.requests, args.concurrency, run)
+    report("pick", latencies, outcomes, server)
+
+
+SCENARIOS = {
+    "batch": scenario_batch,
+    "summary": scenario_summary,
+    "pick": scenario_pick,
+}
+
+
+async def main_async(args) -> None:
+    config = FakeKMAConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        http_error_rate=args.http_error_rate,
+        result_error_rate=args.result_error_rate,
+        seed=args.seed,
+    )
+    async with FakeKMAServer(config) as server:
+        weather_service.client.base_url = server.url
+        policy = weather_service.canonicalizer.policy
+        print(f"fake KMA: {server.url}  grid policy: {policy}")
+        try:
+            names = list(SCENARIOS) if args.scenario == "all" else [args.scenario]
+            for name in names:
+                await SCENARIOS[name](args, server)
+            limiter = weather_service.client.get_metrics()["rate_limiter"]
+            print(f"KMA client rate limiter: {limiter}")
+        finally:
+            weather_service.demand.flush()
+            await weather_service.cancel_background_refreshes()
+            await weather_service.client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scenario", choices=["all", *SCENARIOS], default="all")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--batch-runs", type=int, default=3)
+    parser.add_argument("--spread", choices=["region", "random"], default="random")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--http-error-rate", type=float, default=0.0)
+    parser.add_argument("--result-error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
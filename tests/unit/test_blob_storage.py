@@ -0,0 +1,112 @@
+import base64
+
+import pytest
+
+from app.utils.blob_storage import (
+    IMMUTABLE_CACHE_CONTROL,
+    MB,
+    BlobStorageService,
+    content_blob_name,
+    content_type_for,
+    get_blob_storage_service,
+    get_storage,
+)
+
+
+def _service(**kwargs):
+    service = BlobStorageService(**kwargs)
+    service.account_name = "acct"
+    service.account_key = base64.b64encode(b"0" * 64).decode()
+    return service
+
+
+def test_content_type_for():
+    assert content_type_for("a/b.PNG") == "image/png"
+    assert content_type_for("a/b.webp") == "image/webp"
+    assert content_type_for("a/b") == "image/jpeg"
+
+
+def test_disabled_service_has_no_client():
+    service = BlobStorageService()
+    service.account_name = ""
+
+    assert not service.enabled
+    with pytest.raises(RuntimeError):
+        service.blob_service_client
+
+
+@pytest.mark.asyncio
+async def test_shared_async_client_is_configured_and_recreated_after_close():
+    service = _service(upload_concurrency=8, block_size_mb=2, single_put_mb=1)
+
+    client = service.blob_service_client
+    assert service.blob_service_client is client
+    assert client._config.max_block_size == 2 * MB
+    assert client._config.max_single_put_size == 1 * MB
+
+    await service.close()
+    assert service.blob_service_client is not client
+    await service.close()
+
+
+def test_blob_url_quotes_name_without_network():
+    service = _service()
+
+    assert (
+        service.blob_url("users/u1/a b.jpg")
+        == f"https://acct.blob.core.windows.net/{service.container_name}/users/u1/a%20b.jpg"
+    )
+    assert service.blob_url("x.png", container="static").endswith("/static/x.png")
+
+
+def test_operations_are_timed_including_failures():
+    service = _service()
+
+    with service._timed("sign"):
+        pass
+    with pytest.raises(ValueError):
+        with service._timed("sign"):
+            raise ValueError("boom")
+
+    sign = service.stats()["operations"]["sign"]
+    assert sign["calls"] == 2 and sign["errors"] == 1
+    assert sign["max_ms"] >= 0
+
+
+def test_get_storage_returns_shared_instance():
+    assert get_storage() is get_blob_storage_service()
+
+
+def test_content_blob_name_is_sharded_by_digest():
+    digest = "ab" + "0" * 62
+
+    assert content_blob_name(digest, ".png") == f"objects/ab/{digest}.png"
+
+
+@pytest.mark.asyncio
+async def test_upload_immutable_skips_existing_and_sets_cache_control(monkeypatch):
+    service = _service(layout="content")
+    existing = set()
+    uploads = []
+
+    async def exists(blob_name, container=None):
+        return blob_name in existing
+
+    async def upload_bytes(blob_name, data, content_type, **kwargs):
+        uploads.append((blob_name, content_type, kwargs))
+        existing.add(blob_name)
+        return service.blob_url(blob_name)
+
+    monkeypatch.setattr(service, "exists", exists)
+    monkeypatch.setattr(service, "upload_bytes", upload_bytes)
+
+    first = await service.upload_immutable(b"img", ".png")
+    second = await service.upload_immutable(b"img", ".png")
+
+    assert first == second and "/objects/" in first
+    assert len(uploads) == 1
+    assert uploads[0][1] == "image/png"
+    assert uploads[0][2]["overwrite"] is False
+    assert uploads[0][2]["cache_control"] == IMMUTABLE_CACHE_CONTROL
+    assert "immutable" in IMMUTABLE_CACHE_CONTROL
+    assert service.stats()["immutable_skipped"] == 1
@@ -0,0 +1,62 @@
+from collections import namedtuple
+
+from sqlalchemy.dialects import postgresql
+
+from app.domains.weather.model import DailyWeather
+from app.utils.db_upsert import bulk_upsert
+
+KEY = ("base_date", "nx", "ny")
+_Returned = namedtuple("_Returned", ["base_date", "nx", "ny", "inserted"])
+
+
+class _RecordingSession:
+    """실행된 문장을 기록하고, 짝수 번째 행은 신규/홀수 번째 행은 갱신으로 응답"""
+
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, stmt):
+        self.statements.append(stmt)
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        count = sum(1 for k in params if k.startswith("nx_m"))
+        return [_Returned("20260123", i, 127, i % 2 == 0) for i in range(count)]
+
+
+def _row(nx, min_temp=0.0):
+    return dict(
+        base_date="20260123",
+        base_time="0200",
+        nx=nx,
+        ny=127,
+        region="Seoul",
+        min_temp=min_temp,
+        max_temp=5.0,
+        rain_type=0,
+    )
+
+
+def test_bulk_upsert_chunks_and_counts_inserted_vs_updated():
+    db = _RecordingSession()
+    rows = [_row(nx) for nx in range(5)] + [_row(0, min_temp=-3.0)]
+
+    result = bulk_upsert(db, DailyWeather, rows, KEY, chunk_size=2)
+
+    # 중복 키(nx=0)는 마지막 값 하나로 합쳐져 5행 -> 3문장
+    assert len(db.statements) == 3
+    assert (result.inserted, result.updated) == (3, 2)
+
+    sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (base_date, nx, ny) DO UPDATE SET" in sql
+    assert "base_time = excluded.base_time" in sql
+    assert "nx = excluded.nx" not in sql
+    assert "(xmax = 0) AS inserted" in sql
+    assert db.statements[0].compile().params["min_temp_m0"] == -3.0
+
+
+def test_bulk_upsert_with_no_update_columns_does_nothing_on_conflict():
+    db = _RecordingSession()
+
+    bulk_upsert(db, DailyWeather, [_row(60)], KEY, update_columns=[])
+
+    sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (base_date, nx, ny) DO NOTHING" in sql
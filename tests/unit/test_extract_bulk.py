@@ -0,0 +1,171 @@
+import asyncio
+import hashlib
+import json
+import uuid
+
+import pytest
+
+from app.domains.extraction import bulk
+from app.domains.extraction.bulk import BulkFile, stream_bulk_extraction
+
+
+def _parse(chunks):
+    events = []
+    for chunk in chunks:
+        if chunk.startswith(":"):
+            events.append(("keep-alive", None))
+            continue
+        event_line, data_line = chunk.strip().split("\n")
+        events.append(
+            (event_line[len("event: ") :], json.loads(data_line[len("data: ") :]))
+        )
+    return events
+
+
+def _files(n):
+    return [BulkFile(i, f"{i}.jpg", "image/jpeg", b"x") for i in range(n)]
+
+
+@pytest.mark.extraction
+@pytest.mark.asyncio
+async def test_stream_bounds_concurrency_and_reports_each_item(monkeypatch):
+    running = 0
+    peak = 0
+
+    async def fake_process(file, user_id, storage=None):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"index": file.index, "success": file.index != 3}
+
+    monkeypatch.setattr(bulk, "process_bulk_file", fake_process)
+
+    chunks = [
+        c
+        async for c in stream_bulk_extraction(_files(6), uuid.uuid4(), concurrency=2)
+    ]
+    events = _parse(chunks)
+
+    assert events[0] == ("start", {"total": 6})
+    items = [data for name, data in events if name == "item"]
+    assert sorted(d["index"] for d in items) == list(range(6))
+    assert events[-1] == ("done", {"total": 6, "succeeded": 5, "failed": 1})
+    assert peak == 2
+
+
+@pytest.mark.extraction
+@pytest.mark.asyncio
+async def test_stream_sends_keepalive_while_waiting(monkeypatch):
+    async def slow_process(file, user_id, storage=None):
+        await asyncio.sleep(0.05)
+        return {"index": file.index, "success": True}
+
+    monkeypatch.setattr(bulk, "process_bulk_file", slow_process)
+
+    chunks = [
+        c
+        async for c in stream_bulk_extraction(
+            _files(1), uuid.uuid4(), keepalive_sec=0.01
+        )
+    ]
+
+    assert ("keep-alive", None) in _parse(chunks)
+
+
+@pytest.mark.extraction
+@pytest.mark.asyncio
+async def test_closing_stream_cancels_pending_items(monkeypatch):
+    started = asyncio.Event()
+
+    async def hanging_process(file, user_id, storage=None):
+        started.set()
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(bulk, "process_bulk_file", hanging_process)
+
+    stream = stream_bulk_extraction(_files(2), uuid.uuid4(), keepalive_sec=0.01)
+    await stream.__anext__()
+    await started.wait()
+    await stream.aclose()
+
+    pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+    await asyncio.sleep(0)
+    assert all(t.done() for t in pending)
+
+
+@pytest.mark.extraction
+@pytest.mark.asyncio
+async def test_duplicate_image_skips_extraction_and_upload(monkeypatch):
+    class FakeSession:
+        def close(self):
+            pass
+
+    class FakeManager:
+        def find_duplicate(self, db, user_id, image_sha256):
+            assert image_sha256 == hashlib.sha256(b"x").hexdigest()
+            return {
+                "item_id": 7,
+                "image_url": "https://acct.blob.core.windows.net/images/a.jpg",
+                "blob_name": "a.jpg",
+                "attributes": {"category": {"main": "top"}},
+                "duplicate": True,
+            }
+
+        async def save_item(self, **kwargs):
+            raise AssertionError("duplicate upload must not be saved again")
+
+    async def fail_extract(contents):
+        raise AssertionError("duplicate upload must not be extracted again")
+
+    monkeypatch.setattr(bulk, "SessionLocal", FakeSession)
+    monkeypatch.setattr(bulk, "wardrobe_manager", FakeManager())
+    monkeypatch.setattr(bulk.extractor, "extract", fail_extract)
+
+    result = await bulk.process_bulk_file(_files(1)[0], uuid.uuid4())
+
+    assert result["success"] and result["duplicate"]
+    assert result["item_id"] == "7"
+
+
+class _FakeUpload:
+    def __init__(self, filename, contents, size=None):
+        self.filename = filename
+        self.content_type = "image/jpeg"
+        self.size = len(contents) if size is None else size
+        self._contents = contents
+        self.read_called = False
+
+    async def read(self):
+        self.read_called = True
+        return self._contents
+
+
+@pytest.mark.extraction
+@pytest.mark.asyncio
+async def test_read_bulk_files_rejects_total_size_before_reading():
+    from fastapi import HTTPException
+
+    uploads = [_FakeUpload(f"{i}.jpg", b"x" * 6) for i in range(2)]
+
+    with pytest.raises(HTTPException) as exc:
+        await bulk.read_bulk_files(uploads, max_total_bytes=10, max_file_bytes=10)
+
+    assert exc.value.status_code == 413
+    assert not any(upload.read_called for upload in uploads)
+
+
+@pytest.mark.extraction
+@pytest.mark.asyncio
+async def test_read_bulk_files_skips_oversized_file_body():
+    small = _FakeUpload("small.jpg", b"x" * 4)
+    large = _FakeUpload("large.jpg", b"", size=20)
+
+    files = await bulk.read_bulk_files(
+        [small, large], max_total_bytes=100, max_file_bytes=10
+    )
+
+    assert files[0].contents == b"x" * 4 and files[0].file_size == 4
+    assert not large.read_called
+    assert files[1].contents == b"" and files[1].file_size == 20
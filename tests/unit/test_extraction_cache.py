@@ -0,0 +1,65 @@
+import pytest
+
+from app.ai.workflows.extraction_workflow import EXTRACTION_FAILED_NOTE
+from app.domains.extraction import service
+from app.domains.extraction.cache import ExtractionResultCache, extraction_version
+
+
+def _no_db():
+    raise RuntimeError("database unavailable")
+
+
+def _cache(**kwargs):
+    return ExtractionResultCache(version="v1", session_factory=_no_db, **kwargs)
+
+
+def test_version_depends_on_salt():
+    assert extraction_version("1") == extraction_version("1")
+    assert extraction_version("1") != extraction_version("2")
+
+
+@pytest.mark.extraction
+@pytest.mark.asyncio
+async def test_memory_lru_serves_copies_and_evicts_oldest():
+    cache = _cache(max_entries=2)
+
+    await cache.put("a", {"category": {"main": "top"}})
+    await cache.put("b", {"category": {"main": "bottom"}})
+    first = await cache.get("a")
+    first["category"]["main"] = "mutated"
+    await cache.put("c", {"category": {"main": "outer"}})
+
+    assert (await cache.get("a")) == {"category": {"main": "top"}}
+    assert await cache.get("b") is None  # a를 최근 조회했으므로 b가 제거됨
+    stats = cache.stats()
+    assert stats["memory_hits"] == 2 and stats["misses"] == 1
+    assert stats["errors"] == 4  # DB 저장 3회 + 조회 1회 실패는 로그만 남김
+
+
+@pytest.mark.extraction
+@pytest.mark.asyncio
+async def test_failed_extraction_is_not_cached():
+    cache = _cache()
+
+    await cache.put("a", {"meta": {"notes": EXTRACTION_FAILED_NOTE}})
+
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.extraction
+@pytest.mark.asyncio
+async def test_extractor_calls_llm_once_per_image(monkeypatch):
+    calls = []
+
+    async def fake_extract(image_bytes, retry_on_schema_fail=True):
+        calls.append(image_bytes)
+        return {"category": {"main": "top"}, "meta": {"notes": None}}
+
+    monkeypatch.setattr(service, "extract_attributes", fake_extract)
+    extractor = service.AttributeExtractor(cache=_cache())
+
+    first = await extractor.extract(b"same image")
+    second = await extractor.extract(b"same image")
+
+    assert first == second and len(calls) == 1
+    assert extractor.get_metrics()["result_cache"]["hit_ratio"] == 0.5
@@ -0,0 +1,73 @@
+import pytest
+
+from app.domains.weather.client import KMAWeatherClient
+from tests.load.fake_kma import FakeKMAConfig, FakeKMAServer
+from tests.load.weather_load import percentile
+
+
+async def _fetch(server, **config):
+    for key, value in config.items():
+        setattr(server.config, key, value)
+    client = KMAWeatherClient(base_url=server.url)
+    try:
+        return await client.fetch_daily_forecast("20260123", "0200", 60, 127, 300)
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.weather
+async def test_client_parses_fake_kma_forecast():
+    async with FakeKMAServer(FakeKMAConfig(latency_ms=0, jitter_ms=0)) as server:
+        forecast = await _fetch(server)
+
+        assert forecast is not None
+        assert forecast.min_temp is not None and forecast.max_temp is not None
+        assert server.stats()["ok"] == 1
+        assert server.stats()["distinct_cells"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.weather
+@pytest.mark.parametrize(
+    "config, outcome",
+    [
+        ({"http_error_rate": 1.0}, "http_error"),
+        ({"result_error_rate": 1.0}, "result_error"),
+    ],
+)
+async def test_client_returns_none_on_fake_kma_failures(config, outcome):
+    async with FakeKMAServer(FakeKMAConfig(latency_ms=0, jitter_ms=0)) as server:
+        assert await _fetch(server, **config) is None
+        assert server.stats()[outcome] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.weather
+async def test_client_rejects_empty_or_summary_less_forecasts():
+    async with FakeKMAServer(FakeKMAConfig(latency_ms=0, jitter_ms=0)) as server:
+        client = KMAWeatherClient(base_url=server.url)
+        try:
+            # 0행: resultCode는 "00"이지만 item 없음
+            empty = await client.fetch_daily_forecast("20260123", "0200", 60, 127, 0)
+            assert empty is None
+            # 03시 몇 개 item만: TMN/TMX 없음
+            partial = await client.fetch_daily_forecast("20260123", "0200", 60, 127, 5)
+            assert partial is not None and not partial.has_daily_summary
+            assert (
+                await client.fetch_daily_forecast(
+                    "20260123", "0200", 60, 127, 5, require_summary=True
+                )
+                is None
+            )
+        finally:
+            await client.close()
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([], 99) == 0.0
@@ -0,0 +1,82 @@
+from types import SimpleNamespace
+
+import pytest
+from azure.core.exceptions import ResourceNotFoundError
+
+from app.batch import wardrobe as backfill
+from app.domains.wardrobe.service import wardrobe_manager
+
+URL = "https://acct.blob.core.windows.net/images/users/u1/20260123/a.jpg"
+
+
+def _progress():
+    return {"updated": 0, "missing": 0, "failed": 0, "failed_ids": []}
+
+
+@pytest.mark.wardrobe
+def test_sidecar_values_are_merged_over_features(monkeypatch):
+    monkeypatch.setattr(
+        wardrobe_manager,
+        "load_sidecar_attributes",
+        lambda path: {"color": {"primary": "blue"}, "pattern": "solid"},
+    )
+    features = {"color": "red", "fit": "slim"}
+    item = SimpleNamespace(id=1, image_path=URL, features=features)
+    progress = _progress()
+
+    backfill._backfill_item(item, progress)
+
+    assert item.features == {
+        "color": {"primary": "blue"},
+        "pattern": "solid",
+        "fit": "slim",
+    }
+    assert progress["updated"] == 1
+
+
+@pytest.mark.wardrobe
+def test_missing_and_failed_sidecars_are_counted(monkeypatch):
+    def load(path):
+        if path.endswith("b.jpg"):
+            raise RuntimeError("timeout")
+        return None
+
+    monkeypatch.setattr(wardrobe_manager, "load_sidecar_attributes", load)
+    progress = _progress()
+
+    failing = URL.replace("a.jpg", "b.jpg")
+    backfill._backfill_item(
+        SimpleNamespace(id=1, image_path=URL, features=None), progress
+    )
+    backfill._backfill_item(
+        SimpleNamespace(id=2, image_path=failing, features=None), progress
+    )
+
+    assert progress["missing"] == 1
+    assert progress["failed"] == 1 and progress["failed_ids"] == [2]
+
+
+@pytest.mark.wardrobe
+def test_load_sidecar_reads_json_next_to_image(monkeypatch):
+    requested = []
+
+    def download_bytes_sync(name):
+        requested.append(name)
+        if name.endswith("missing.json"):
+            raise ResourceNotFoundError("not found")
+        return b'{"pattern": "solid"}'
+
+    monkeypatch.setattr(
+        wardrobe_manager,
+        "storage",
+        SimpleNamespace(enabled=True, download_bytes_sync=download_bytes_sync),
+    )
+    monkeypatch.setattr(wardrobe_manager, "container_name", "images")
+
+    assert wardrobe_manager.load_sidecar_attributes(URL) == {"pattern": "solid"}
+    assert requested == ["users/u1/20260123/a.json"]
+    missing = URL.replace("a.jpg", "missing.jpg")
+    assert wardrobe_manager.load_sidecar_attributes(missing) is None
+    # 다른 컨테이너의 이미지는 사이드카 대상이 아님
+    other = URL.replace("/images/", "/other/")
+    assert wardrobe_manager.load_sidecar_attributes(other) is None
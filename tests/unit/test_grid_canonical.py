@@ -0,0 +1,40 @@
+import pytest
+
+from app.domains.weather.canonical import GridCanonicalizer
+from app.domains.weather.grid import latlon_to_grid
+
+# 서울 강남구 압구정동 / 삼성동 (원 격자는 서로 다름)
+APGUJEONG = (37.5270, 127.0400)
+SAMSEONG = (37.5088, 127.0631)
+
+
+@pytest.mark.weather
+def test_region_policy_collapses_nearby_points_into_one_cell():
+    canon = GridCanonicalizer(policy="region")
+
+    a = canon.canonicalize(*APGUJEONG)
+    b = canon.canonicalize(*SAMSEONG)
+
+    assert latlon_to_grid(*APGUJEONG) != latlon_to_grid(*SAMSEONG)
+    assert (a.nx, a.ny) == (b.nx, b.ny)
+    assert a.region == "Seoul Gangnam-gu"
+    stats = canon.stats()
+    assert stats["distinct_cells_today"] == 1
+    assert stats["cell_reuse_ratio"] == 0.5
+
+
+@pytest.mark.weather
+def test_exact_and_coarse_policies():
+    exact = GridCanonicalizer(policy="exact").canonicalize(*APGUJEONG)
+    assert (exact.nx, exact.ny) == latlon_to_grid(*APGUJEONG)
+
+    coarse = GridCanonicalizer(policy="coarse", coarse_factor=3).canonicalize(
+        *APGUJEONG
+    )
+    assert coarse.nx % 3 == 1 and coarse.ny % 3 == 1
+    assert abs(coarse.nx - exact.nx) <= 1 and abs(coarse.ny - exact.ny) <= 1
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        GridCanonicalizer(policy="nearest")
@@ -0,0 +1,25 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.domains.weather.demand import GridDemandTracker
+
+
+@pytest.mark.weather
+def test_demand_tracker_aggregates_requests_and_decays_on_upsert():
+    tracker = GridDemandTracker(half_life_hours=24, flush_interval=60)
+    tracker.record(60, 127, "Seoul Jongno-gu")
+    tracker.record(60, 127)
+    tracker.record(98, 76, "Busan Jung-gu")
+
+    assert tracker._pending == {
+        (60, 127): [2, "Seoul Jongno-gu"],
+        (98, 76): [1, "Busan Jung-gu"],
+    }
+
+    rows = [{"nx": 60, "ny": 127, "region": None, "score": 2.0}]
+    sql = str(
+        tracker._upsert_statement(rows).compile(dialect=postgresql.dialect())
+    )
+    assert "ON CONFLICT (nx, ny) DO UPDATE" in sql
+    assert "weather_grid_demand.score * power(" in sql
+    assert "+ excluded.score" in sql
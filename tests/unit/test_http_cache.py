@@ -0,0 +1,65 @@
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.utils.http_cache import ConditionalGet, conditional_get, make_etag
+
+UPDATED_AT = datetime(2026, 1, 23, 2, 16, 30, 123456, tzinfo=timezone.utc)
+ETAG = make_etag("20260123", 60, 127, UPDATED_AT)
+
+
+def _client():
+    app = FastAPI()
+
+    @app.get("/summary")
+    async def summary(http_cache: ConditionalGet = Depends(conditional_get)):
+        if http_cache.prepare(ETAG, UPDATED_AT, max_age=600):
+            return http_cache.not_modified()
+        return {"min_temp": -5.0}
+
+    return TestClient(app)
+
+
+def test_make_etag_is_weak_and_stable():
+    assert ETAG.startswith('W/"')
+    assert ETAG == make_etag("20260123", 60, 127, UPDATED_AT)
+    assert ETAG != make_etag("20260123", 60, 127, None)
+
+
+def test_first_request_gets_validators_and_max_age():
+    response = _client().get("/summary")
+
+    assert response.status_code == 200
+    assert response.headers["etag"] == ETAG
+    assert response.headers["cache-control"] == "public, max-age=600"
+    assert response.headers["last-modified"] == "Fri, 23 Jan 2026 02:16:30 GMT"
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"If-None-Match": ETAG},
+        {"If-None-Match": f'"other", {ETAG[2:]}'},  # 약한 비교
+        {"If-Modified-Since": "Fri, 23 Jan 2026 02:16:30 GMT"},
+    ],
+)
+def test_matching_validator_returns_304_with_headers(headers):
+    response = _client().get("/summary", headers=headers)
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == ETAG
+
+
+def test_if_none_match_takes_precedence_over_if_modified_since():
+    response = _client().get(
+        "/summary",
+        headers={
+            "If-None-Match": 'W/"stale"',
+            "If-Modified-Since": "Fri, 23 Jan 2026 03:00:00 GMT",
+        },
+    )
+
+    assert response.status_code == 200
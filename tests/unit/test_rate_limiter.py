@@ -0,0 +1,30 @@
+import asyncio
+import time
+
+import pytest
+
+from app.utils.rate_limiter import RateLimiter
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_caps_rate_and_concurrency():
+    limiter = RateLimiter(rate=50, burst=5, max_concurrency=3)
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        async with limiter:
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    start = time.monotonic()
+    await asyncio.gather(*(call() for _ in range(15)))
+    elapsed = time.monotonic() - start
+
+    # 버스트 5개 이후 나머지 10개는 초당 50개 -> 최소 약 0.2초
+    assert elapsed >= 0.18
+    assert peak <= 3
+    stats = limiter.stats()
+    assert stats["acquired"] == 15
+    assert stats["throttled"] >= 10
+    assert stats["in_flight"] == 0
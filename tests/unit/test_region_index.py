@@ -0,0 +1,34 @@
+import random
+
+import pytest
+
+from app.core.region_index import get_region_index, haversine_km
+from app.core.regions import get_nearest_region
+
+
+@pytest.mark.weather
+def test_index_loads_packaged_region_table():
+    index = get_region_index()
+    assert len(index.regions) >= 250
+    names = {r.name for r in index.regions}
+    assert "Seoul Gangnam-gu" in names
+
+
+@pytest.mark.weather
+def test_kdtree_matches_brute_force():
+    index = get_region_index()
+    rng = random.Random(0)
+    for _ in range(500):
+        lat, lon = rng.uniform(33.0, 38.5), rng.uniform(124.8, 130.0)
+        region, dist = index.nearest(lat, lon)
+        best = min(haversine_km(lat, lon, r.lat, r.lon) for r in index.regions)
+        # 등장방형 근사와 haversine의 차이는 거리의 1% 이내
+        assert dist == pytest.approx(best, rel=0.01, abs=0.1)
+
+
+@pytest.mark.weather
+def test_border_point_resolves_to_actual_nearest_district():
+    # 김포공항: 단순 위경도 거리로는 Incheon 대표점이 더 가깝게 계산되던 위치
+    name, data = get_nearest_region(37.5586, 126.7944)
+    assert name == "Seoul Gangseo-gu"
+    assert {"nx", "ny", "lat", "lon"} <= data.keys()
@@ -0,0 +1,100 @@
+import base64
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qs
+
+import pytest
+
+from app.utils import sas_signer as sas_signer_module
+from app.utils.sas_signer import SasSigner, split_blob_url, window_start
+
+ACCOUNT_KEY = base64.b64encode(b"0" * 64).decode()
+URL = "https://acct.blob.core.windows.net/images/users/u1/20260123/a.jpg"
+
+
+def _signer(**kwargs):
+    return SasSigner(account_name="acct", account_key=ACCOUNT_KEY, **kwargs)
+
+
+def test_split_blob_url():
+    assert split_blob_url(URL) == ("images", "users/u1/20260123/a.jpg")
+    assert split_blob_url("https://example.com/a.jpg") is None
+
+
+def test_blob_sas_is_cached_until_refresh_margin():
+    signer = _signer()
+
+    first = signer.sign_url(URL)
+    second = signer.sign_url(URL)
+
+    assert first == second and first.startswith(URL + "?")
+    assert "sr=b" in first
+    assert signer.stats()["signed"] == 1 and signer.stats()["hits"] == 1
+
+
+def test_token_inside_refresh_margin_is_resigned():
+    signer = _signer(ttl_minutes=5, refresh_margin_minutes=5)
+
+    signer.sign_url(URL)
+    signer.sign_url(URL)
+
+    assert signer.stats()["signed"] == 2
+
+
+def test_feed_urls_share_one_container_sas():
+    signer = _signer()
+    other = URL.replace("a.jpg", "b.jpg")
+
+    first, second = signer.sign_feed_url(URL), signer.sign_feed_url(other)
+
+    assert first.split("?")[1] == second.split("?")[1]
+    assert "sr=c" in first
+    assert signer.stats()["signed"] == 1
+
+
+def test_unsigned_when_not_configured_or_not_blob_url():
+    assert SasSigner(account_name="", account_key="").sign_url(URL) == URL
+    assert _signer().sign_url("https://example.com/a.jpg") == "https://example.com/a.jpg"
+    assert _signer().sign_url(URL + "?sv=x") == URL + "?sv=x"
+
+
+def test_aligned_windows_give_identical_urls_across_signers():
+    first = _signer(aligned=True).sign_url(URL)
+    second = _signer(aligned=True).sign_feed_url(URL)
+
+    assert first == _signer(aligned=True).sign_url(URL)
+    assert second == _signer(aligned=True).sign_feed_url(URL)
+
+
+def test_window_start_is_aligned():
+    window = timedelta(minutes=60)
+    now = datetime(2026, 1, 23, 10, 42, 7, tzinfo=timezone.utc)
+
+    assert window_start(now, window) == datetime(2026, 1, 23, 10, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("aligned", [False, True])
+def test_every_returned_sas_keeps_the_refresh_margin(monkeypatch, aligned):
+    clock = [datetime(2026, 1, 23, 9, 58, tzinfo=timezone.utc)]
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock[0]
+
+    monkeypatch.setattr(sas_signer_module, "datetime", FrozenDatetime)
+    signer = _signer(
+        ttl_minutes=60,
+        feed_ttl_minutes=60,
+        refresh_margin_minutes=15,
+        aligned=aligned,
+    )
+
+    for _ in range(0, 180, 7):
+        for url in (signer.sign_url(URL), signer.sign_feed_url(URL)):
+            expiry = datetime.strptime(
+                parse_qs(url.split("?", 1)[1])["se"][0], "%Y-%m-%dT%H:%M:%SZ"
+            ).replace(tzinfo=timezone.utc)
+            assert expiry - clock[0] >= timedelta(minutes=15)
+        clock[0] += timedelta(minutes=7)
+
+    assert signer.stats()["hits"] > 0
@@ -0,0 +1,48 @@
+import asyncio
+
+from app.utils.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "weather"
+
+    async def main():
+        return await asyncio.gather(
+            *(flight.do(("20260123", 60, 127), fetch) for _ in range(10))
+        )
+
+    results = asyncio.run(main())
+
+    assert results == ["weather"] * 10
+    assert calls == 1
+    assert flight.stats() == {"in_flight": 0, "executions": 1, "coalesced": 9}
+
+
+def test_errors_propagate_to_waiters_and_are_not_remembered():
+    flight = SingleFlight()
+
+    async def boom():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("KMA down")
+
+    async def main():
+        return await asyncio.gather(
+            flight.do("key", boom), flight.do("key", boom), return_exceptions=True
+        )
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def ok():
+        return 1
+
+    # 실패 후에는 새 호출이 다시 실행되어야 함
+    assert asyncio.run(flight.do("key", ok)) == 1
+    assert flight.stats()["executions"] == 2
@@ -0,0 +1,56 @@
+import io
+
+import pytest
+from PIL import Image
+
+from app.utils.thumbnails import ThumbnailPool, pick_thumbnail, render_thumbnails
+
+
+def _jpeg(width, height):
+    buf = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 30, 30)).save(buf, format="JPEG")
+    return buf.getvalue()
+
+
+@pytest.mark.wardrobe
+def test_render_thumbnails_resizes_to_each_width_as_webp():
+    thumbs = render_thumbnails(_jpeg(2000, 1000), (160, 480, 960), 80)
+
+    assert sorted(thumbs) == [160, 480, 960]
+    for width, data in thumbs.items():
+        with Image.open(io.BytesIO(data)) as img:
+            assert img.format == "WEBP"
+            assert img.size == (width, width // 2)
+
+
+@pytest.mark.wardrobe
+def test_render_thumbnails_never_upscales():
+    assert sorted(render_thumbnails(_jpeg(600, 400), (160, 480, 960), 80)) == [
+        160,
+        480,
+    ]
+
+    small = render_thumbnails(_jpeg(100, 100), (160, 480), 80)
+    assert list(small) == [100]
+
+
+@pytest.mark.wardrobe
+def test_pick_thumbnail():
+    thumbs = {"160": "a", "480": "b", "960": "c"}
+
+    assert pick_thumbnail(thumbs, 300) == "b"
+    assert pick_thumbnail(thumbs, 480) == "b"
+    assert pick_thumbnail(thumbs, 2000) == "c"
+    assert pick_thumbnail(None, 480) is None
+
+
+@pytest.mark.wardrobe
+@pytest.mark.asyncio
+async def test_pool_returns_empty_on_invalid_image():
+    pool = ThumbnailPool(widths=(160,), quality=80, max_workers=1)
+    try:
+        assert await pool.render(b"not an image") == {}
+        assert pool.failures == 1
+        assert len(await pool.render(_jpeg(400, 300))) == 1
+    finally:
+        pool.shutdown()
@@ -0,0 +1,48 @@
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.domains.wardrobe.cache import ItemCountCache
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+@pytest.mark.wardrobe
+def test_cursor_round_trip_is_opaque_and_url_safe():
+    cursor = encode_cursor(id=123456)
+
+    assert "=" not in cursor and "+" not in cursor and "/" not in cursor
+    assert decode_cursor(cursor) == {"id": 123456}
+
+
+@pytest.mark.wardrobe
+@pytest.mark.parametrize("cursor", ["not-base64!", encode_cursor(id=1)[:-3], "WzFd"])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(cursor)
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.wardrobe
+def test_count_cache_invalidates_all_categories_of_user():
+    cache = ItemCountCache(ttl=60)
+    user, other = uuid4(), uuid4()
+    cache.put(user, None, 10)
+    cache.put(user, "top", 4)
+    cache.put(other, None, 7)
+
+    cache.invalidate_user(user)
+
+    assert cache.get(user, None) is None
+    assert cache.get(user, "top") is None
+    assert cache.get(other, None) == 7
+
+
+@pytest.mark.wardrobe
+def test_count_cache_expires():
+    cache = ItemCountCache(ttl=0)
+    user = uuid4()
+    cache.put(user, None, 3)
+
+    assert cache.get(user, None) is None
+    assert cache.stats()["misses"] == 1
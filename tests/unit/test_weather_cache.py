@@ -0,0 +1,109 @@
+from datetime import datetime, timedelta, timezone
+
+from app.domains.weather.cache import (
+    WeatherSummaryCache,
+    next_cache_expiry,
+    next_kst_midnight,
+)
+from app.domains.weather.model import DailyWeather
+
+
+def _weather(**overrides):
+    values = dict(
+        base_date="20260123",
+        base_time="0200",
+        nx=60,
+        ny=127,
+        region="Seoul",
+        min_temp=-5.0,
+        max_temp=3.0,
+        rain_type=0,
+    )
+    values.update(overrides)
+    return DailyWeather(**values)
+
+
+def test_cache_returns_fresh_copy_with_jit_fields():
+    cache = WeatherSummaryCache()
+    weather = _weather()
+    weather.current_rain_type = 1
+    cache.put(weather)
+
+    first = cache.get("20260123", 60, 127)
+    second = cache.get("20260123", 60, 127)
+
+    assert first is not second
+    assert first.min_temp == -5.0 and first.max_temp == 3.0
+    assert first.current_rain_type == 1
+    assert cache.stats()["hits"] == 2
+
+
+def test_cache_never_stores_failures_and_misses_other_keys():
+    cache = WeatherSummaryCache()
+    cache.put(None)
+
+    assert cache.get("20260123", 60, 127) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_cache_invalidate():
+    cache = WeatherSummaryCache()
+    cache.put(_weather())
+    cache.invalidate("20260123", 60, 127)
+
+    assert cache.get("20260123", 60, 127) is None
+
+
+def test_hourly_arrays_live_and_die_with_the_summary_entry():
+    cache = WeatherSummaryCache()
+    hourly = {"TMP": [1.0] * 24}
+
+    cache.put_hourly("20260123", 60, 127, hourly)
+    assert cache.get_hourly("20260123", 60, 127) is None  # 요약 없이 저장 안 함
+
+    cache.put(_weather())
+    assert cache.get_hourly("20260123", 60, 127) is None  # 아직 조회 전
+    cache.put_hourly("20260123", 60, 127, hourly)
+    assert cache.get_hourly("20260123", 60, 127) is hourly
+
+    cache.put(_weather(max_temp=4.0))
+    assert cache.get_hourly("20260123", 60, 127) is None
+
+    cache.put_hourly("20260123", 60, 127, {})
+    assert cache.get_hourly("20260123", 60, 127) == {}
+    cache.invalidate("20260123", 60, 127)
+    assert cache.get_hourly("20260123", 60, 127) is None
+
+
+def test_next_kst_midnight():
+    # 2026-01-23 14:59 UTC == 23:59 KST -> 다음 KST 자정은 15:00 UTC
+    now = datetime(2026, 1, 23, 14, 59, tzinfo=timezone.utc)
+    assert next_kst_midnight(now) == datetime(2026, 1, 23, 15, 0, tzinfo=timezone.utc)
+
+
+def test_cache_serves_stale_forecast_under_today_key_with_short_ttl():
+    cache = WeatherSummaryCache()
+    stale = _weather(base_date="20260122")
+    stale.is_stale = True
+    cache.put(stale, key_date="20260123", ttl=300)
+
+    served = cache.get("20260123", 60, 127)
+    assert served.is_stale is True
+    assert served.base_date == "20260122"
+    assert cache._entries[("20260123", 60, 127)][1] <= datetime.now(
+        timezone.utc
+    ) + timedelta(seconds=300)
+
+    # 갱신된 오늘 예보가 stale 항목을 대체
+    cache.put(_weather())
+    assert cache.get("20260123", 60, 127).is_stale is False
+
+
+def test_next_cache_expiry_aligns_to_intraday_refresh_slots():
+    # 10:00 KST -> 다음 재수집 슬롯은 11:20 KST (02:20 UTC)
+    now = datetime(2026, 1, 23, 1, 0, tzinfo=timezone.utc)
+    assert next_cache_expiry(now) == datetime(2026, 1, 23, 2, 20, tzinfo=timezone.utc)
+    # 21:00 KST -> 남은 슬롯이 없으므로 자정
+    late = datetime(2026, 1, 23, 12, 0, tzinfo=timezone.utc)
+    assert next_cache_expiry(late) == next_kst_midnight(late)
+    assert next_cache_expiry(now, align_to_refresh=False) == next_kst_midnight(now)
@@ -0,0 +1,41 @@
+import pytest
+
+from app.domains.weather.forecast import HOURS_PER_DAY, parse_forecast_items
+
+
+def _item(category, value, date="20260123", time="0600"):
+    return {
+        "category": category,
+        "fcstValue": value,
+        "fcstDate": date,
+        "fcstTime": time,
+    }
+
+
+@pytest.mark.weather
+def test_parse_forecast_items_builds_daily_summary_and_hourly_arrays():
+    items = [
+        _item("TMN", "-5.0", time="0600"),
+        _item("TMP", "-4", time="0600"),
+        _item("POP", "20", time="0600"),
+        _item("PTY", "0", time="0600"),
+        _item("TMX", "3.0", time="1500"),
+        _item("TMP", "2.5", time="1500"),
+        _item("PTY", "1", time="1500"),
+        # 다음 날 값은 시간별 배열에 들어가지 않음
+        _item("TMP", "9", date="20260124", time="0000"),
+    ]
+
+    forecast = parse_forecast_items(items, "20260123", now_hour="1500")
+
+    assert forecast.min_temp == -5.0
+    assert forecast.max_temp == 3.0
+    assert forecast.rain_type == 1
+    assert forecast.current_rain_type == 1
+
+    tmp = forecast.hourly["TMP"]
+    assert len(tmp) == HOURS_PER_DAY
+    assert tmp[6] == -4.0 and tmp[15] == 2.5
+    assert tmp[0] is None
+    assert forecast.hourly["POP"][6] == 20
+    assert forecast.hourly["SKY"] == [None] * HOURS_PER_DAY
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from app.core.regions import KOREA_REGIONS
+from app.domains.weather.grid import lcc_grid, latlon_to_grid, grid_to_latlon
+from app.domains.weather.utils import dfs_xy_conv
+
+
+@pytest.mark.weather
+def test_scalar_matches_legacy_conversion():
+    rng = np.random.default_rng(0)
+    for lat, lon in zip(rng.uniform(33.0, 39.0, 2000), rng.uniform(124.5, 131.5, 2000)):
+        legacy = dfs_xy_conv("toGRID", lat, lon)
+        assert latlon_to_grid(lat, lon) == (legacy["x"], legacy["y"])
+
+    for x in range(1, 150, 7):
+        for y in range(1, 254, 11):
+            legacy = dfs_xy_conv("toLL", x, y)
+            assert grid_to_latlon(x, y) == (legacy["lat"], legacy["lng"])
+
+
+@pytest.mark.weather
+def test_batch_matches_scalar():
+    rng = np.random.default_rng(1)
+    lats = rng.uniform(33.0, 39.0, 5000)
+    lons = rng.uniform(124.5, 131.5, 5000)
+
+    xs, ys = lcc_grid.to_grid_batch(lats, lons)
+    expected = [latlon_to_grid(lat, lon) for lat, lon in zip(lats, lons)]
+    assert list(zip(xs.tolist(), ys.tolist())) == expected
+
+    back_lats, back_lons = lcc_grid.to_latlon_batch(xs, ys)
+    for x, y, blat, blon in zip(xs, ys, back_lats, back_lons):
+        lat, lon = grid_to_latlon(x, y)
+        assert blat == pytest.approx(lat, abs=1e-12)
+        assert blon == pytest.approx(lon, abs=1e-12)
+
+
+@pytest.mark.weather
+def test_seoul_city_hall_grid():
+    seoul = KOREA_REGIONS["Seoul"]
+    assert latlon_to_grid(seoul["lat"], seoul["lon"]) == (seoul["nx"], seoul["ny"])
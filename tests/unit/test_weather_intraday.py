@@ -0,0 +1,182 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.domains.weather import service as service_module
+from app.domains.weather.forecast import DailyForecast, latest_base_time, merge_hourly
+from app.domains.weather.model import DailyWeather, DailyWeatherHourly
+from app.domains.weather.service import WeatherService
+
+TODAY = "20260123"
+# 14:20 KST -> 1400 발표분 적용
+NOW = datetime(2026, 1, 23, 5, 20, tzinfo=timezone.utc)
+
+
+def _hours(**values):
+    hours = [None] * 24
+    for hour, value in values.items():
+        hours[int(hour[1:])] = value
+    return hours
+
+
+@pytest.mark.weather
+def test_latest_base_time_and_merge():
+    kst = NOW.astimezone(service_module.KST)
+    assert latest_base_time(kst) == "1400"
+    assert latest_base_time(kst.replace(hour=2, minute=5)) is None
+
+    merged = merge_hourly(
+        {"TMP": _hours(h9=1.0, h15=5.0)}, {"TMP": _hours(h15=3.0, h16=2.0)}
+    )
+    assert merged["TMP"] == _hours(h9=1.0, h15=3.0, h16=2.0)
+    assert merged["PTY"] == [None] * 24
+
+
+@pytest.mark.weather
+@pytest.mark.asyncio
+async def test_refresh_intraday_writes_only_changed_cells(monkeypatch):
+    def daily(nx):
+        return DailyWeather(
+            base_date=TODAY,
+            base_time="0200",
+            nx=nx,
+            ny=127,
+            region=f"R{nx}",
+            min_temp=-5.0,
+            max_temp=3.0,
+            rain_type=0,
+        )
+
+    def hourly(nx):
+        # REAL 컬럼에서 읽은 float32 값 (2.9 -> 2.9000000953674316)
+        return DailyWeatherHourly(
+            base_date=TODAY,
+            base_time="0200",
+            nx=nx,
+            ny=127,
+            tmp=_hours(h15=2.9000000953674316),
+            pty=_hours(h15=0),
+        )
+
+    db = MagicMock()
+    rows = {DailyWeather: [daily(1), daily(2)], DailyWeatherHourly: [hourly(1), hourly(2)]}
+    db.query.side_effect = lambda model: MagicMock(
+        filter_by=lambda **_: MagicMock(all=lambda: rows[model])
+    )
+
+    async def fetch(base_date, base_time, nx, ny, rows, target_date=None):
+        assert base_time == "1400"
+        forecast = DailyForecast()
+        forecast.hourly["TMP"] = _hours(h15=2.9)
+        # nx=2 격자만 15시에 비 예보로 바뀜
+        forecast.hourly["PTY"] = _hours(h15=1 if nx == 2 else 0)
+        return forecast
+
+    upserts = []
+    monkeypatch.setattr(
+        service_module,
+        "bulk_upsert",
+        lambda db, model, rows, key, **kw: upserts.append((model, rows)),
+    )
+
+    svc = WeatherService()
+    svc.client.fetch_daily_forecast = fetch
+    svc.cache.put(daily(2))
+
+    result = await svc.refresh_intraday(db, now=NOW)
+
+    assert result["changed_daily"] == 1 and result["changed_hourly"] == 1
+    assert result["unchanged"] == 1
+    (daily_model, daily_rows), (hourly_model, hourly_rows) = upserts
+    assert [r["nx"] for r in daily_rows] == [2]
+    assert daily_rows[0]["rain_type"] == 1 and daily_rows[0]["base_time"] == "1400"
+    assert [r["nx"] for r in hourly_rows] == [2]
+    # 바뀐 격자의 메모리 캐시는 무효화
+    assert svc.cache.get(TODAY, 2, 127) is None
+
+
+@pytest.mark.weather
+def test_kst_today_is_independent_of_host_timezone():
+    # 17:16 UTC = 다음 날 02:16 KST (일 배치 타이머 시각)
+    batch_fire = datetime(2026, 1, 22, 17, 16, tzinfo=timezone.utc)
+
+    assert service_module.kst_today(batch_fire) == TODAY
+    assert service_module.kst_now(batch_fire).hour == 2
+    assert service_module.kst_today(NOW) == TODAY
+
+
+@pytest.mark.weather
+@pytest.mark.asyncio
+async def test_weather_info_reads_hourly_row_once_per_cached_summary(monkeypatch):
+    service = WeatherService()
+    today = service_module.kst_today()
+    summary = DailyWeather(
+        base_date=today, base_time="0200", nx=60, ny=127, min_temp=-2.0, max_temp=8.0
+    )
+    service.cache.put(summary)
+
+    async def cached_summary(db, nx, ny, region=None):
+        return service.cache.get(today, nx, ny), "Memory Cached"
+
+    rows = []
+
+    def hourly_row(db, nx, ny, base_date=None):
+        rows.append(base_date)
+        return DailyWeatherHourly(
+            base_date=today, nx=nx, ny=ny, tmp=_hours(h8=1.5, h19=6.0)
+        )
+
+    monkeypatch.setattr(service, "get_daily_weather_summary", cached_summary)
+    monkeypatch.setattr(service, "get_hourly_forecast", hourly_row)
+    monkeypatch.setattr(
+        service.canonicalizer,
+        "canonicalize",
+        lambda lat, lon: MagicMock(nx=60, ny=127, region="Seoul"),
+    )
+
+    first = await service.get_weather_info(MagicMock(), 37.5, 127.0)
+    second = await service.get_weather_info(MagicMock(), 37.5, 127.0)
+
+    assert rows == [today]
+    assert first["temp_morning"] == second["temp_morning"]
+    assert first["temp_evening"] == 6.0
+
+
+@pytest.mark.weather
+@pytest.mark.asyncio
+async def test_fetch_and_store_returns_stored_row_when_insert_loses(monkeypatch):
+    stored_at = datetime(2026, 1, 22, 17, 16, tzinfo=timezone.utc)
+    stored = DailyWeather(
+        base_date=TODAY,
+        base_time="0200",
+        nx=60,
+        ny=127,
+        region="Seoul",
+        min_temp=-4.0,
+        max_temp=5.0,
+        rain_type=0,
+        updated_at=stored_at,
+    )
+    db = MagicMock()
+    db.query.return_value.filter_by.return_value.first.return_value = stored
+
+    async def fetch(base_date, base_time, nx, ny, rows, require_summary=False):
+        return DailyForecast(min_temp=-3.0, max_temp=6.0, current_rain_type=1)
+
+    # 다른 인스턴스가 먼저 INSERT -> DO NOTHING (inserted=0)
+    monkeypatch.setattr(
+        service_module,
+        "bulk_upsert",
+        lambda db, model, rows, key, **kw: service_module.UpsertResult(),
+    )
+
+    svc = WeatherService()
+    svc.client.fetch_daily_forecast = fetch
+
+    weather, msg = await svc._fetch_and_store(db, TODAY, 60, 127, "Seoul")
+
+    assert weather is stored and "Already in DB" in msg
+    assert weather.updated_at == stored_at and weather.min_temp == -4.0
+    assert weather.current_rain_type == 1
+    assert svc.cache.get(TODAY, 60, 127).updated_at == stored_at
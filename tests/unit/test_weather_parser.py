@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from app.domains.weather.forecast import WANTED_CATEGORIES, parse_forecast_items
+from app.domains.weather.parser import parse_forecast_bytes
+from tests.benchmarks.bench_kma_parser import build_payload, dict_path
+
+
+@pytest.mark.weather
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 4096, 1 << 20])
+def test_streaming_parser_matches_dict_parser_across_chunk_boundaries(chunk_size):
+    data = build_payload(300)
+    chunks = [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+    parser = parse_forecast_bytes(chunks, "20260123", now_hour="1200")
+
+    assert parser.result_code == "00"
+    assert parser.result_msg == "NORMAL_SERVICE"
+    assert parser.forecast == dict_path(data)
+    # 12개 카테고리 중 필요한 것(TMP/WSD/SKY/PTY/POP/REH + TMN/TMX)만 보관
+    items = json.loads(data)["response"]["body"]["items"]["item"]
+    assert parser.items_kept == sum(i["category"] in WANTED_CATEGORIES for i in items)
+    assert parser.items_kept < len(items)
+
+
+@pytest.mark.weather
+def test_streaming_parser_reports_error_header():
+    data = (
+        b'{"response":{"header":{"resultCode":"03","resultMsg":"NO_DATA"}}}'
+    )
+
+    parser = parse_forecast_bytes([data], "20260123")
+
+    assert parser.result_code == "03"
+    assert parser.forecast == parse_forecast_items([], "20260123")
+
+
+@pytest.mark.weather
+@pytest.mark.parametrize("chunk_size", [7, 4096])
+def test_streaming_parser_does_not_depend_on_item_key_order(chunk_size):
+    data = build_payload(300)
+    payload = json.loads(data)
+    body = payload["response"]["body"]
+    # 같은 item을 키 순서만 뒤집어서 전송
+    body["items"]["item"] = [
+        dict(reversed(list(item.items()))) for item in body["items"]["item"]
+    ]
+    reordered = json.dumps(payload).encode()
+    chunks = [
+        reordered[i : i + chunk_size] for i in range(0, len(reordered), chunk_size)
+    ]
+
+    parser = parse_forecast_bytes(chunks, "20260123", now_hour="1200")
+
+    assert parser.items_kept > 0
+    assert parser.forecast == dict_path(data)
+    assert parser.forecast.has_daily_summary
+
+
+@pytest.mark.weather
+def test_streaming_parser_keeps_nothing_from_unrecognized_items():
+    data = (
+        b'{"response":{"header":{"resultCode":"00","resultMsg":"NORMAL_SERVICE"},'
+        b'"body":{"items":{"item":[{"cat":"TMN","date":"20260123","v":"-3"}]}}}}'
+    )
+
+    parser = parse_forecast_bytes([data], "20260123")
+
+    assert parser.result_code == "00"
+    assert parser.items_kept == 0
+    assert not parser.forecast.has_daily_summary